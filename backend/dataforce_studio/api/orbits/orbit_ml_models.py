@@ -1,13 +1,34 @@
-from fastapi import APIRouter, Request, status
+from pathlib import PurePosixPath
+from typing import Annotated
+from urllib.parse import quote
+
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 
 from dataforce_studio.handlers.ml_models import MLModelHandler
 from dataforce_studio.infra.endpoint_responses import endpoint_responses
+from dataforce_studio.infra.exceptions import InvalidMetricFilterError
+from dataforce_studio.schemas.base import Page
 from dataforce_studio.schemas.ml_models import (
+    CompleteMultipartUploadIn,
     CreateMLModelResponse,
+    MetricFilter,
     MLModel,
+    MLModelFileUrl,
     MLModelIn,
+    MLModelListFilters,
+    MLModelStatus,
+    MLModelSummary,
     MLModelUpdateIn,
+    MLModelWithUrl,
+    MultipartUpload,
+    MultipartUploadProgress,
+    SortOrder,
+    UploadPartsIn,
+    UploadPartUrl,
 )
+from dataforce_studio.settings import config
 
 ml_models_router = APIRouter(
     prefix="/{organization_id}/orbits/{orbit_id}/collections/{collection_id}/ml-models",
@@ -15,6 +36,31 @@ ml_models_router = APIRouter(
 )
 
 ml_model_handler = MLModelHandler()
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def ml_model_list_filters(
+    tags: Annotated[list[str] | None, Query()] = None,
+    statuses: Annotated[list[MLModelStatus] | None, Query(alias="status")] = None,
+    search: str | None = None,
+    metric: Annotated[list[str] | None, Query()] = None,
+    sort_metric: str | None = None,
+    order: SortOrder = SortOrder.DESC,
+) -> MLModelListFilters:
+    try:
+        metrics = [MetricFilter.parse(value) for value in metric or []]
+    except ValueError as error:
+        raise InvalidMetricFilterError(
+            "Metric filters must look like 'key:operator:value'"
+        ) from error
+    return MLModelListFilters(
+        tags=tags,
+        status=statuses,
+        search=search,
+        metrics=metrics,
+        sort_metric=sort_metric,
+        order=order,
+    )
 
 
 @ml_models_router.post(
@@ -37,6 +83,113 @@ async def create_ml_model(
     return {"model": created_model, "url": url}
 
 
+@ml_models_router.post(
+    "/multipart", responses=endpoint_responses, response_model=MultipartUpload
+)
+async def create_ml_model_multipart(
+    request: Request,
+    organization_id: int,
+    orbit_id: int,
+    collection_id: int,
+    model: MLModelIn,
+) -> MultipartUpload:
+    return await ml_model_handler.create_ml_model_multipart(
+        request.user.id,
+        organization_id,
+        orbit_id,
+        collection_id,
+        model,
+    )
+
+
+@ml_models_router.post(
+    "/{model_id}/multipart/parts",
+    responses=endpoint_responses,
+    response_model=list[UploadPartUrl],
+)
+async def get_ml_model_upload_part_urls(
+    request: Request,
+    organization_id: int,
+    orbit_id: int,
+    collection_id: int,
+    model_id: int,
+    parts: UploadPartsIn,
+) -> list[UploadPartUrl]:
+    return await ml_model_handler.get_upload_part_urls(
+        request.user.id,
+        organization_id,
+        orbit_id,
+        collection_id,
+        model_id,
+        parts.part_numbers,
+    )
+
+
+@ml_models_router.get(
+    "/{model_id}/multipart",
+    responses=endpoint_responses,
+    response_model=MultipartUploadProgress,
+)
+async def get_ml_model_upload_progress(
+    request: Request,
+    organization_id: int,
+    orbit_id: int,
+    collection_id: int,
+    model_id: int,
+) -> MultipartUploadProgress:
+    return await ml_model_handler.get_upload_progress(
+        request.user.id,
+        organization_id,
+        orbit_id,
+        collection_id,
+        model_id,
+    )
+
+
+@ml_models_router.post(
+    "/{model_id}/multipart/complete",
+    responses=endpoint_responses,
+    response_model=MLModel,
+)
+async def complete_ml_model_upload(
+    request: Request,
+    organization_id: int,
+    orbit_id: int,
+    collection_id: int,
+    model_id: int,
+    upload: CompleteMultipartUploadIn,
+) -> MLModel:
+    return await ml_model_handler.complete_multipart_upload(
+        request.user.id,
+        organization_id,
+        orbit_id,
+        collection_id,
+        model_id,
+        upload.parts,
+    )
+
+
+@ml_models_router.delete(
+    "/{model_id}/multipart",
+    responses=endpoint_responses,
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+async def abort_ml_model_upload(
+    request: Request,
+    organization_id: int,
+    orbit_id: int,
+    collection_id: int,
+    model_id: int,
+) -> None:
+    await ml_model_handler.abort_multipart_upload(
+        request.user.id,
+        organization_id,
+        orbit_id,
+        collection_id,
+        model_id,
+    )
+
+
 @ml_models_router.patch(
     "/{model_id}",
     responses=endpoint_responses,
@@ -67,15 +220,81 @@ async def update_ml_model(
 )
 async def get_ml_models(
     request: Request,
+    response: Response,
     organization_id: int,
     orbit_id: int,
     collection_id: int,
+    filters: Annotated[MLModelListFilters, Depends(ml_model_list_filters)],
+    cursor: str | None = None,
+    limit: Annotated[int | None, Query(ge=1, le=config.ML_MODELS_MAX_PAGE_SIZE)] = None,
 ) -> list[MLModel]:
-    return await ml_model_handler.get_collection_models(
+    page = await ml_model_handler.get_collection_models(
+        request.user.id,
+        organization_id,
+        orbit_id,
+        collection_id,
+        cursor,
+        limit,
+        filters,
+    )
+    if page.cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.cursor
+    return page.items
+
+
+@ml_models_router.get(
+    "/summaries",
+    responses=endpoint_responses,
+    response_model=Page[MLModelSummary],
+)
+async def get_ml_model_summaries(
+    request: Request,
+    organization_id: int,
+    orbit_id: int,
+    collection_id: int,
+    filters: Annotated[MLModelListFilters, Depends(ml_model_list_filters)],
+    cursor: str | None = None,
+    limit: Annotated[
+        int, Query(ge=1, le=config.ML_MODELS_MAX_PAGE_SIZE)
+    ] = config.ML_MODELS_PAGE_SIZE,
+    metric_keys: Annotated[list[str] | None, Query()] = None,
+) -> Page[MLModelSummary]:
+    return await ml_model_handler.get_collection_model_summaries(
+        request.user.id,
+        organization_id,
+        orbit_id,
+        collection_id,
+        cursor,
+        limit,
+        metric_keys,
+        filters,
+    )
+
+
+@ml_models_router.get(
+    "/download-urls",
+    responses=endpoint_responses,
+    response_model=Page[MLModelWithUrl],
+)
+async def get_ml_models_download_urls(
+    request: Request,
+    organization_id: int,
+    orbit_id: int,
+    collection_id: int,
+    model_ids: Annotated[list[int] | None, Query()] = None,
+    cursor: str | None = None,
+    limit: Annotated[
+        int, Query(ge=1, le=config.ML_MODELS_MAX_PAGE_SIZE)
+    ] = config.ML_MODELS_PAGE_SIZE,
+) -> Page[MLModelWithUrl]:
+    return await ml_model_handler.get_collection_models_with_urls(
         request.user.id,
         organization_id,
         orbit_id,
         collection_id,
+        model_ids,
+        cursor,
+        limit,
     )
 
 
@@ -97,6 +316,59 @@ async def get_ml_model_download_url(
     return {"url": url}
 
 
+@ml_models_router.get(
+    "/{model_id}/file-url",
+    responses=endpoint_responses,
+    response_model=MLModelFileUrl,
+)
+async def get_ml_model_file_url(
+    request: Request,
+    organization_id: int,
+    orbit_id: int,
+    collection_id: int,
+    model_id: int,
+    path: str,
+) -> MLModelFileUrl:
+    return await ml_model_handler.get_model_file_url(
+        request.user.id,
+        organization_id,
+        orbit_id,
+        collection_id,
+        model_id,
+        path,
+    )
+
+
+@ml_models_router.get("/{model_id}/file", responses=endpoint_responses)
+async def read_ml_model_file(
+    request: Request,
+    organization_id: int,
+    orbit_id: int,
+    collection_id: int,
+    model_id: int,
+    path: str,
+) -> StreamingResponse:
+    stream = await ml_model_handler.open_model_file(
+        request.user.id,
+        organization_id,
+        orbit_id,
+        collection_id,
+        model_id,
+        path,
+    )
+    file_name = quote(PurePosixPath(path).name)
+    return StreamingResponse(
+        stream.chunks,
+        media_type="application/octet-stream",
+        headers={
+            "Content-Length": str(stream.size),
+            "Content-Disposition": f"attachment; filename*=utf-8''{file_name}",
+            "X-Content-Type-Options": "nosniff",
+        },
+        background=BackgroundTask(stream.close),
+    )
+
+
 @ml_models_router.get("/{model_id}/delete-url", responses=endpoint_responses)
 async def get_ml_model_delete_url(
     request: Request,
@@ -0,0 +1,28 @@
+from fastapi import APIRouter, Depends
+
+from dataforce_studio.handlers.stats import StatsHandler
+from dataforce_studio.infra.dependencies import is_user_authenticated
+from dataforce_studio.schemas.stats import CacheStats, ExecutorStats, PoolStats
+
+stats_routers = APIRouter(
+    prefix="/stats",
+    tags=["stats"],
+    dependencies=[Depends(is_user_authenticated)],
+)
+
+stats_handler = StatsHandler()
+
+
+@stats_routers.get("/cache", response_model=list[CacheStats])
+async def get_cache_stats() -> list[CacheStats]:
+    return stats_handler.get_cache_stats()
+
+
+@stats_routers.get("/executors", response_model=list[ExecutorStats])
+async def get_executor_stats() -> list[ExecutorStats]:
+    return stats_handler.get_executor_stats()
+
+
+@stats_routers.get("/db-pool", response_model=PoolStats | None)
+async def get_pool_stats() -> PoolStats | None:
+    return stats_handler.get_pool_stats()
@@ -1,4 +1,8 @@
-from time import time
+import hashlib
+import json
+import logging
+import uuid
+from time import perf_counter, time
 from typing import Any
 
 import httpx
@@ -8,13 +12,25 @@ from passlib.context import CryptContext
 from pydantic import EmailStr
 
 from dataforce_studio.handlers.emails import EmailHandler
+from dataforce_studio.infra.bloom_filter import ExpiringBloomFilter
+from dataforce_studio.infra.cache import (
+    TTLCache,
+    broadcast,
+    get_cache,
+    invalidate,
+    register_local_cache,
+)
 from dataforce_studio.infra.db import engine
 from dataforce_studio.infra.exceptions import AuthError
+from dataforce_studio.infra.executor import BoundedExecutor, register_executor
+from dataforce_studio.infra.unit_of_work import release_unit_of_work
 from dataforce_studio.models.auth import (
+    AuthUser,
     Token,
 )
 from dataforce_studio.repositories.token_blacklist import TokenBlackListRepository
 from dataforce_studio.repositories.users import UserRepository
+from dataforce_studio.schemas.stats import JobReport
 from dataforce_studio.schemas.user import (
     AuthProvider,
     CreateUser,
@@ -28,11 +44,29 @@ from dataforce_studio.schemas.user import (
 )
 from dataforce_studio.settings import config
 
+logger = logging.getLogger(__name__)
+
 
 class AuthHandler:
     __user_repository = UserRepository(engine)
     __token_black_list_repository = TokenBlackListRepository(engine)
     __emails_handler = EmailHandler()
+    __token_black_list_filter = ExpiringBloomFilter(
+        config.TOKEN_BLACKLIST_FILTER_CAPACITY,
+        config.TOKEN_BLACKLIST_FILTER_ERROR_RATE,
+        config.TOKEN_BLACKLIST_FILTER_BUCKET_SECONDS,
+    )
+    __token_black_list_channel = "token-blacklist"
+    __auth_users_cache: TTLCache[str, AuthUser] = TTLCache(
+        "auth_users", config.AUTH_USER_CACHE_MAXSIZE, config.AUTH_USER_CACHE_TTL
+    )
+    register_local_cache(__auth_users_cache)
+    __password_executor = BoundedExecutor(
+        "password_hashing",
+        config.PASSWORD_HASH_WORKERS,
+        config.PASSWORD_HASH_QUEUE_SIZE,
+    )
+    register_executor(__password_executor)
 
     def __init__(
         self,
@@ -48,11 +82,15 @@ class AuthHandler:
         self.refresh_token_expire = refresh_token_expire
         self.pwd_context = pwd_context
 
-    def _verify_password(self, plain_password: str, hashed_password: str) -> bool:
-        return self.pwd_context.verify(plain_password, hashed_password)
+    async def _verify_password(self, plain_password: str, hashed_password: str) -> bool:
+        await release_unit_of_work()
+        return await self.__password_executor.run(
+            self.pwd_context.verify, plain_password, hashed_password
+        )
 
-    def _get_password_hash(self, password: str) -> str:
-        return self.pwd_context.hash(password)
+    async def _get_password_hash(self, password: str) -> str:
+        await release_unit_of_work()
+        return await self.__password_executor.run(self.pwd_context.hash, password)
 
     async def _authenticate_user(self, email: EmailStr, password: str) -> User:
         user = await self.__user_repository.get_user(email)
@@ -62,7 +100,7 @@ class AuthHandler:
             raise AuthError("Invalid auth method", 400)
         if user.hashed_password is None:
             raise AuthError("Password is invalid", 400)
-        if not user or not self._verify_password(password, user.hashed_password):
+        if not user or not await self._verify_password(password, user.hashed_password):
             raise AuthError("Invalid email or password", 400)
         if not user.email_verified:
             raise AuthError("Email not verified", 400)
@@ -71,7 +109,7 @@ class AuthHandler:
     def _create_token(self, data: dict[str, Any], expires_delta: int) -> str:
         to_encode = data.copy()
         expire = int(time()) + expires_delta
-        to_encode.update({"exp": expire})
+        to_encode.update({"exp": expire, "jti": uuid.uuid4().hex})
         return jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
 
     def _create_tokens(self, user_email: EmailStr) -> Token:
@@ -103,7 +141,7 @@ class AuthHandler:
         if await self.__user_repository.get_user(create_user.email):
             raise AuthError("Email already registered", 400)
 
-        hashed_password = self._get_password_hash(create_user.password)
+        hashed_password = await self._get_password_hash(create_user.password)
 
         user = CreateUser(
             **create_user.model_dump(exclude={"password"}),
@@ -115,7 +153,7 @@ class AuthHandler:
 
         confirmation_token = self._generate_email_confirmation_token(user.email)
         confirmation_link = self._get_email_confirmation_link(confirmation_token)
-        self.__emails_handler.send_activation_email(
+        await self.__emails_handler.send_activation_email(
             create_user.email, confirmation_link, create_user.full_name
         )
         return {"detail": "Please confirm your email address"}
@@ -141,18 +179,14 @@ class AuthHandler:
             if email is None:
                 raise AuthError("Invalid token", 400)
 
-            if await self.__token_black_list_repository.is_token_blacklisted(
-                refresh_token
-            ):
+            if await self.is_token_blacklisted(refresh_token, payload):
                 raise AuthError("Token has been revoked", 400)
 
             service_user = await self.__user_repository.get_user(email)
             if service_user is None:
                 raise AuthError("User not found", 404)
 
-            exp = int(payload.get("exp"))
-
-            await self.__token_black_list_repository.add_token(refresh_token, exp)
+            await self._blacklist_token(refresh_token, payload)
 
             return self._create_tokens(service_user.email)
 
@@ -167,7 +201,7 @@ class AuthHandler:
         if not await self.__user_repository.get_user(email):
             raise AuthError("User not found", 404)
         hashed_password = (
-            self._get_password_hash(update_user.password)
+            await self._get_password_hash(update_user.password)
             if update_user.password
             else None
         )
@@ -176,10 +210,13 @@ class AuthHandler:
         )
         if hashed_password:
             update_user.hashed_password = hashed_password
-        return await self.__user_repository.update_user(update_user)
+        updated = await self.__user_repository.update_user(update_user)
+        await self._invalidate_auth_user(email)
+        return updated
 
     async def handle_delete_account(self, email: EmailStr) -> None:
         await self.__user_repository.delete_user(email)
+        await self._invalidate_auth_user(email)
 
     async def handle_get_current_user(self, email: EmailStr) -> UserOut:
         user = await self.__user_repository.get_public_user(email)
@@ -191,26 +228,56 @@ class AuthHandler:
 
         return user
 
+    async def get_auth_user(self, token: str) -> AuthUser:
+        try:
+            payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
+        except InvalidTokenError as err:
+            raise AuthError("Invalid token", 401) from err
+
+        email: EmailStr | None = payload.get("sub")
+        if email is None:
+            raise AuthError("Invalid token", 401)
+
+        key = f"{email}:{self._get_token_digest(token, payload)}"
+        auth_user = self.__auth_users_cache.get(key)
+        if auth_user is not None:
+            return auth_user
+
+        user = await self.handle_get_current_user(email)
+        auth_user = AuthUser(
+            user_id=user.id,
+            email=user.email,
+            full_name=user.full_name,
+            disabled=user.disabled,
+        )
+
+        ttl: float = config.AUTH_USER_CACHE_TTL
+        if exp := payload.get("exp"):
+            ttl = min(ttl, int(exp) - time())
+        if ttl > 0:
+            self.__auth_users_cache.set(key, auth_user, ttl)
+
+        return auth_user
+
+    async def _invalidate_auth_user(self, email: EmailStr) -> None:
+        await invalidate(self.__auth_users_cache.name, prefix=f"{email}:")
+
     async def handle_logout(self, access_token: str | None, refresh_token: str) -> None:
         try:
             payload = jwt.decode(
                 refresh_token, self.secret_key, algorithms=[self.algorithm]
             )
-            exp = payload.get("exp")
 
             if access_token:
                 try:
                     access_payload = jwt.decode(
                         access_token, self.secret_key, algorithms=[self.algorithm]
                     )
-                    exp = access_payload.get("exp")
-                    await self.__token_black_list_repository.add_token(
-                        access_token, exp
-                    )
+                    await self._blacklist_token(access_token, access_payload)
                 except InvalidTokenError:
                     pass
 
-            await self.__token_black_list_repository.add_token(refresh_token, exp)
+            await self._blacklist_token(refresh_token, payload)
 
         except InvalidTokenError as err:
             raise AuthError("Invalid refresh token", 400) from err
@@ -294,7 +361,7 @@ class AuthHandler:
             return
         token = self._generate_password_reset_token(service_user.email)
         link = self._get_password_reset_link(token)
-        self.__emails_handler.send_password_reset_email(
+        await self.__emails_handler.send_password_reset_email(
             email, link, service_user.full_name
         )
 
@@ -335,11 +402,97 @@ class AuthHandler:
 
             await self.__user_repository.update_user(
                 UpdateUser(
-                    email=email, hashed_password=self._get_password_hash(new_password)
+                    email=email,
+                    hashed_password=await self._get_password_hash(new_password),
                 )
             )
         except InvalidTokenError as err:
             raise AuthError("Invalid token", 400) from err
 
-    async def is_token_blacklisted(self, token: str) -> bool:
-        return await self.__token_black_list_repository.is_token_blacklisted(token)
+    @staticmethod
+    def _get_token_digest(token: str, payload: dict[str, Any] | None = None) -> str:
+        if payload is None:
+            try:
+                payload = jwt.decode(token, options={"verify_signature": False})
+            except InvalidTokenError:
+                payload = {}
+        jti = payload.get("jti")
+        return hashlib.sha256((jti or token).encode()).hexdigest()
+
+    async def _blacklist_token(self, token: str, payload: dict[str, Any]) -> None:
+        token_digest = self._get_token_digest(token, payload)
+        expire_at = int(payload["exp"])
+        await self.__token_black_list_repository.add_token(token_digest, expire_at)
+
+        self.__token_black_list_filter.add(bytes.fromhex(token_digest), expire_at)
+        await broadcast(
+            self.__token_black_list_channel,
+            json.dumps({"token_digest": token_digest, "expire_at": expire_at}),
+        )
+
+    async def load_token_blacklist(self) -> None:
+        if not config.TOKEN_BLACKLIST_FILTER_ENABLED:
+            return
+
+        tokens = await self.__token_black_list_repository.get_active_tokens()
+        for token_digest, expire_at in tokens:
+            self.__token_black_list_filter.add(bytes.fromhex(token_digest), expire_at)
+        self.__token_black_list_filter.loaded = True
+
+    async def _sync_token_blacklist(self, subscribed: bool) -> None:
+        if subscribed:
+            await self.load_token_blacklist()
+        else:
+            self.__token_black_list_filter.clear()
+
+    async def listen_for_blacklisted_tokens(self) -> None:
+        cache = get_cache()
+        if not config.TOKEN_BLACKLIST_FILTER_ENABLED:
+            return
+        if not cache.shared:
+            await self.load_token_blacklist()
+            return
+
+        async for message in cache.subscribe(
+            self.__token_black_list_channel, self._sync_token_blacklist
+        ):
+            try:
+                data = json.loads(message)
+                self.__token_black_list_filter.add(
+                    bytes.fromhex(data["token_digest"]), int(data["expire_at"])
+                )
+            except Exception:
+                logger.exception("Failed to apply blacklisted token %s", message)
+                self.__token_black_list_filter.clear()
+
+    async def is_token_blacklisted(
+        self, token: str, payload: dict[str, Any] | None = None
+    ) -> bool:
+        token_digest = self._get_token_digest(token, payload)
+        token_filter = self.__token_black_list_filter
+        if token_filter.loaded and not token_filter.might_contain(
+            bytes.fromhex(token_digest)
+        ):
+            return False
+        return await self.__token_black_list_repository.is_token_blacklisted(
+            token_digest
+        )
+
+    async def reap_expired_tokens(self) -> JobReport:
+        started = perf_counter()
+        rows = 0
+        while True:
+            deleted = await self.__token_black_list_repository.delete_expired_tokens(
+                config.TOKEN_REAPER_BATCH_SIZE
+            )
+            rows += deleted
+            if deleted < config.TOKEN_REAPER_BATCH_SIZE:
+                break
+
+        report = JobReport(
+            name="token_reaper", rows=rows, seconds=perf_counter() - started
+        )
+        logger.info(
+            "Reaped %d expired blacklisted tokens in %.3fs", report.rows, report.seconds
+        )
+        return report
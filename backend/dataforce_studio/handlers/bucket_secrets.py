@@ -3,6 +3,10 @@ from sqlalchemy.exc import IntegrityError
 from dataforce_studio.handlers.permissions import PermissionsHandler
 from dataforce_studio.infra.db import engine
 from dataforce_studio.infra.exceptions import BucketSecretInUseError, NotFoundError
+from dataforce_studio.infra.storage import (
+    invalidate_storage_client,
+    resolve_bucket_region,
+)
 from dataforce_studio.repositories.bucket_secrets import BucketSecretRepository
 from dataforce_studio.schemas.bucket_secrets import (
     BucketSecretCreate,
@@ -26,6 +30,7 @@ class BucketSecretHandler:
         secret_create = BucketSecretCreate(
             **secret.model_dump(), organization_id=organization_id
         )
+        secret_create.region = await resolve_bucket_region(secret_create)
         created = await self.__secret_repository.create_bucket_secret(secret_create)
         return BucketSecretOut.model_validate(created)
 
@@ -62,9 +67,11 @@ class BucketSecretHandler:
             organization_id, user_id, Resource.BUCKET_SECRET, Action.UPDATE
         )
         secret.id = secret_id
+        secret.region = await resolve_bucket_region(secret)
         db_secret = await self.__secret_repository.update_bucket_secret(secret)
         if not db_secret:
             raise NotFoundError("Secret not found")
+        await invalidate_storage_client(secret_id)
         return BucketSecretOut.model_validate(db_secret)
 
     async def delete_bucket_secret(
@@ -77,3 +84,4 @@ class BucketSecretHandler:
             await self.__secret_repository.delete_bucket_secret(secret_id)
         except IntegrityError as e:
             raise BucketSecretInUseError() from e
+        await invalidate_storage_client(secret_id)
@@ -4,8 +4,6 @@ from dataforce_studio.handlers.permissions import PermissionsHandler
 from dataforce_studio.infra.db import engine
 from dataforce_studio.infra.exceptions import CollectionDeleteError, NotFoundError
 from dataforce_studio.repositories.collections import CollectionRepository
-from dataforce_studio.repositories.ml_models import MLModelRepository
-from dataforce_studio.repositories.orbits import OrbitRepository
 from dataforce_studio.schemas.ml_models import (
     Collection,
     CollectionCreate,
@@ -18,9 +16,7 @@ from dataforce_studio.schemas.permissions import Action, Resource
 
 class CollectionHandler:
     __repository = CollectionRepository(engine)
-    __orbit_repository = OrbitRepository(engine)
     __permissions_handler = PermissionsHandler()
-    __models_repository = MLModelRepository(engine)
 
     async def create_collection(
         self,
@@ -29,17 +25,14 @@ class CollectionHandler:
         orbit_id: int,
         collection: CollectionCreateIn,
     ) -> Collection:
-        await self.__permissions_handler.check_orbit_action_access(
+        access = await self.__permissions_handler.check_orbit_action_access(
             organization_id,
             orbit_id,
             user_id,
             Resource.COLLECTION,
             Action.CREATE,
         )
-        orbit = await self.__orbit_repository.get_orbit_simple(
-            orbit_id, organization_id
-        )
-        if not orbit or orbit.organization_id != organization_id:
+        if not access.orbit:
             raise NotFoundError("Orbit not found")
         collection_create = CollectionCreate(
             **collection.model_dump(), orbit_id=orbit_id
@@ -49,17 +42,14 @@ class CollectionHandler:
     async def get_orbit_collections(
         self, user_id: int, organization_id: int, orbit_id: int
     ) -> list[Collection]:
-        await self.__permissions_handler.check_orbit_action_access(
+        access = await self.__permissions_handler.check_orbit_action_access(
             organization_id,
             orbit_id,
             user_id,
             Resource.COLLECTION,
             Action.LIST,
         )
-        orbit = await self.__orbit_repository.get_orbit_simple(
-            orbit_id, organization_id
-        )
-        if not orbit or orbit.organization_id != organization_id:
+        if not access.orbit:
             raise NotFoundError("Orbit not found")
         return await self.__repository.get_orbit_collections(orbit_id)
 
@@ -71,18 +61,18 @@ class CollectionHandler:
         collection_id: int,
         collection: CollectionUpdateIn,
     ) -> Collection:
-        await self.__permissions_handler.check_orbit_action_access(
+        access = await self.__permissions_handler.check_orbit_action_access(
             organization_id,
             orbit_id,
             user_id,
             Resource.COLLECTION,
             Action.UPDATE,
+            collection_id,
         )
-        orbit = await self.__orbit_repository.get_orbit_simple(
-            orbit_id, organization_id
-        )
-        if not orbit or orbit.organization_id != organization_id:
+        if not access.orbit:
             raise NotFoundError("Orbit not found")
+        if not access.collection:
+            raise NotFoundError("Collection not found")
         updated = await self.__repository.update_collection(
             collection_id,
             CollectionUpdate(
@@ -99,25 +89,19 @@ class CollectionHandler:
     async def delete_collection(
         self, user_id: int, organization_id: int, orbit_id: int, collection_id: int
     ) -> None:
-        await self.__permissions_handler.check_orbit_action_access(
+        access = await self.__permissions_handler.check_orbit_action_access(
             organization_id,
             orbit_id,
             user_id,
             Resource.COLLECTION,
             Action.DELETE,
+            collection_id,
         )
-        orbit = await self.__orbit_repository.get_orbit_simple(
-            orbit_id, organization_id
-        )
-        if not orbit or orbit.organization_id != organization_id:
+        if not access.orbit:
             raise NotFoundError("Orbit not found")
-        collection = await self.__repository.get_collection(collection_id)
-        if not collection:
+        if not access.collection:
             raise NotFoundError("Collection not found")
-        models_count = await self.__models_repository.get_collection_models_count(
-            collection_id
-        )
-        if models_count:
+        if access.collection.total_models:
             raise CollectionDeleteError(
                 "Collection has models and cant be deleted",
                 status_code=status.HTTP_409_CONFLICT,
@@ -0,0 +1,38 @@
+import logging
+import zlib
+from time import perf_counter
+
+from dataforce_studio.infra.db import engine, try_advisory_lock
+from dataforce_studio.repositories.counters import CounterRepository
+from dataforce_studio.schemas.stats import JobReport
+
+logger = logging.getLogger(__name__)
+
+COUNTER_CHECK_LOCK_KEY = zlib.crc32(b"counter_check")
+
+
+class CounterCheckHandler:
+    __repository = CounterRepository(engine)
+
+    async def check_counters(self) -> JobReport:
+        started = perf_counter()
+        repaired = await self.__repository.repair_counters()
+        report = JobReport(
+            name="counter_check",
+            rows=sum(repaired.values()),
+            seconds=perf_counter() - started,
+        )
+        if report.rows:
+            logger.warning(
+                "Repaired drifted counters (%s) in %.3fs",
+                ", ".join(f"{name}: {rows}" for name, rows in repaired.items() if rows),
+                report.seconds,
+            )
+        return report
+
+    async def run_counter_check(self) -> JobReport | None:
+        async with try_advisory_lock(COUNTER_CHECK_LOCK_KEY) as locked:
+            if not locked:
+                logger.info("Counter check is running on another worker")
+                return None
+            return await self.check_counters()
@@ -1,76 +1,114 @@
 from pydantic import EmailStr
-from sendgrid import SendGridAPIClient  # type: ignore
-from sendgrid.helpers.mail import Mail  # type: ignore
 
+from dataforce_studio.handlers.stats import StatsHandler
+from dataforce_studio.infra.email_outbox import EmailOutbox, create_email_transport
+from dataforce_studio.infra.unit_of_work import after_commit
+from dataforce_studio.schemas.emails import EmailMessage
+from dataforce_studio.schemas.stats import StatsEmailSendCreate
 from dataforce_studio.settings import config
 
 
+async def _record_delivery(
+    messages: list[EmailMessage], error: Exception | None
+) -> None:
+    stats_handler = StatsHandler()
+    for message in messages:
+        description = message.description
+        if error is not None:
+            description = f"{description} failed: {error}"
+        await stats_handler.create_email_send_stat(
+            StatsEmailSendCreate(email=message.email, description=description)
+        )
+
+
 class EmailHandler:
-    _email_client = SendGridAPIClient(config.SENDGRID_API_KEY)
+    _outbox = EmailOutbox(
+        create_email_transport(config.EMAIL_TRANSPORT, config.SENDGRID_API_KEY),
+        workers=config.EMAIL_OUTBOX_WORKERS,
+        queue_size=config.EMAIL_OUTBOX_QUEUE_SIZE,
+        batch_size=config.EMAIL_OUTBOX_BATCH_SIZE,
+        rate_limit=config.EMAIL_OUTBOX_RATE_LIMIT,
+        max_attempts=config.EMAIL_OUTBOX_MAX_ATTEMPTS,
+        retry_delay=config.EMAIL_OUTBOX_RETRY_DELAY,
+        on_delivery=_record_delivery,
+    )
 
     def __init__(self, sender_email: EmailStr = config.SENDER_EMAIL) -> None:
         self.sender_email = sender_email
 
-    def send_activation_email(
+    async def close(self) -> None:
+        await self._outbox.close(config.EMAIL_OUTBOX_SHUTDOWN_TIMEOUT)
+
+    async def _enqueue(self, message: EmailMessage) -> None:
+        async def enqueue() -> None:
+            self._outbox.enqueue(message)
+
+        await after_commit(enqueue)
+
+    async def send_activation_email(
         self, email: EmailStr, activation_link: str, name: str | None
     ) -> None:
-        message = Mail(
-            from_email=self.sender_email,
-            to_emails=str(email),
-            subject="Welcome to Dataforce Studio",
+        await self._enqueue(
+            EmailMessage(
+                email=email,
+                from_email=self.sender_email,
+                template_id=config.TEMPLATE_ID_ACTIVATION_EMAIL,
+                subject="Welcome to Dataforce Studio",
+                data={
+                    "name": name or "",
+                    "confirm_email_link": activation_link,
+                },
+                description="activation",
+            )
         )
-        message.template_id = config.TEMPLATE_ID_ACTIVATION_EMAIL
-        message.dynamic_template_data = {
-            "name": name or "",
-            "confirm_email_link": activation_link,
-        }
-
-        self._email_client.send(message)
 
-    def send_password_reset_email(
+    async def send_password_reset_email(
         self, email: EmailStr, reset_password_link: str, name: str | None
     ) -> None:
-        message = Mail(
-            from_email=self.sender_email,
-            to_emails=str(email),
-            subject="Reset Your Password",
+        await self._enqueue(
+            EmailMessage(
+                email=email,
+                from_email=self.sender_email,
+                template_id=config.TEMPLATE_ID_RESET_PASSWORD_EMAIL,
+                subject="Reset Your Password",
+                data={
+                    "reset_password_link": reset_password_link,
+                    "name": name or "",
+                },
+                description="password_reset",
+            )
         )
-        message.template_id = config.TEMPLATE_ID_RESET_PASSWORD_EMAIL
-        message.dynamic_template_data = {
-            "reset_password_link": reset_password_link,
-            "name": name or "",
-        }
-
-        self._email_client.send(message)
 
-    def send_organization_invite_email(
+    async def send_organization_invite_email(
         self, email: EmailStr, sender: str, organization: str, link: str
     ) -> None:
-        message = Mail(
-            from_email=self.sender_email,
-            to_emails=str(email),
+        await self._enqueue(
+            EmailMessage(
+                email=email,
+                from_email=self.sender_email,
+                template_id=config.TEMPLATE_ID_ORGANIZATION_INVITE_EMAIL,
+                data={
+                    "invite_sender": sender or "",
+                    "organization": organization,
+                    "open_platform_link": link,
+                },
+                description="organization_invite",
+            )
         )
-        message.template_id = config.TEMPLATE_ID_ORGANIZATION_INVITE_EMAIL
-        message.dynamic_template_data = {
-            "invite_sender": sender or "",
-            "organization": organization,
-            "open_platform_link": link,
-        }
 
-        self._email_client.send(message)
-
-    def send_added_to_orbit_email(
+    async def send_added_to_orbit_email(
         self, name: str, email: EmailStr, orbit: str, link: str
     ) -> None:
-        message = Mail(
-            from_email=self.sender_email,
-            to_emails=str(email),
+        await self._enqueue(
+            EmailMessage(
+                email=email,
+                from_email=self.sender_email,
+                template_id=config.TEMPLATE_ID_ADDED_TO_ORBIT_EMAIL,
+                data={
+                    "name": name,
+                    "orbit": orbit or "",
+                    "open_platform_link": link,
+                },
+                description="added_to_orbit",
+            )
         )
-        message.template_id = config.TEMPLATE_ID_ADDED_TO_ORBIT_EMAIL
-        message.dynamic_template_data = {
-            "name": name,
-            "orbit": orbit or "",
-            "open_platform_link": link,
-        }
-
-        self._email_client.send(message)
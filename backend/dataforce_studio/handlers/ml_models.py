@@ -1,35 +1,71 @@
-from datetime import timedelta
+from datetime import datetime, timedelta
+from typing import TypeVar
 from uuid import uuid4
 
 from fastapi import status
-from minio import Minio
 
 from dataforce_studio.handlers.permissions import PermissionsHandler
 from dataforce_studio.infra.db import engine
 from dataforce_studio.infra.exceptions import NotFoundError, ServiceError
+from dataforce_studio.infra.integrity import IntegrityVerifier, verify_object
+from dataforce_studio.infra.pagination import (
+    decode_cursor,
+    decode_metric_cursor,
+    encode_cursor,
+)
+from dataforce_studio.infra.storage import (
+    ObjectStream,
+    StorageClient,
+    abort_multipart_upload,
+    choose_part_size,
+    complete_multipart_upload,
+    create_multipart_upload,
+    empty_object,
+    get_storage_client,
+    list_uploaded_parts,
+    open_object,
+    open_object_range,
+    presign_upload_part,
+    range_header,
+    set_storage_client,
+)
+from dataforce_studio.infra.unit_of_work import after_commit
 from dataforce_studio.repositories.bucket_secrets import BucketSecretRepository
 from dataforce_studio.repositories.collections import CollectionRepository
 from dataforce_studio.repositories.ml_models import MLModelRepository
-from dataforce_studio.repositories.orbits import OrbitRepository
+from dataforce_studio.schemas.base import Page
 from dataforce_studio.schemas.ml_models import (
     Collection,
     MLModel,
     MLModelCreate,
+    MLModelDownloadSummary,
+    MLModelFileUrl,
     MLModelIn,
+    MLModelListFilters,
     MLModelStatus,
+    MLModelSummary,
     MLModelUpdate,
     MLModelUpdateIn,
+    MLModelUploadUpdate,
+    MLModelWithUrl,
+    MultipartUpload,
+    MultipartUploadProgress,
+    UploadedPart,
+    UploadPartUrl,
 )
 from dataforce_studio.schemas.orbit import Orbit
-from dataforce_studio.schemas.permissions import Action, Resource
+from dataforce_studio.schemas.permissions import Action, OrbitAccess, Resource
+from dataforce_studio.settings import config
+
+ListedModel = TypeVar("ListedModel", MLModel, MLModelSummary, MLModelDownloadSummary)
 
 
 class MLModelHandler:
     __repository = MLModelRepository(engine)
-    __orbit_repository = OrbitRepository(engine)
     __secret_repository = BucketSecretRepository(engine)
     __collection_repository = CollectionRepository(engine)
     __permissions_handler = PermissionsHandler()
+    __verifier = IntegrityVerifier(config.UPLOAD_VERIFY_CONCURRENCY)
 
     __model_transitions = {
         MLModelStatus.PENDING_UPLOAD: {
@@ -39,79 +75,150 @@ class MLModelHandler:
         MLModelStatus.PENDING_DELETION: {MLModelStatus.DELETION_FAILED},
     }
 
-    async def _get_presigned_url(self, secret_id: int, object_name: str) -> str:
+    async def _get_storage_client(self, secret_id: int) -> StorageClient:
+        storage_client = get_storage_client(secret_id)
+        if storage_client:
+            return storage_client
+
         secret = await self.__secret_repository.get_bucket_secret(secret_id)
         if not secret:
             raise NotFoundError("Bucket secret not found")
+        return await set_storage_client(secret)
 
-        client = Minio(
-            secret.endpoint,
-            access_key=secret.access_key,
-            secret_key=secret.secret_key,
-            session_token=secret.session_token,
-            secure=secret.secure if secret.secure is not None else True,
-            region=secret.region,
-            cert_check=secret.cert_check if secret.cert_check is not None else True,
-        )
-        return client.presigned_put_object(
-            bucket_name=secret.bucket_name,
-            object_name=object_name,
+    async def _get_presigned_url(self, secret_id: int, object_name: str) -> str:
+        storage = await self._get_storage_client(secret_id)
+        return storage.presigner.presign(
+            "PUT",
+            storage.secret.bucket_name,
+            object_name,
             expires=timedelta(hours=1),
         )
 
     async def _get_download_url(self, secret_id: int, object_name: str) -> str:
-        secret = await self.__secret_repository.get_bucket_secret(secret_id)
-        if not secret:
-            raise NotFoundError("Bucket secret not found")
-
-        client = Minio(
-            secret.endpoint,
-            access_key=secret.access_key,
-            secret_key=secret.secret_key,
-            session_token=secret.session_token,
-            secure=secret.secure if secret.secure is not None else True,
-            region=secret.region,
-            cert_check=secret.cert_check if secret.cert_check is not None else True,
-        )
-        return client.presigned_get_object(
-            bucket_name=secret.bucket_name,
-            object_name=object_name,
+        storage = await self._get_storage_client(secret_id)
+        return storage.presigner.presign(
+            "GET",
+            storage.secret.bucket_name,
+            object_name,
             expires=timedelta(hours=1),
         )
 
-    async def _get_delete_url(self, secret_id: int, object_name: str) -> str:
-        secret = await self.__secret_repository.get_bucket_secret(secret_id)
-        if not secret:
-            raise NotFoundError("Bucket secret not found")
+    async def _get_download_urls(
+        self, secret_id: int, object_names: list[str]
+    ) -> list[str]:
+        storage = await self._get_storage_client(secret_id)
+        return [
+            storage.presigner.presign(
+                "GET",
+                storage.secret.bucket_name,
+                object_name,
+                expires=timedelta(hours=1),
+            )
+            for object_name in object_names
+        ]
 
-        client = Minio(
-            secret.endpoint,
-            access_key=secret.access_key,
-            secret_key=secret.secret_key,
-            session_token=secret.session_token,
-            secure=secret.secure if secret.secure is not None else True,
-            region=secret.region,
-            cert_check=secret.cert_check if secret.cert_check is not None else True,
-        )
-        return client.get_presigned_url(
+    async def _get_delete_url(self, secret_id: int, object_name: str) -> str:
+        storage = await self._get_storage_client(secret_id)
+        return storage.presigner.presign(
             "DELETE",
-            bucket_name=secret.bucket_name,
-            object_name=object_name,
+            storage.secret.bucket_name,
+            object_name,
             expires=timedelta(hours=1),
         )
 
-    async def _check_orbit_and_collection_access(
-        self, organization_id: int, orbit_id: int, collection_id: int
-    ) -> tuple[Orbit, Collection]:
-        orbit = await self.__orbit_repository.get_orbit_simple(
-            orbit_id, organization_id
+    async def _verify_upload(self, model: MLModel, secret_id: int) -> None:
+        url = await self._get_download_url(secret_id, model.bucket_location)
+        try:
+            verified = await verify_object(
+                await open_object(url), model.size, model.file_hash
+            )
+        except NotFoundError:
+            verified = False
+
+        await self.__repository.update_status(
+            model.id,
+            MLModelStatus.UPLOADED if verified else MLModelStatus.UPLOAD_FAILED,
+            current_status=MLModelStatus.VERIFYING,
         )
-        if not orbit or orbit.organization_id != organization_id:
+
+    def _schedule_verification(self, model: MLModel, secret_id: int) -> bool:
+        return self.__verifier.schedule(
+            model.id, lambda: self._verify_upload(model, secret_id)
+        )
+
+    async def _schedule_verification_after_commit(
+        self, model: MLModel, secret_id: int
+    ) -> None:
+        async def schedule() -> None:
+            self._schedule_verification(model, secret_id)
+
+        await after_commit(schedule)
+
+    async def resume_upload_verifications(self) -> int:
+        pending = await self.__repository.get_models_to_verify(
+            config.UPLOAD_VERIFY_RESUME_BATCH_SIZE
+        )
+        return sum(
+            self._schedule_verification(item.model, item.bucket_secret_id)
+            for item in pending
+        )
+
+    async def wait_for_verifications(self) -> None:
+        await self.__verifier.wait()
+
+    async def close(self) -> None:
+        await self.__verifier.close()
+
+    @staticmethod
+    def _check_orbit_and_collection_access(
+        access: OrbitAccess,
+    ) -> tuple[Orbit, Collection]:
+        if not access.orbit:
             raise NotFoundError("Orbit not found")
-        collection = await self.__collection_repository.get_collection(collection_id)
-        if not collection or collection.orbit_id != orbit_id:
+        if not access.collection:
             raise NotFoundError("Collection not found")
-        return orbit, collection
+        return access.orbit, access.collection
+
+    @staticmethod
+    def _new_ml_model(
+        orbit_id: int, collection_id: int, model: MLModelIn
+    ) -> MLModelCreate:
+        unique_id = uuid4().hex
+        object_name = f"{unique_id}-{model.file_name}"
+        bucket_location = f"orbit-{orbit_id}/collection-{collection_id}/{object_name}"
+        return MLModelCreate(
+            collection_id=collection_id,
+            file_name=model.file_name,
+            model_name=model.model_name,
+            description=model.description,
+            metrics=model.metrics,
+            manifest=model.manifest,
+            file_hash=model.file_hash,
+            file_index=model.file_index,
+            bucket_location=bucket_location,
+            size=model.size,
+            unique_identifier=unique_id,
+            tags=model.tags,
+            status=MLModelStatus.PENDING_UPLOAD,
+        )
+
+    async def _create_duplicate(
+        self, orbit: Orbit, model: MLModelCreate
+    ) -> MLModel | None:
+        existing = await self.__repository.get_uploaded_model_by_hash(
+            orbit.id, model.file_hash, model.size
+        )
+        if not existing:
+            return None
+
+        return await self.__repository.create_ml_model_copy(
+            model.model_copy(
+                update={
+                    "bucket_location": existing.bucket_location,
+                    "status": MLModelStatus.UPLOADED,
+                }
+            )
+        )
 
     async def create_ml_model(
         self,
@@ -120,41 +227,26 @@ class MLModelHandler:
         orbit_id: int,
         collection_id: int,
         model: MLModelIn,
-    ) -> tuple[MLModel, str]:
-        await self.__permissions_handler.check_orbit_action_access(
+    ) -> tuple[MLModel, str | None]:
+        access = await self.__permissions_handler.check_orbit_action_access(
             organization_id,
             orbit_id,
             user_id,
             Resource.MODEL,
             Action.CREATE,
+            collection_id,
         )
 
-        orbit, collection = await self._check_orbit_and_collection_access(
-            organization_id, orbit_id, collection_id
-        )
-        unique_id = uuid4().hex
-        object_name = f"{unique_id}-{model.file_name}"
-        bucket_location = f"orbit-{orbit_id}/collection-{collection_id}/{object_name}"
+        orbit, collection = self._check_orbit_and_collection_access(access)
+        new_model = self._new_ml_model(orbit_id, collection_id, model)
+        duplicate = await self._create_duplicate(orbit, new_model)
+        if duplicate:
+            return duplicate, None
 
-        created_model = await self.__repository.create_ml_model(
-            MLModelCreate(
-                collection_id=collection_id,
-                file_name=model.file_name,
-                model_name=model.model_name,
-                description=model.description,
-                metrics=model.metrics,
-                manifest=model.manifest,
-                file_hash=model.file_hash,
-                file_index=model.file_index,
-                bucket_location=bucket_location,
-                size=model.size,
-                unique_identifier=unique_id,
-                tags=model.tags,
-                status=MLModelStatus.PENDING_UPLOAD,
-            )
+        url = await self._get_presigned_url(
+            orbit.bucket_secret_id, new_model.bucket_location
         )
-
-        url = await self._get_presigned_url(orbit.bucket_secret_id, bucket_location)
+        created_model = await self.__repository.create_ml_model(new_model)
         return created_model, url
 
     async def update_model(
@@ -166,16 +258,15 @@ class MLModelHandler:
         model_id: int,
         model: MLModelUpdateIn,
     ) -> MLModel:
-        await self.__permissions_handler.check_orbit_action_access(
+        access = await self.__permissions_handler.check_orbit_action_access(
             organization_id,
             orbit_id,
             user_id,
             Resource.MODEL,
             Action.UPDATE,
+            collection_id,
         )
-        await self._check_orbit_and_collection_access(
-            organization_id, orbit_id, collection_id
-        )
+        orbit, _ = self._check_orbit_and_collection_access(access)
 
         model_obj = await self.__repository.get_ml_model(model_id, collection_id)
 
@@ -188,9 +279,16 @@ class MLModelHandler:
             raise ServiceError(
                 f"Invalid status transition from {model_obj.status} to {model.status}"
             )
+        if model.status == MLModelStatus.UPLOADED and model_obj.upload_id:
+            raise ServiceError(
+                "Complete the multipart upload to mark the model as uploaded",
+                status_code=status.HTTP_409_CONFLICT,
+            )
 
         update_data = model.model_dump(exclude_unset=True)
         update_data["id"] = model_id
+        if model.status == MLModelStatus.UPLOADED:
+            update_data["status"] = MLModelStatus.VERIFYING
         updated = await self.__repository.update_ml_model(
             model_id,
             collection_id,
@@ -200,6 +298,10 @@ class MLModelHandler:
         if not updated:
             raise NotFoundError("ML model not found")
 
+        if updated.status == MLModelStatus.VERIFYING:
+            await self._schedule_verification_after_commit(
+                updated, orbit.bucket_secret_id
+            )
         return updated
 
     async def request_download_url(
@@ -210,17 +312,16 @@ class MLModelHandler:
         collection_id: int,
         model_id: int,
     ) -> str:
-        await self.__permissions_handler.check_orbit_action_access(
+        access = await self.__permissions_handler.check_orbit_action_access(
             organization_id,
             orbit_id,
             user_id,
             Resource.MODEL,
             Action.READ,
+            collection_id,
         )
 
-        orbit, collection = await self._check_orbit_and_collection_access(
-            organization_id, orbit_id, collection_id
-        )
+        orbit, collection = self._check_orbit_and_collection_access(access)
         model = await self.__repository.get_ml_model(model_id, collection_id)
         if not model:
             raise NotFoundError("ML model not found")
@@ -237,30 +338,25 @@ class MLModelHandler:
         orbit_id: int,
         collection_id: int,
         model_id: int,
-    ) -> str:
-        await self.__permissions_handler.check_orbit_action_access(
+    ) -> str | None:
+        access = await self.__permissions_handler.check_orbit_action_access(
             organization_id,
             orbit_id,
             user_id,
             Resource.MODEL,
             Action.UPDATE,
+            collection_id,
         )
-        await self._check_orbit_and_collection_access(
-            organization_id, orbit_id, collection_id
-        )
+        orbit, _ = self._check_orbit_and_collection_access(access)
         model = await self.__repository.get_ml_model(model_id, collection_id)
         if not model:
             raise NotFoundError("ML model not found")
 
-        orbit = await self.__orbit_repository.get_orbit_simple(
-            orbit_id, organization_id
-        )
-        if not orbit:
-            raise NotFoundError("Orbit not found")
-
-        url = await self._get_delete_url(orbit.bucket_secret_id, model.bucket_location)
-        await self.__repository.update_status(model_id, MLModelStatus.PENDING_DELETION)
-        return url
+        if not await self.__repository.mark_for_deletion(
+            model_id, model.bucket_location
+        ):
+            return None
+        return await self._get_delete_url(orbit.bucket_secret_id, model.bucket_location)
 
     async def confirm_deletion(
         self,
@@ -270,16 +366,15 @@ class MLModelHandler:
         collection_id: int,
         model_id: int,
     ) -> None:
-        await self.__permissions_handler.check_orbit_action_access(
+        access = await self.__permissions_handler.check_orbit_action_access(
             organization_id,
             orbit_id,
             user_id,
             Resource.MODEL,
             Action.DELETE,
+            collection_id,
         )
-        await self._check_orbit_and_collection_access(
-            organization_id, orbit_id, collection_id
-        )
+        self._check_orbit_and_collection_access(access)
         model = await self.__repository.get_ml_model(model_id, collection_id)
         if not model:
             raise NotFoundError("ML model not found")
@@ -290,24 +385,87 @@ class MLModelHandler:
             )
         await self.__repository.delete_ml_model(model_id)
 
+    async def _check_list_access(
+        self, user_id: int, organization_id: int, orbit_id: int, collection_id: int
+    ) -> None:
+        access = await self.__permissions_handler.check_orbit_action_access(
+            organization_id,
+            orbit_id,
+            user_id,
+            Resource.MODEL,
+            Action.LIST,
+            collection_id,
+        )
+        self._check_orbit_and_collection_access(access)
+
+    @staticmethod
+    def _decode_cursor(
+        cursor: str | None, filters: MLModelListFilters
+    ) -> tuple[datetime | float, int] | None:
+        if not cursor:
+            return None
+        if filters.sort_metric:
+            return decode_metric_cursor(cursor)
+        return decode_cursor(cursor)
+
+    @staticmethod
+    def _get_page(
+        models: list[ListedModel], limit: int | None, filters: MLModelListFilters
+    ) -> Page[ListedModel]:
+        if limit is None or len(models) <= limit:
+            return Page(items=models)
+
+        last = models[limit - 1]
+        sort_key = (
+            float(last.metrics[filters.sort_metric])
+            if filters.sort_metric
+            else last.created_at
+        )
+        return Page(items=models[:limit], cursor=encode_cursor(sort_key, last.id))
+
     async def get_collection_models(
         self,
         user_id: int,
         organization_id: int,
         orbit_id: int,
         collection_id: int,
-    ) -> list[MLModel]:
-        await self.__permissions_handler.check_orbit_action_access(
-            organization_id,
-            orbit_id,
-            user_id,
-            Resource.MODEL,
-            Action.LIST,
+        cursor: str | None = None,
+        limit: int | None = None,
+        filters: MLModelListFilters | None = None,
+    ) -> Page[MLModel]:
+        filters = filters or MLModelListFilters()
+        await self._check_list_access(user_id, organization_id, orbit_id, collection_id)
+        if limit is None and cursor is not None:
+            limit = config.ML_MODELS_PAGE_SIZE
+        models = await self.__repository.get_collection_models_page(
+            collection_id,
+            None if limit is None else limit + 1,
+            self._decode_cursor(cursor, filters),
+            filters,
         )
-        await self._check_orbit_and_collection_access(
-            organization_id, orbit_id, collection_id
+        return self._get_page(models, limit, filters)
+
+    async def get_collection_model_summaries(
+        self,
+        user_id: int,
+        organization_id: int,
+        orbit_id: int,
+        collection_id: int,
+        cursor: str | None = None,
+        limit: int = config.ML_MODELS_PAGE_SIZE,
+        metric_keys: list[str] | None = None,
+        filters: MLModelListFilters | None = None,
+    ) -> Page[MLModelSummary]:
+        filters = filters or MLModelListFilters()
+        await self._check_list_access(user_id, organization_id, orbit_id, collection_id)
+        summaries = await self.__repository.get_collection_model_summaries_page(
+            collection_id,
+            limit + 1,
+            self._decode_cursor(cursor, filters),
+            metric_keys,
+            filters,
         )
-        return await self.__repository.get_collection_models(collection_id)
+        return self._get_page(summaries, limit, filters)
 
     async def get_ml_model(
         self,
@@ -316,17 +474,16 @@ class MLModelHandler:
         orbit_id: int,
         collection_id: int,
         model_id: int,
-    ) -> tuple[MLModel, str]:
-        await self.__permissions_handler.check_orbit_action_access(
+    ) -> tuple[MLModel, str | None]:
+        access = await self.__permissions_handler.check_orbit_action_access(
             organization_id,
             orbit_id,
             user_id,
             Resource.MODEL,
             Action.READ,
+            collection_id,
         )
-        orbit, _ = await self._check_orbit_and_collection_access(
-            organization_id, orbit_id, collection_id
-        )
+        orbit, _ = self._check_orbit_and_collection_access(access)
         model = await self.__repository.get_ml_model(model_id, collection_id)
         if not model:
             raise NotFoundError("ML model not found")
@@ -335,3 +492,351 @@ class MLModelHandler:
             orbit.bucket_secret_id, model.bucket_location
         )
         return model, url
+
+    async def get_collection_models_with_urls(
+        self,
+        user_id: int,
+        organization_id: int,
+        orbit_id: int,
+        collection_id: int,
+        model_ids: list[int] | None = None,
+        cursor: str | None = None,
+        limit: int = config.ML_MODELS_PAGE_SIZE,
+    ) -> Page[MLModelWithUrl]:
+        access = await self.__permissions_handler.check_orbit_action_access(
+            organization_id,
+            orbit_id,
+            user_id,
+            Resource.MODEL,
+            Action.READ,
+            collection_id,
+        )
+        orbit, _ = self._check_orbit_and_collection_access(access)
+        filters = MLModelListFilters(ids=model_ids, status=[MLModelStatus.UPLOADED])
+        models = await self.__repository.get_collection_model_downloads_page(
+            collection_id, limit + 1, self._decode_cursor(cursor, filters), filters
+        )
+        page = self._get_page(models, limit, filters)
+        if not page.items:
+            return Page(items=[])
+
+        urls = await self._get_download_urls(
+            orbit.bucket_secret_id, [model.bucket_location for model in page.items]
+        )
+        return Page(
+            items=[
+                MLModelWithUrl(model=model, url=url)
+                for model, url in zip(page.items, urls, strict=True)
+            ],
+            cursor=page.cursor,
+        )
+
+    @staticmethod
+    def _get_upload_id(model: MLModel) -> str:
+        if model.status != MLModelStatus.PENDING_UPLOAD or not model.upload_id:
+            raise ServiceError(
+                "ML model has no active multipart upload",
+                status_code=status.HTTP_409_CONFLICT,
+            )
+        return model.upload_id
+
+    @staticmethod
+    def _presign_upload_parts(
+        storage: StorageClient,
+        model: MLModel,
+        upload_id: str,
+        part_numbers: list[int],
+    ) -> list[UploadPartUrl]:
+        return [
+            UploadPartUrl(
+                part_number=part_number,
+                url=presign_upload_part(
+                    storage, model.bucket_location, upload_id, part_number
+                ),
+            )
+            for part_number in part_numbers
+        ]
+
+    async def _get_uploading_model(
+        self,
+        user_id: int,
+        organization_id: int,
+        orbit_id: int,
+        collection_id: int,
+        model_id: int,
+    ) -> tuple[MLModel, str, StorageClient]:
+        access = await self.__permissions_handler.check_orbit_action_access(
+            organization_id,
+            orbit_id,
+            user_id,
+            Resource.MODEL,
+            Action.UPDATE,
+            collection_id,
+        )
+        orbit, _ = self._check_orbit_and_collection_access(access)
+        model = await self.__repository.get_ml_model(model_id, collection_id)
+        if not model:
+            raise NotFoundError("ML model not found")
+
+        upload_id = self._get_upload_id(model)
+        storage = await self._get_storage_client(orbit.bucket_secret_id)
+        return model, upload_id, storage
+
+    async def create_ml_model_multipart(
+        self,
+        user_id: int,
+        organization_id: int,
+        orbit_id: int,
+        collection_id: int,
+        model: MLModelIn,
+    ) -> MultipartUpload:
+        access = await self.__permissions_handler.check_orbit_action_access(
+            organization_id,
+            orbit_id,
+            user_id,
+            Resource.MODEL,
+            Action.CREATE,
+            collection_id,
+        )
+        orbit, _ = self._check_orbit_and_collection_access(access)
+
+        part_size, parts_count = choose_part_size(model.size)
+        new_model = self._new_ml_model(orbit_id, collection_id, model)
+        duplicate = await self._create_duplicate(orbit, new_model)
+        if duplicate:
+            return MultipartUpload(
+                model=duplicate, part_size=part_size, parts_count=0, parts=[]
+            )
+
+        storage = await self._get_storage_client(orbit.bucket_secret_id)
+        upload_id = await create_multipart_upload(storage, new_model.bucket_location)
+        new_model.upload_id = upload_id
+        new_model.upload_part_size = part_size
+        new_model.upload_parts_count = parts_count
+
+        created_model = await self.__repository.create_ml_model(new_model)
+        first_parts = range(
+            1, min(parts_count, config.MULTIPART_PRESIGN_BATCH_SIZE) + 1
+        )
+        return MultipartUpload(
+            model=created_model,
+            part_size=part_size,
+            parts_count=parts_count,
+            parts=self._presign_upload_parts(
+                storage, created_model, upload_id, list(first_parts)
+            ),
+        )
+
+    async def get_upload_part_urls(
+        self,
+        user_id: int,
+        organization_id: int,
+        orbit_id: int,
+        collection_id: int,
+        model_id: int,
+        part_numbers: list[int],
+    ) -> list[UploadPartUrl]:
+        model, upload_id, storage = await self._get_uploading_model(
+            user_id, organization_id, orbit_id, collection_id, model_id
+        )
+        if len(part_numbers) > config.MULTIPART_PRESIGN_BATCH_SIZE:
+            raise ServiceError(
+                f"At most {config.MULTIPART_PRESIGN_BATCH_SIZE} parts per request"
+            )
+        parts_count = model.upload_parts_count or 0
+        if any(not 1 <= number <= parts_count for number in part_numbers):
+            raise ServiceError(f"Part numbers must be between 1 and {parts_count}")
+
+        return self._presign_upload_parts(storage, model, upload_id, part_numbers)
+
+    async def get_upload_progress(
+        self,
+        user_id: int,
+        organization_id: int,
+        orbit_id: int,
+        collection_id: int,
+        model_id: int,
+    ) -> MultipartUploadProgress:
+        model, upload_id, storage = await self._get_uploading_model(
+            user_id, organization_id, orbit_id, collection_id, model_id
+        )
+        parts = await list_uploaded_parts(storage, model.bucket_location, upload_id)
+        uploaded_bytes = sum(part.size or 0 for part in parts)
+
+        await self.__repository.update_upload(
+            model_id,
+            upload_id,
+            MLModelUploadUpdate(
+                id=model_id,
+                uploaded_parts_count=len(parts),
+                uploaded_bytes=uploaded_bytes,
+            ),
+        )
+        return MultipartUploadProgress(
+            part_size=model.upload_part_size or 0,
+            parts_count=model.upload_parts_count or 0,
+            uploaded_parts=[
+                UploadedPart(
+                    part_number=part.part_number, etag=part.etag, size=part.size
+                )
+                for part in parts
+            ],
+            uploaded_bytes=uploaded_bytes,
+        )
+
+    async def complete_multipart_upload(
+        self,
+        user_id: int,
+        organization_id: int,
+        orbit_id: int,
+        collection_id: int,
+        model_id: int,
+        parts: list[UploadedPart],
+    ) -> MLModel:
+        model, upload_id, storage = await self._get_uploading_model(
+            user_id, organization_id, orbit_id, collection_id, model_id
+        )
+        part_numbers = list(range(1, (model.upload_parts_count or 0) + 1))
+        if sorted(part.part_number for part in parts) != part_numbers:
+            raise ServiceError(
+                "Multipart upload is incomplete", status_code=status.HTTP_409_CONFLICT
+            )
+
+        uploaded = {
+            part.part_number: part
+            for part in await list_uploaded_parts(
+                storage, model.bucket_location, upload_id
+            )
+        }
+        for part in parts:
+            uploaded_part = uploaded.get(part.part_number)
+            if not uploaded_part or uploaded_part.etag != part.etag.strip('"'):
+                raise ServiceError(
+                    f"Part {part.part_number} does not match uploaded data",
+                    status_code=status.HTTP_409_CONFLICT,
+                )
+
+        uploaded_bytes = sum(uploaded[number].size or 0 for number in part_numbers)
+        if uploaded_bytes != model.size:
+            raise ServiceError(
+                f"Uploaded {uploaded_bytes} bytes, expected {model.size}",
+                status_code=status.HTTP_409_CONFLICT,
+            )
+
+        await complete_multipart_upload(
+            storage,
+            model.bucket_location,
+            upload_id,
+            [uploaded[number] for number in part_numbers],
+        )
+        updated = await self.__repository.update_upload(
+            model_id,
+            upload_id,
+            MLModelUploadUpdate(
+                id=model_id,
+                status=MLModelStatus.VERIFYING,
+                upload_id=None,
+                uploaded_parts_count=len(part_numbers),
+                uploaded_bytes=uploaded_bytes,
+            ),
+        )
+        if not updated:
+            raise NotFoundError("ML model not found")
+        await self._schedule_verification_after_commit(updated, storage.secret.id)
+        return updated
+
+    async def abort_multipart_upload(
+        self,
+        user_id: int,
+        organization_id: int,
+        orbit_id: int,
+        collection_id: int,
+        model_id: int,
+    ) -> None:
+        model, upload_id, storage = await self._get_uploading_model(
+            user_id, organization_id, orbit_id, collection_id, model_id
+        )
+        await abort_multipart_upload(storage, model.bucket_location, upload_id)
+        await self.__repository.update_upload(
+            model_id,
+            upload_id,
+            MLModelUploadUpdate(
+                id=model_id, status=MLModelStatus.UPLOAD_FAILED, upload_id=None
+            ),
+        )
+
+    async def _get_model_file(
+        self,
+        user_id: int,
+        organization_id: int,
+        orbit_id: int,
+        collection_id: int,
+        model_id: int,
+        file_path: str,
+    ) -> tuple[MLModelFileUrl, MLModel]:
+        access = await self.__permissions_handler.check_orbit_action_access(
+            organization_id,
+            orbit_id,
+            user_id,
+            Resource.MODEL,
+            Action.READ,
+            collection_id,
+        )
+        orbit, _ = self._check_orbit_and_collection_access(access)
+        model = await self.__repository.get_ml_model(model_id, collection_id)
+        if not model:
+            raise NotFoundError("ML model not found")
+        if model.status != MLModelStatus.UPLOADED:
+            raise ServiceError(
+                f"Unable to read files of model with status '{model.status}'",
+                status_code=status.HTTP_409_CONFLICT,
+            )
+        if file_path not in model.file_index:
+            raise NotFoundError("File not found in ML model")
+
+        offset, size = model.file_index[file_path]
+        if offset < 0 or size < 0 or offset + size > model.size:
+            raise ServiceError("File index entry is out of the model bounds")
+        if not size:
+            return MLModelFileUrl(url=None, headers={}, offset=offset, size=0), model
+
+        storage = await self._get_storage_client(orbit.bucket_secret_id)
+        headers = range_header(offset, size)
+        url = storage.presigner.presign(
+            "GET",
+            storage.secret.bucket_name,
+            model.bucket_location,
+            expires=timedelta(hours=1),
+            headers=headers,
+        )
+        return MLModelFileUrl(url=url, headers=headers, offset=offset, size=size), model
+
+    async def get_model_file_url(
+        self,
+        user_id: int,
+        organization_id: int,
+        orbit_id: int,
+        collection_id: int,
+        model_id: int,
+        file_path: str,
+    ) -> MLModelFileUrl:
+        file_url, _ = await self._get_model_file(
+            user_id, organization_id, orbit_id, collection_id, model_id, file_path
+        )
+        return file_url
+
+    async def open_model_file(
+        self,
+        user_id: int,
+        organization_id: int,
+        orbit_id: int,
+        collection_id: int,
+        model_id: int,
+        file_path: str,
+    ) -> ObjectStream:
+        file_url, _ = await self._get_model_file(
+            user_id, organization_id, orbit_id, collection_id, model_id, file_path
+        )
+        if not file_url.url:
+            return empty_object()
+        return await open_object_range(file_url.url, file_url.offset, file_url.size)
@@ -156,10 +156,7 @@ class OrbitHandler:
     async def get_orbit(
         self, user_id: int, organization_id: int, orbit_id: int
     ) -> OrbitDetails:
-        (
-            org_role,
-            orbit_role,
-        ) = await self.__permissions_handler.check_orbit_action_access(
+        access = await self.__permissions_handler.check_orbit_action_access(
             organization_id,
             orbit_id,
             user_id,
@@ -173,7 +170,7 @@ class OrbitHandler:
             raise NotFoundError("Orbit not found")
 
         orbit.permissions = self.__permissions_handler.get_orbit_permissions_by_role(
-            org_role, orbit_role
+            access.org_role, access.orbit_role
         )
 
         return orbit
@@ -207,7 +204,7 @@ class OrbitHandler:
             Action.DELETE,
         )
 
-        return await self.__orbits_repository.delete_orbit(orbit_id)
+        await self.__orbits_repository.delete_orbit(orbit_id)
 
     async def get_orbit_members(
         self, user_id: int, organization_id: int, orbit_id: int
@@ -224,7 +221,7 @@ class OrbitHandler:
     async def create_orbit_member(
         self, user_id: int, organization_id: int, member: OrbitMemberCreate
     ) -> OrbitMember:
-        await self.__permissions_handler.check_orbit_action_access(
+        access = await self.__permissions_handler.check_orbit_action_access(
             organization_id,
             member.orbit_id,
             user_id,
@@ -248,18 +245,14 @@ class OrbitHandler:
         except IntegrityError as error:
             raise ServiceError("Member already exist.") from error
 
-        orbit = await self.__orbits_repository.get_orbit_simple(
-            member.orbit_id, organization_id
-        )
-
-        self.__email_handler.send_added_to_orbit_email(
+        await self.__email_handler.send_added_to_orbit_email(
             created_member.user.full_name
             if created_member.user and created_member.user.full_name
             else "",
             created_member.user.email
             if created_member.user and created_member.user.email
             else "",
-            orbit.name if orbit else "",
+            access.orbit.name if access.orbit else "",
             config.APP_EMAIL_URL,
         )
 
@@ -122,7 +122,8 @@ class OrganizationHandler:
                 "Organization has members and cant be deleted"
             )
 
-        return await self.__user_repository.delete_organization(organization_id)
+        await self.__user_repository.delete_organization(organization_id)
+        await self.__permissions_handler.invalidate_organization_roles(organization_id)
 
     async def leave_from_organization(self, user_id: int, organization_id: int) -> None:
         await self.__permissions_handler.check_organization_permission(
@@ -132,9 +133,12 @@ class OrganizationHandler:
             Action.LEAVE,
         )
 
-        return await self.__user_repository.delete_organization_member_by_user_id(
+        await self.__user_repository.delete_organization_member_by_user_id(
             user_id, organization_id
         )
+        await self.__permissions_handler.invalidate_organization_member_role(
+            organization_id, user_id
+        )
 
     async def get_user_organizations(self, user_id: int) -> list[OrganizationSwitcher]:
         organizations = await self.__user_repository.get_user_organizations(user_id)
@@ -209,7 +213,7 @@ class OrganizationHandler:
         if not invite:
             raise ServiceError("Cant select created invite")
 
-        self.__email_handler.send_organization_invite_email(
+        await self.__email_handler.send_organization_invite_email(
             invite.email if invite else "",
             get_invited_by_name(invite),
             get_organization_email_name(invite),
@@ -315,9 +319,14 @@ class OrganizationHandler:
         if user_role != OrgRole.OWNER and member.role == OrgRole.ADMIN:
             raise ServiceError("Only Organization Owner can assign new admins.")
 
-        return await self.__user_repository.update_organization_member(
+        updated_member = await self.__user_repository.update_organization_member(
             member_id, member
         )
+        await self.__permissions_handler.invalidate_organization_member_role(
+            organization_id, member_to_update.user.id
+        )
+
+        return updated_member
 
     async def delete_organization_member_by_id(
         self, user_id: int, organization_id: int, member_id: int
@@ -342,7 +351,10 @@ class OrganizationHandler:
         if member_to_delete and member_to_delete.role == OrgRole.OWNER:
             raise ServiceError("Organization Owner can not be removed.")
 
-        return await self.__user_repository.delete_organization_member(member_id)
+        await self.__user_repository.delete_organization_member(member_id)
+        await self.__permissions_handler.invalidate_organization_member_role(
+            organization_id, member_to_delete.user.id
+        )
 
     async def add_organization_member(
         self, user_id: int, organization_id: int, member: OrganizationMemberCreate
@@ -1,20 +1,25 @@
 from collections.abc import Sequence
 
+from dataforce_studio.infra.cache import TTLCache, invalidate, register_local_cache
 from dataforce_studio.infra.db import engine
 from dataforce_studio.infra.exceptions import (
     InsufficientPermissionsError,
     NotFoundError,
 )
+from dataforce_studio.infra.request_cache import get_request_cache
 from dataforce_studio.repositories.orbits import OrbitRepository
 from dataforce_studio.repositories.users import UserRepository
 from dataforce_studio.schemas.orbit import OrbitRole
 from dataforce_studio.schemas.organization import OrgRole
 from dataforce_studio.schemas.permissions import (
     Action,
+    OrbitAccess,
     Resource,
     orbit_permissions,
     organization_permissions,
 )
+from dataforce_studio.schemas.stats import CacheStats
+from dataforce_studio.settings import config
 
 
 class PermissionsHandler:
@@ -22,6 +27,10 @@ class PermissionsHandler:
     __orbits_repository = OrbitRepository(engine)
     __org_permissions = organization_permissions
     __orbit_permissions = orbit_permissions
+    __org_roles_cache: TTLCache[str, str] = TTLCache(
+        "organization_roles", config.ROLES_CACHE_MAXSIZE, config.ROLES_CACHE_TTL
+    )
+    register_local_cache(__org_roles_cache)
 
     def has_organization_permission(
         self, role: str, resource: Resource, action: Action
@@ -35,6 +44,34 @@ class PermissionsHandler:
             resource, []
         )
 
+    async def get_organization_member_role(
+        self, organization_id: int, user_id: int
+    ) -> str | None:
+        key = f"{organization_id}:{user_id}"
+        role = self.__org_roles_cache.get(key)
+
+        if role is None:
+            role = await self.__user_repository.get_organization_member_role(
+                organization_id, user_id
+            )
+            if role:
+                self.__org_roles_cache.set(key, role)
+
+        return role
+
+    async def invalidate_organization_member_role(
+        self, organization_id: int, user_id: int
+    ) -> None:
+        await invalidate(
+            self.__org_roles_cache.name, key=f"{organization_id}:{user_id}"
+        )
+
+    async def invalidate_organization_roles(self, organization_id: int) -> None:
+        await invalidate(self.__org_roles_cache.name, prefix=f"{organization_id}:")
+
+    def get_roles_cache_stats(self) -> list[CacheStats]:
+        return [self.__org_roles_cache.stats()]
+
     async def check_organization_permission(
         self,
         organization_id: int,
@@ -42,7 +79,7 @@ class PermissionsHandler:
         resource: Resource,
         action: Action,
     ) -> str:
-        org_member_role = await self.__user_repository.get_organization_member_role(
+        org_member_role = await self.get_organization_member_role(
             organization_id, user_id
         )
 
@@ -73,6 +110,33 @@ class PermissionsHandler:
 
         return member_role
 
+    async def get_orbit_access(
+        self,
+        organization_id: int,
+        orbit_id: int,
+        user_id: int,
+        collection_id: int | None = None,
+    ) -> OrbitAccess:
+        cache = get_request_cache()
+        key = ("orbit_access", organization_id, orbit_id, user_id, collection_id)
+
+        if cache is not None and key in cache:
+            return cache[key]
+
+        access = await self.__orbits_repository.get_orbit_access(
+            organization_id, orbit_id, user_id, collection_id
+        )
+
+        if not access:
+            raise NotFoundError("User is not member of the organization")
+
+        self.__org_roles_cache.set(f"{organization_id}:{user_id}", access.org_role)
+
+        if cache is not None:
+            cache[key] = access
+
+        return access
+
     async def check_orbit_action_access(
         self,
         organization_id: int,
@@ -80,24 +144,23 @@ class PermissionsHandler:
         user_id: int,
         resource: Resource,
         action: Action,
-    ) -> tuple[None, str] | tuple[str, None]:
-        org_role = await self.check_organization_permission(
-            organization_id,
-            user_id,
-            resource,
-            action,
+        collection_id: int | None = None,
+    ) -> OrbitAccess:
+        access = await self.get_orbit_access(
+            organization_id, orbit_id, user_id, collection_id
         )
 
-        if org_role not in (OrgRole.OWNER, OrgRole.ADMIN):
-            orbit_role = await self.check_orbit_permission(
-                orbit_id,
-                user_id,
-                resource,
-                action,
-            )
-            return None, orbit_role
+        if not self.has_organization_permission(access.org_role, resource, action):
+            raise InsufficientPermissionsError()
+
+        if access.org_role not in (OrgRole.OWNER, OrgRole.ADMIN):
+            if not access.orbit_role:
+                raise NotFoundError("User is not member of the orbit")
+
+            if not self.has_orbit_permission(access.orbit_role, resource, action):
+                raise InsufficientPermissionsError()
 
-        return org_role, None
+        return access
 
     def _get_organization_permissions_for_role_and_resources(
         self,
@@ -1,12 +1,34 @@
-from dataforce_studio.infra.db import engine
+from dataforce_studio.handlers.permissions import PermissionsHandler
+from dataforce_studio.infra.db import engine, get_pool_stats
+from dataforce_studio.infra.executor import get_executors_stats
+from dataforce_studio.infra.storage import get_storage_clients_stats
 from dataforce_studio.repositories.users import UserRepository
-from dataforce_studio.schemas.stats import StatsEmailSendCreate, StatsEmailSendOut
+from dataforce_studio.schemas.stats import (
+    CacheStats,
+    ExecutorStats,
+    PoolStats,
+    StatsEmailSendCreate,
+    StatsEmailSendOut,
+)
 
 
 class StatsHandler:
     __user_repository = UserRepository(engine)
+    __permissions_handler = PermissionsHandler()
 
     async def create_email_send_stat(
         self, stat: StatsEmailSendCreate
     ) -> StatsEmailSendOut:
         return await self.__user_repository.create_stats_email_send_obj(stat)
+
+    def get_cache_stats(self) -> list[CacheStats]:
+        return [
+            *self.__permissions_handler.get_roles_cache_stats(),
+            get_storage_clients_stats(),
+        ]
+
+    def get_executor_stats(self) -> list[ExecutorStats]:
+        return get_executors_stats()
+
+    def get_pool_stats(self) -> PoolStats | None:
+        return get_pool_stats()
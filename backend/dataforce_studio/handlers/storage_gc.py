@@ -0,0 +1,239 @@
+import logging
+import zlib
+from contextlib import suppress
+from datetime import UTC, datetime, timedelta
+from time import perf_counter
+
+from dataforce_studio.infra.db import engine, try_advisory_lock
+from dataforce_studio.infra.exceptions import (
+    NotFoundError,
+    ServiceError,
+    StorageError,
+)
+from dataforce_studio.infra.rate_limiter import RateLimiter
+from dataforce_studio.infra.storage import (
+    MODEL_OBJECT_PATTERN,
+    MODEL_OBJECT_PREFIX,
+    StorageClient,
+    abort_multipart_upload,
+    get_storage_client,
+    list_objects_page,
+    remove_objects,
+    set_storage_client,
+)
+from dataforce_studio.repositories.bucket_secrets import BucketSecretRepository
+from dataforce_studio.repositories.ml_models import MLModelRepository
+from dataforce_studio.schemas.bucket_secrets import BucketSecret
+from dataforce_studio.schemas.ml_models import (
+    MLModelStatus,
+    MLModelUploadUpdate,
+    MLModelWithSecret,
+)
+from dataforce_studio.schemas.stats import StorageGCReport, StorageGCSecretReport
+from dataforce_studio.settings import config
+
+logger = logging.getLogger(__name__)
+
+STORAGE_GC_LOCK_KEY = zlib.crc32(b"storage_gc")
+
+
+class StorageGCHandler:
+    __repository = MLModelRepository(engine)
+    __secret_repository = BucketSecretRepository(engine)
+    __rate_limiters: dict[int, RateLimiter] = {}
+
+    def _get_rate_limiter(self, secret_id: int) -> RateLimiter:
+        if secret_id not in self.__rate_limiters:
+            self.__rate_limiters[secret_id] = RateLimiter(config.STORAGE_GC_RATE_LIMIT)
+        return self.__rate_limiters[secret_id]
+
+    async def _get_storage_client(self, secret_id: int) -> StorageClient:
+        storage_client = get_storage_client(secret_id)
+        if storage_client:
+            return storage_client
+
+        secret = await self.__secret_repository.get_bucket_secret(secret_id)
+        if not secret:
+            raise NotFoundError("Bucket secret not found")
+        return await set_storage_client(secret)
+
+    @staticmethod
+    def _get_report(
+        reports: dict[int, StorageGCSecretReport], secret_id: int
+    ) -> StorageGCSecretReport:
+        if secret_id not in reports:
+            reports[secret_id] = StorageGCSecretReport(bucket_secret_id=secret_id)
+        return reports[secret_id]
+
+    async def _delete_objects(
+        self,
+        storage: StorageClient,
+        object_names: list[str],
+        report: StorageGCSecretReport,
+    ) -> bool:
+        await self._get_rate_limiter(storage.secret.id).acquire(len(object_names))
+        failed = await remove_objects(storage, object_names)
+        report.deleted_objects += len(object_names) - len(failed)
+        report.failed_deletions += len(failed)
+        return not failed
+
+    async def _expire_model(
+        self, item: MLModelWithSecret, report: StorageGCSecretReport, dry_run: bool
+    ) -> None:
+        model = item.model
+        if dry_run:
+            return
+
+        storage = await self._get_storage_client(item.bucket_secret_id)
+        if model.upload_id:
+            await self._get_rate_limiter(item.bucket_secret_id).acquire()
+            with suppress(StorageError):
+                await abort_multipart_upload(
+                    storage, model.bucket_location, model.upload_id
+                )
+
+        if not await self.__repository.get_object_references_count(
+            model.bucket_location, model.id
+        ) and not await self._delete_objects(storage, [model.bucket_location], report):
+            return
+
+        if model.status == MLModelStatus.PENDING_DELETION:
+            await self.__repository.delete_ml_model(model.id)
+        elif model.upload_id:
+            await self.__repository.update_upload(
+                model.id,
+                model.upload_id,
+                MLModelUploadUpdate(
+                    id=model.id, status=MLModelStatus.UPLOAD_FAILED, upload_id=None
+                ),
+            )
+        else:
+            await self.__repository.update_status(
+                model.id,
+                MLModelStatus.UPLOAD_FAILED,
+                current_status=MLModelStatus.PENDING_UPLOAD,
+            )
+
+    async def _expire_stale_models(
+        self,
+        status: MLModelStatus,
+        reports: dict[int, StorageGCSecretReport],
+        dry_run: bool,
+    ) -> None:
+        updated_before = datetime.now(UTC) - timedelta(
+            seconds=config.STORAGE_GC_PENDING_TTL
+        )
+        after_id = 0
+        while True:
+            page = await self.__repository.get_stale_models(
+                status, updated_before, after_id, config.STORAGE_GC_BATCH_SIZE
+            )
+            for item in page:
+                report = self._get_report(reports, item.bucket_secret_id)
+                try:
+                    await self._expire_model(item, report, dry_run)
+                except ServiceError as error:
+                    report.errors.append(f"Model {item.model.id}: {error.message}")
+                    continue
+
+                if status == MLModelStatus.PENDING_DELETION:
+                    report.expired_pending_deletions += 1
+                else:
+                    report.expired_pending_uploads += 1
+
+            if len(page) < config.STORAGE_GC_BATCH_SIZE:
+                break
+            after_id = page[-1].model.id
+
+    async def _collect_orphans(
+        self, secret: BucketSecret, report: StorageGCSecretReport, dry_run: bool
+    ) -> None:
+        storage = await self._get_storage_client(secret.id)
+        rate_limiter = self._get_rate_limiter(secret.id)
+        modified_before = datetime.now(UTC) - timedelta(
+            seconds=config.STORAGE_GC_ORPHAN_GRACE
+        )
+        start_after = None
+        while True:
+            await rate_limiter.acquire()
+            page = await list_objects_page(
+                storage, MODEL_OBJECT_PREFIX, start_after, config.STORAGE_GC_BATCH_SIZE
+            )
+            if not page:
+                break
+
+            report.scanned_objects += len(page)
+            start_after = page[-1].object_name
+            candidates = [
+                obj.object_name
+                for obj in page
+                if obj.object_name
+                and MODEL_OBJECT_PATTERN.match(obj.object_name)
+                and obj.last_modified
+                and obj.last_modified < modified_before
+            ]
+            existing = await self.__repository.get_existing_locations(candidates)
+            orphans = [name for name in candidates if name not in existing]
+
+            report.orphaned_objects += len(orphans)
+            sample_size = config.STORAGE_GC_REPORT_SAMPLE_SIZE
+            report.orphans_sample.extend(
+                orphans[: max(sample_size - len(report.orphans_sample), 0)]
+            )
+            if orphans and not dry_run:
+                await self._delete_objects(storage, orphans, report)
+
+            if len(page) < config.STORAGE_GC_BATCH_SIZE:
+                break
+
+    async def collect_garbage(self, dry_run: bool) -> StorageGCReport:
+        started = perf_counter()
+        reports: dict[int, StorageGCSecretReport] = {}
+
+        await self._expire_stale_models(
+            MLModelStatus.PENDING_DELETION, reports, dry_run
+        )
+        await self._expire_stale_models(MLModelStatus.PENDING_UPLOAD, reports, dry_run)
+
+        after_id = 0
+        while True:
+            secrets = await self.__secret_repository.get_bucket_secrets(
+                after_id, config.STORAGE_GC_BATCH_SIZE
+            )
+            for secret in secrets:
+                report = self._get_report(reports, secret.id)
+                try:
+                    await self._collect_orphans(secret, report, dry_run)
+                except ServiceError as error:
+                    report.errors.append(error.message)
+
+            if len(secrets) < config.STORAGE_GC_BATCH_SIZE:
+                break
+            after_id = secrets[-1].id
+
+        return StorageGCReport(
+            dry_run=dry_run,
+            seconds=perf_counter() - started,
+            secrets=[reports[secret_id] for secret_id in sorted(reports)],
+        )
+
+    async def run_garbage_collection(
+        self, dry_run: bool = config.STORAGE_GC_DRY_RUN
+    ) -> StorageGCReport | None:
+        async with try_advisory_lock(STORAGE_GC_LOCK_KEY) as locked:
+            if not locked:
+                logger.info("Storage garbage collection is running on another worker")
+                return None
+            report = await self.collect_garbage(dry_run)
+
+        logger.info(
+            "Storage garbage collection%s: %d orphaned objects, %d deleted, "
+            "%d pending deletions and %d pending uploads expired in %.3fs",
+            " (dry run)" if dry_run else "",
+            sum(secret.orphaned_objects for secret in report.secrets),
+            sum(secret.deleted_objects for secret in report.secrets),
+            sum(secret.expired_pending_deletions for secret in report.secrets),
+            sum(secret.expired_pending_uploads for secret in report.secrets),
+            report.seconds,
+        )
+        return report
@@ -0,0 +1,20 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+async def run_periodically(
+    job: Callable[[], Awaitable[Any]], interval: float, name: str | None = None
+) -> None:
+    job_name = name or getattr(job, "__name__", "job")
+    while True:
+        try:
+            await job()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Background job %s failed", job_name)
+        await asyncio.sleep(interval)
@@ -0,0 +1,66 @@
+import hashlib
+import math
+import time
+from collections.abc import Iterator
+
+
+class BloomFilter:
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        self.size = max(
+            8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: bytes) -> Iterator[int]:
+        digest = hashlib.blake2b(item, digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hash_count):
+            yield (first + i * second) % self.size
+
+    def add(self, item: bytes) -> None:
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item: bytes) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+
+class ExpiringBloomFilter:
+    def __init__(self, capacity: int, error_rate: float, bucket_seconds: int) -> None:
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.bucket_seconds = bucket_seconds
+        self.loaded = False
+        self._buckets: dict[int, BloomFilter] = {}
+        self._current_bucket = 0
+
+    def add(self, item: bytes, expire_at: int) -> None:
+        if expire_at <= int(time.time()):
+            return
+
+        bucket = expire_at // self.bucket_seconds
+        if bucket not in self._buckets:
+            self._buckets[bucket] = BloomFilter(self.capacity, self.error_rate)
+        self._buckets[bucket].add(item)
+
+    def might_contain(self, item: bytes) -> bool:
+        self.evict_expired()
+        return any(item in bloom for bloom in self._buckets.values())
+
+    def evict_expired(self) -> None:
+        current_bucket = int(time.time()) // self.bucket_seconds
+        if current_bucket == self._current_bucket:
+            return
+
+        self._current_bucket = current_bucket
+        for bucket in [bucket for bucket in self._buckets if bucket < current_bucket]:
+            del self._buckets[bucket]
+
+    def clear(self) -> None:
+        self._buckets.clear()
+        self.loaded = False
@@ -0,0 +1,404 @@
+import asyncio
+import logging
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable
+from contextlib import suppress
+from typing import Any, Generic, TypeVar
+from urllib.parse import urlparse
+
+from pydantic import BaseModel
+
+from dataforce_studio.infra.unit_of_work import after_commit
+from dataforce_studio.schemas.stats import CacheStats
+from dataforce_studio.settings import config
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+INVALIDATION_CHANNEL = "cache-invalidation"
+
+logger = logging.getLogger(__name__)
+
+SubscriptionCallback = Callable[[bool], Awaitable[None]]
+
+
+async def _notify_subscription(
+    on_subscription: SubscriptionCallback | None, subscribed: bool
+) -> None:
+    if on_subscription is None:
+        return
+    try:
+        await on_subscription(subscribed)
+    except Exception:
+        logger.exception("Cache subscription callback failed")
+
+
+class TTLCache(Generic[K, V]):
+    def __init__(self, name: str, maxsize: int, ttl: float) -> None:
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def get(self, key: K) -> V | None:
+        entry = self._data.get(key)
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expire_at, value = entry
+        if expire_at <= time.monotonic():
+            del self._data[key]
+            self.misses += 1
+            return None
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        expire_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._data[key] = (expire_at, value)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def delete(self, key: K) -> None:
+        self._data.pop(key, None)
+
+    def delete_where(self, predicate: Callable[[K], bool]) -> None:
+        for key in [key for key in self._data if predicate(key)]:
+            del self._data[key]
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            name=self.name,
+            size=len(self._data),
+            maxsize=self.maxsize,
+            ttl=self.ttl,
+            hits=self.hits,
+            misses=self.misses,
+        )
+
+
+class Cache(ABC):
+    shared = False
+
+    @abstractmethod
+    async def get(self, key: str) -> str | None: ...
+
+    @abstractmethod
+    async def set(self, key: str, value: str, ttl: float | None = None) -> None: ...
+
+    @abstractmethod
+    async def delete(self, key: str) -> None: ...
+
+    @abstractmethod
+    async def invalidate_prefix(self, prefix: str) -> None: ...
+
+    @abstractmethod
+    async def publish(self, channel: str, message: str) -> None: ...
+
+    @abstractmethod
+    def subscribe(
+        self, channel: str, on_subscription: SubscriptionCallback | None = None
+    ) -> AsyncIterator[str]: ...
+
+    async def close(self) -> None:
+        return None
+
+
+class InMemoryCache(Cache):
+    def __init__(
+        self, maxsize: int = 10_000, default_ttl: float = 3600, name: str = "memory"
+    ) -> None:
+        self._data: TTLCache[str, str] = TTLCache(name, maxsize, default_ttl)
+        self._subscribers: dict[str, set[asyncio.Queue[str]]] = {}
+
+    async def get(self, key: str) -> str | None:
+        return self._data.get(key)
+
+    async def set(self, key: str, value: str, ttl: float | None = None) -> None:
+        self._data.set(key, value, ttl)
+
+    async def delete(self, key: str) -> None:
+        self._data.delete(key)
+
+    async def invalidate_prefix(self, prefix: str) -> None:
+        self._data.delete_where(lambda key: key.startswith(prefix))
+
+    async def publish(self, channel: str, message: str) -> None:
+        for queue in self._subscribers.get(channel, set()):
+            queue.put_nowait(message)
+
+    async def subscribe(
+        self, channel: str, on_subscription: SubscriptionCallback | None = None
+    ) -> AsyncIterator[str]:
+        queue: asyncio.Queue[str] = asyncio.Queue()
+        self._subscribers.setdefault(channel, set()).add(queue)
+        if on_subscription:
+            await on_subscription(True)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self._subscribers[channel].discard(queue)
+
+    def stats(self) -> CacheStats:
+        return self._data.stats()
+
+
+class RedisError(Exception):
+    pass
+
+
+class _RedisConnection:
+    def __init__(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.reader = reader
+        self.writer = writer
+
+    @staticmethod
+    def encode(*args: str | bytes | int | float) -> bytes:
+        parts = [f"*{len(args)}\r\n".encode()]
+        for arg in args:
+            data = arg if isinstance(arg, bytes) else str(arg).encode()
+            parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+        return b"".join(parts)
+
+    async def read_reply(self) -> Any:  # noqa: ANN401
+        line = await self.reader.readline()
+        if not line:
+            raise ConnectionError("Redis connection closed")
+
+        prefix, payload = line[:1], line[1:-2]
+        if prefix == b"+":
+            return payload.decode()
+        if prefix == b"-":
+            raise RedisError(payload.decode())
+        if prefix == b":":
+            return int(payload)
+        if prefix == b"$":
+            length = int(payload)
+            if length == -1:
+                return None
+            data = await self.reader.readexactly(length + 2)
+            return data[:-2]
+        if prefix == b"*":
+            length = int(payload)
+            if length == -1:
+                return None
+            return [await self.read_reply() for _ in range(length)]
+        raise RedisError(f"Unexpected reply: {line!r}")
+
+    async def execute(self, *args: str | bytes | int | float) -> Any:  # noqa: ANN401
+        self.writer.write(self.encode(*args))
+        await self.writer.drain()
+        return await self.read_reply()
+
+    async def close(self) -> None:
+        self.writer.close()
+        with suppress(ConnectionError, OSError):
+            await self.writer.wait_closed()
+
+
+class RedisCache(Cache):
+    shared = True
+
+    def __init__(self, url: str) -> None:
+        parsed = urlparse(url)
+        self._host = parsed.hostname or "localhost"
+        self._port = parsed.port or 6379
+        self._password = parsed.password
+        self._db = int(parsed.path.lstrip("/") or 0)
+        self._ssl = parsed.scheme == "rediss"
+        self._connection: _RedisConnection | None = None
+        self._lock = asyncio.Lock()
+
+    async def _connect(self) -> _RedisConnection:
+        reader, writer = await asyncio.open_connection(
+            self._host, self._port, ssl=self._ssl or None
+        )
+        connection = _RedisConnection(reader, writer)
+        if self._password:
+            await connection.execute("AUTH", self._password)
+        if self._db:
+            await connection.execute("SELECT", self._db)
+        return connection
+
+    async def _execute(self, *args: str | bytes | int | float) -> Any:  # noqa: ANN401
+        async with self._lock:
+            for attempt in range(2):
+                if self._connection is None:
+                    self._connection = await self._connect()
+                try:
+                    return await self._connection.execute(*args)
+                except (ConnectionError, OSError, asyncio.IncompleteReadError):
+                    await self._connection.close()
+                    self._connection = None
+                    if attempt:
+                        raise
+        return None
+
+    async def get(self, key: str) -> str | None:
+        value = await self._execute("GET", key)
+        return value.decode() if value is not None else None
+
+    async def set(self, key: str, value: str, ttl: float | None = None) -> None:
+        if ttl is None:
+            await self._execute("SET", key, value)
+        else:
+            await self._execute("SET", key, value, "PX", max(int(ttl * 1000), 1))
+
+    async def delete(self, key: str) -> None:
+        await self._execute("DEL", key)
+
+    async def invalidate_prefix(self, prefix: str) -> None:
+        pattern = "".join(f"\\{c}" if c in "*?[]\\" else c for c in prefix) + "*"
+        cursor = b"0"
+        while True:
+            cursor, keys = await self._execute(
+                "SCAN", cursor, "MATCH", pattern, "COUNT", 500
+            )
+            if keys:
+                await self._execute("DEL", *keys)
+            if cursor == b"0":
+                break
+
+    async def publish(self, channel: str, message: str) -> None:
+        await self._execute("PUBLISH", channel, message)
+
+    async def subscribe(
+        self, channel: str, on_subscription: SubscriptionCallback | None = None
+    ) -> AsyncIterator[str]:
+        while True:
+            connection = None
+            try:
+                connection = await self._connect()
+                await connection.execute("SUBSCRIBE", channel)
+                if on_subscription:
+                    await on_subscription(True)
+                while True:
+                    reply = await connection.read_reply()
+                    if isinstance(reply, list) and reply[0] == b"message":
+                        yield reply[2].decode()
+            except (
+                ConnectionError,
+                OSError,
+                asyncio.IncompleteReadError,
+                RedisError,
+            ) as error:
+                logger.warning("Cache subscription lost: %s", error)
+            except Exception:
+                logger.exception("Cache subscription to %s failed", channel)
+            finally:
+                if connection:
+                    await connection.close()
+            await _notify_subscription(on_subscription, False)
+            await asyncio.sleep(1)
+
+    async def close(self) -> None:
+        if self._connection:
+            await self._connection.close()
+            self._connection = None
+
+
+def create_cache(url: str | None) -> Cache:
+    if not url or url.startswith("memory://"):
+        return InMemoryCache()
+    if url.startswith(("redis://", "rediss://")):
+        return RedisCache(url)
+    raise ValueError(f"Unsupported cache url: {url}")
+
+
+_cache: Cache | None = None
+
+
+def get_cache() -> Cache:
+    global _cache
+    if _cache is None:
+        _cache = create_cache(config.CACHE_URL)
+    return _cache
+
+
+def set_cache(cache: Cache | None) -> None:
+    global _cache
+    _cache = cache
+
+
+async def broadcast(channel: str, message: str) -> None:
+    try:
+        await get_cache().publish(channel, message)
+    except (ConnectionError, OSError, RedisError) as error:
+        logger.warning("Failed to publish to %s: %s", channel, error)
+
+
+class CacheInvalidation(BaseModel):
+    cache: str
+    key: str | None = None
+    prefix: str | None = None
+
+
+_local_caches: dict[str, TTLCache[str, Any]] = {}
+
+
+def register_local_cache(cache: TTLCache[str, Any]) -> None:
+    _local_caches[cache.name] = cache
+
+
+def apply_invalidation(invalidation: CacheInvalidation) -> None:
+    local_cache = _local_caches.get(invalidation.cache)
+    if local_cache is None:
+        return
+
+    if invalidation.key is not None:
+        local_cache.delete(invalidation.key)
+    if invalidation.prefix is not None:
+        prefix = invalidation.prefix
+        local_cache.delete_where(lambda key: key.startswith(prefix))
+
+
+async def invalidate(
+    cache_name: str, key: str | None = None, prefix: str | None = None
+) -> None:
+    invalidation = CacheInvalidation(cache=cache_name, key=key, prefix=prefix)
+
+    async def publish() -> None:
+        apply_invalidation(invalidation)
+        await broadcast(
+            INVALIDATION_CHANNEL, invalidation.model_dump_json(exclude_none=True)
+        )
+
+    await after_commit(publish)
+
+
+def clear_local_caches() -> None:
+    for local_cache in _local_caches.values():
+        local_cache.clear()
+
+
+async def listen_for_invalidations() -> None:
+    lost = False
+
+    async def on_subscription(subscribed: bool) -> None:
+        nonlocal lost
+        if lost or not subscribed:
+            clear_local_caches()
+        lost = not subscribed
+
+    async for message in get_cache().subscribe(INVALIDATION_CHANNEL, on_subscription):
+        try:
+            apply_invalidation(CacheInvalidation.model_validate_json(message))
+        except Exception:
+            logger.exception("Failed to apply cache invalidation %s", message)
+            clear_local_caches()
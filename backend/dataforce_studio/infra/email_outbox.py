@@ -0,0 +1,198 @@
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+
+from sendgrid import SendGridAPIClient  # type: ignore
+from sendgrid.helpers.mail import Mail, Personalization, To  # type: ignore
+
+from dataforce_studio.infra.rate_limiter import RateLimiter
+from dataforce_studio.schemas.emails import EmailMessage
+
+logger = logging.getLogger(__name__)
+
+DeliveryCallback = Callable[[list[EmailMessage], Exception | None], Awaitable[None]]
+
+
+class EmailRejectedError(Exception):
+    def __init__(self, message: str, status_code: int = 400) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def is_transient_error(error: Exception) -> bool:
+    status_code = getattr(error, "status_code", None)
+    if isinstance(status_code, int):
+        return status_code == 429 or status_code >= 500
+    return isinstance(error, ConnectionError | TimeoutError | OSError)
+
+
+class EmailTransport(ABC):
+    @abstractmethod
+    async def send(self, messages: list[EmailMessage]) -> None: ...
+
+
+class SendGridTransport(EmailTransport):
+    def __init__(self, api_key: str) -> None:
+        self._client = SendGridAPIClient(api_key)
+
+    @staticmethod
+    def build_mail(messages: list[EmailMessage]) -> Mail:
+        first = messages[0]
+        mail = Mail(from_email=str(first.from_email), subject=first.subject)
+        mail.template_id = first.template_id
+        for message in messages:
+            personalization = Personalization()
+            personalization.add_to(To(str(message.email)))
+            personalization.dynamic_template_data = message.data
+            mail.add_personalization(personalization)
+        return mail
+
+    async def send(self, messages: list[EmailMessage]) -> None:
+        await asyncio.to_thread(self._client.send, self.build_mail(messages))
+
+
+class FakeEmailTransport(EmailTransport):
+    def __init__(self, failures: int = 0, rejected: set[str] | None = None) -> None:
+        self.failures = failures
+        self.rejected = rejected or set()
+        self.attempts = 0
+        self.sent: list[list[EmailMessage]] = []
+
+    async def send(self, messages: list[EmailMessage]) -> None:
+        self.attempts += 1
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("Fake transport failure")
+        if any(str(message.email) in self.rejected for message in messages):
+            raise EmailRejectedError("Fake transport rejected a recipient")
+        self.sent.append(messages)
+
+
+def create_email_transport(name: str, api_key: str) -> EmailTransport:
+    if name == "sendgrid":
+        return SendGridTransport(api_key)
+    if name == "fake":
+        return FakeEmailTransport()
+    raise ValueError(f"Unsupported email transport: {name}")
+
+
+class EmailOutbox:
+    def __init__(
+        self,
+        transport: EmailTransport,
+        workers: int = 2,
+        queue_size: int = 10_000,
+        batch_size: int = 50,
+        rate_limit: float = 10,
+        max_attempts: int = 5,
+        retry_delay: float = 1,
+        on_delivery: DeliveryCallback | None = None,
+    ) -> None:
+        self.transport = transport
+        self.workers = workers
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.on_delivery = on_delivery
+        self.rate_limiter = RateLimiter(rate_limit)
+        self.sent = 0
+        self.failed = 0
+        self.dropped = 0
+        self._queue: asyncio.Queue[EmailMessage] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._tasks: list[asyncio.Task[None]] = []
+
+    def _ensure_started(self) -> asyncio.Queue[EmailMessage]:
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue(self.queue_size)
+            self._tasks = [
+                loop.create_task(self._work(self._queue)) for _ in range(self.workers)
+            ]
+        return self._queue
+
+    def enqueue(self, message: EmailMessage) -> None:
+        queue = self._ensure_started()
+        try:
+            queue.put_nowait(message)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            logger.error("Email outbox is full, dropping email to %s", message.email)
+
+    @staticmethod
+    def _group(messages: list[EmailMessage]) -> list[list[EmailMessage]]:
+        groups: dict[tuple[str, str, str | None], list[EmailMessage]] = {}
+        for message in messages:
+            key = (str(message.from_email), message.template_id, message.subject)
+            groups.setdefault(key, []).append(message)
+        return list(groups.values())
+
+    async def _work(self, queue: asyncio.Queue[EmailMessage]) -> None:
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self.batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+            try:
+                for group in self._group(batch):
+                    await self._deliver(group)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _send(self, messages: list[EmailMessage]) -> Exception | None:
+        for attempt in range(1, self.max_attempts + 1):
+            await self.rate_limiter.acquire(len(messages))
+            try:
+                await self.transport.send(messages)
+                return None
+            except Exception as error:
+                if not is_transient_error(error):
+                    logger.warning("Email delivery rejected: %s", error)
+                    return error
+                logger.warning(
+                    "Email delivery attempt %s/%s failed: %s",
+                    attempt,
+                    self.max_attempts,
+                    error,
+                )
+                if attempt == self.max_attempts:
+                    return error
+                await asyncio.sleep(self.retry_delay * 2 ** (attempt - 1))
+        return None
+
+    async def _deliver(self, messages: list[EmailMessage]) -> None:
+        error = await self._send(messages)
+        if error is not None and len(messages) > 1 and not is_transient_error(error):
+            for message in messages:
+                await self._deliver([message])
+            return
+
+        if error is None:
+            self.sent += len(messages)
+        else:
+            self.failed += len(messages)
+
+        if self.on_delivery:
+            try:
+                await self.on_delivery(messages, error)
+            except Exception:
+                logger.exception("Failed to record email delivery")
+
+    async def flush(self) -> None:
+        if self._queue is not None and self._loop is asyncio.get_running_loop():
+            await self._queue.join()
+
+    async def close(self, timeout: float = 10) -> None:
+        if self._loop is asyncio.get_running_loop():
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self.flush(), timeout)
+            for task in self._tasks:
+                task.cancel()
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = None
+        self._loop = None
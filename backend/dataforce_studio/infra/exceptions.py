@@ -125,3 +125,51 @@ class BucketSecretInUseError(ServiceError):
             message=message,
             status_code=status_code,
         )
+
+
+class ServiceBusyError(ServiceError):
+    def __init__(
+        self,
+        message: str = "Service is busy, try again later",
+        status_code: int = status.HTTP_503_SERVICE_UNAVAILABLE,
+    ) -> None:
+        super().__init__(
+            message=message,
+            status_code=status_code,
+        )
+
+
+class StorageError(ServiceError):
+    def __init__(
+        self,
+        message: str = "Storage request failed",
+        status_code: int = status.HTTP_502_BAD_GATEWAY,
+    ) -> None:
+        super().__init__(
+            message=message,
+            status_code=status_code,
+        )
+
+
+class InvalidCursorError(ServiceError):
+    def __init__(
+        self,
+        message: str = "Invalid cursor",
+        status_code: int = status.HTTP_400_BAD_REQUEST,
+    ) -> None:
+        super().__init__(
+            message=message,
+            status_code=status_code,
+        )
+
+
+class InvalidMetricFilterError(ServiceError):
+    def __init__(
+        self,
+        message: str = "Invalid metric filter",
+        status_code: int = status.HTTP_400_BAD_REQUEST,
+    ) -> None:
+        super().__init__(
+            message=message,
+            status_code=status_code,
+        )
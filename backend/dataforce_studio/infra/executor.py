@@ -0,0 +1,78 @@
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from typing import ParamSpec, TypeVar
+
+from dataforce_studio.infra.exceptions import ServiceBusyError
+from dataforce_studio.schemas.stats import ExecutorStats
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+class BoundedExecutor:
+    def __init__(self, name: str, max_workers: int, max_queue: int) -> None:
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.queue_wait_seconds = 0.0
+        self.max_queue_wait_seconds = 0.0
+        self.run_seconds = 0.0
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix=name)
+
+    async def run(self, func: Callable[P, R], *args: P.args, **kwargs: P.kwargs) -> R:
+        if self.pending >= self.max_workers + self.max_queue:
+            self.rejected += 1
+            raise ServiceBusyError()
+
+        submitted_at = perf_counter()
+        started_at = submitted_at
+
+        def call() -> R:
+            nonlocal started_at
+            started_at = perf_counter()
+            return func(*args, **kwargs)
+
+        self.pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor, call
+            )
+        finally:
+            self.pending -= 1
+            self.completed += 1
+            queue_wait = started_at - submitted_at
+            self.queue_wait_seconds += queue_wait
+            self.max_queue_wait_seconds = max(self.max_queue_wait_seconds, queue_wait)
+            self.run_seconds += perf_counter() - started_at
+
+    def stats(self) -> ExecutorStats:
+        return ExecutorStats(
+            name=self.name,
+            max_workers=self.max_workers,
+            max_queue=self.max_queue,
+            pending=self.pending,
+            completed=self.completed,
+            rejected=self.rejected,
+            queue_wait_seconds=self.queue_wait_seconds,
+            max_queue_wait_seconds=self.max_queue_wait_seconds,
+            run_seconds=self.run_seconds,
+        )
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_executors: dict[str, BoundedExecutor] = {}
+
+
+def register_executor(executor: BoundedExecutor) -> None:
+    _executors[executor.name] = executor
+
+
+def get_executors_stats() -> list[ExecutorStats]:
+    return [executor.stats() for executor in _executors.values()]
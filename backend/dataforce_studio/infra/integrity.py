@@ -0,0 +1,87 @@
+import asyncio
+import hashlib
+import logging
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable
+from typing import NamedTuple
+
+from dataforce_studio.infra.storage import ObjectStream
+
+logger = logging.getLogger(__name__)
+
+
+class ObjectDigest(NamedTuple):
+    size: int
+    sha256: str
+
+
+async def digest_chunks(chunks: AsyncIterator[bytes]) -> ObjectDigest:
+    hasher = hashlib.sha256()
+    size = 0
+    async for chunk in chunks:
+        size += len(chunk)
+        await asyncio.to_thread(hasher.update, chunk)
+    return ObjectDigest(size, hasher.hexdigest())
+
+
+async def verify_object(stream: ObjectStream, size: int, sha256: str) -> bool:
+    try:
+        if stream.size not in (-1, size):
+            return False
+        digest = await digest_chunks(stream.chunks)
+    finally:
+        await stream.close()
+    return digest == ObjectDigest(size, sha256.lower())
+
+
+class IntegrityVerifier:
+    def __init__(self, concurrency: int) -> None:
+        self.concurrency = concurrency
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._tasks: dict[Hashable, asyncio.Task[None]] = {}
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+            self._tasks = {}
+        return self._semaphore
+
+    @property
+    def pending(self) -> int:
+        return len(self._tasks)
+
+    def schedule(self, key: Hashable, job: Callable[[], Awaitable[None]]) -> bool:
+        semaphore = self._get_semaphore()
+        if key in self._tasks:
+            return False
+
+        task = asyncio.get_running_loop().create_task(self._run(semaphore, key, job))
+        self._tasks[key] = task
+        task.add_done_callback(lambda _: self._tasks.pop(key, None))
+        return True
+
+    @staticmethod
+    async def _run(
+        semaphore: asyncio.Semaphore, key: Hashable, job: Callable[[], Awaitable[None]]
+    ) -> None:
+        async with semaphore:
+            try:
+                await job()
+            except Exception:
+                logger.exception("Integrity verification %s failed", key)
+
+    async def wait(self) -> None:
+        if self._loop is asyncio.get_running_loop():
+            await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+
+    async def close(self) -> None:
+        if self._loop is asyncio.get_running_loop():
+            tasks = list(self._tasks.values())
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks = {}
+        self._semaphore = None
+        self._loop = None
@@ -0,0 +1,36 @@
+import base64
+import binascii
+import math
+from datetime import datetime
+
+from dataforce_studio.infra.exceptions import InvalidCursorError
+
+
+def encode_cursor(sort_key: datetime | float, row_id: int) -> str:
+    key = sort_key.isoformat() if isinstance(sort_key, datetime) else repr(sort_key)
+    raw = f"{key}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _split_cursor(cursor: str) -> tuple[str, int]:
+    raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+    sort_key, row_id = raw.split("|")
+    return sort_key, int(row_id)
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        created_at, row_id = _split_cursor(cursor)
+        return datetime.fromisoformat(created_at), row_id
+    except (binascii.Error, UnicodeDecodeError, ValueError) as error:
+        raise InvalidCursorError() from error
+
+
+def decode_metric_cursor(cursor: str) -> tuple[float, int]:
+    try:
+        value, row_id = _split_cursor(cursor)
+        if not math.isfinite(float(value)):
+            raise ValueError(value)
+        return float(value), row_id
+    except (binascii.Error, UnicodeDecodeError, ValueError) as error:
+        raise InvalidCursorError() from error
@@ -0,0 +1,144 @@
+import hashlib
+import hmac
+from datetime import UTC, datetime, timedelta
+from urllib.parse import SplitResult, quote, urlunsplit
+
+from minio.helpers import BaseURL, DictType
+
+from dataforce_studio.schemas.bucket_secrets import BucketSecret
+
+UNSIGNED_PAYLOAD = "UNSIGNED-PAYLOAD"
+MAX_EXPIRES = 604800
+
+
+def _encode(value: str, safe: str = "") -> str:
+    return quote(value, safe=safe)
+
+
+def _hmac(key: bytes, data: str) -> bytes:
+    return hmac.new(key, data.encode(), hashlib.sha256).digest()
+
+
+class S3Presigner:
+    def __init__(
+        self,
+        endpoint: str,
+        access_key: str | None = None,
+        secret_key: str | None = None,
+        session_token: str | None = None,
+        secure: bool = True,
+        region: str | None = None,
+    ) -> None:
+        self._base_url = BaseURL(
+            ("https://" if secure else "http://") + endpoint, region
+        )
+        if not self._base_url.region:
+            raise ValueError("Bucket region is required to presign URLs")
+        self.region: str = self._base_url.region
+        self.access_key = access_key
+        self.secret_key = secret_key
+        self.session_token = session_token
+        self._signing_key: tuple[str, bytes] | None = None
+
+    @classmethod
+    def from_bucket_secret(
+        cls, secret: BucketSecret, region: str | None = None
+    ) -> "S3Presigner":
+        return cls(
+            secret.endpoint,
+            access_key=secret.access_key,
+            secret_key=secret.secret_key,
+            session_token=secret.session_token,
+            secure=secret.secure if secret.secure is not None else True,
+            region=region or secret.region,
+        )
+
+    def _get_signing_key(self, signer_date: str) -> bytes:
+        if self._signing_key and self._signing_key[0] == signer_date:
+            return self._signing_key[1]
+
+        key = _hmac(f"AWS4{self.secret_key}".encode(), signer_date)
+        for part in (self.region, "s3", "aws4_request"):
+            key = _hmac(key, part)
+        self._signing_key = (signer_date, key)
+        return key
+
+    @staticmethod
+    def _canonical_query(query: str) -> str:
+        return "&".join(sorted(query.split("&"), key=lambda pair: pair.split("=")))
+
+    def presign(
+        self,
+        method: str,
+        bucket_name: str,
+        object_name: str,
+        expires: timedelta = timedelta(hours=1),
+        request_date: datetime | None = None,
+        query_params: dict[str, str] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> str:
+        seconds = int(expires.total_seconds())
+        if seconds < 1 or seconds > MAX_EXPIRES:
+            raise ValueError("expires must be between 1 second to 7 days")
+
+        params: DictType = dict(query_params or {})
+        if self.access_key and self.session_token:
+            params["X-Amz-Security-Token"] = self.session_token
+        url: SplitResult = self._base_url.build(
+            method,
+            self.region,
+            bucket_name=bucket_name,
+            object_name=object_name,
+            query_params=params,
+        )
+        if not self.access_key or self.secret_key is None:
+            return urlunsplit(url)
+
+        date = request_date or datetime.now(UTC)
+        date = date.replace(tzinfo=UTC) if date.tzinfo is None else date.astimezone(UTC)
+        amz_date = date.strftime("%Y%m%dT%H%M%SZ")
+        signer_date = date.strftime("%Y%m%d")
+        scope = f"{signer_date}/{self.region}/s3/aws4_request"
+
+        signed = {"host": url.netloc} | {
+            name.lower(): " ".join(value.split())
+            for name, value in (headers or {}).items()
+        }
+        signed_headers = ";".join(sorted(signed))
+        canonical_headers = "".join(
+            f"{name}:{signed[name]}\n" for name in sorted(signed)
+        )
+
+        query = f"{url.query}&" if url.query else ""
+        query += (
+            "X-Amz-Algorithm=AWS4-HMAC-SHA256"
+            f"&X-Amz-Credential={_encode(f'{self.access_key}/{scope}')}"
+            f"&X-Amz-Date={amz_date}"
+            f"&X-Amz-Expires={seconds}"
+            f"&X-Amz-SignedHeaders={_encode(signed_headers)}"
+        )
+        canonical_request = "\n".join(
+            (
+                method,
+                url.path or "/",
+                self._canonical_query(query),
+                canonical_headers,
+                signed_headers,
+                UNSIGNED_PAYLOAD,
+            )
+        )
+        string_to_sign = "\n".join(
+            (
+                "AWS4-HMAC-SHA256",
+                amz_date,
+                scope,
+                hashlib.sha256(canonical_request.encode()).hexdigest(),
+            )
+        )
+        signature = hmac.new(
+            self._get_signing_key(signer_date),
+            string_to_sign.encode(),
+            hashlib.sha256,
+        ).hexdigest()
+
+        return urlunsplit(url._replace(query=f"{query}&X-Amz-Signature={signature}"))
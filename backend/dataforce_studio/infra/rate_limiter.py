@@ -0,0 +1,30 @@
+import asyncio
+from time import monotonic
+
+
+class RateLimiter:
+    def __init__(self, rate: float, burst: float | None = None) -> None:
+        self.rate = rate
+        self.capacity = max(burst or rate, 1)
+        self._tokens = self.capacity
+        self._updated_at = monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated_at) * self.rate
+        )
+        self._updated_at = now
+
+    async def acquire(self, tokens: float = 1) -> None:
+        if self.rate <= 0:
+            return
+
+        async with self._lock:
+            required = min(tokens, self.capacity)
+            self._refill()
+            while self._tokens < required:
+                await asyncio.sleep((required - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= tokens
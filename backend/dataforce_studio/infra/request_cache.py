@@ -0,0 +1,28 @@
+from contextvars import ContextVar
+from typing import Any
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+_request_cache: ContextVar[dict[Any, Any] | None] = ContextVar(
+    "request_cache", default=None
+)
+
+
+def get_request_cache() -> dict[Any, Any] | None:
+    return _request_cache.get()
+
+
+class RequestCacheMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        token = _request_cache.set({})
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _request_cache.reset(token)
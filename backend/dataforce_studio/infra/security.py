@@ -32,14 +32,7 @@ class JWTAuthenticationBackend(AuthenticationBackend):
                 return None
 
             try:
-                email = self.auth_handler._verify_token(token)
-                user = await self.auth_handler.handle_get_current_user(email)
-                auth_user = AuthUser(
-                    user_id=user.id,
-                    email=user.email,
-                    full_name=user.full_name,
-                    disabled=user.disabled,
-                )
+                auth_user = await self.auth_handler.get_auth_user(token)
                 return AuthCredentials(["authenticated"]), auth_user
             except AuthError:
                 return None
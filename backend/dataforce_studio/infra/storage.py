@@ -0,0 +1,293 @@
+import asyncio
+import re
+from collections.abc import AsyncIterator, Awaitable, Callable
+from datetime import timedelta
+from itertools import islice
+from typing import NamedTuple, ParamSpec, TypeVar
+
+import httpx
+from minio import Minio
+from minio.datatypes import Object, Part
+from minio.deleteobjects import DeleteObject
+from minio.error import MinioException
+from urllib3.exceptions import HTTPError
+
+from dataforce_studio.infra.cache import TTLCache, invalidate, register_local_cache
+from dataforce_studio.infra.exceptions import (
+    NotFoundError,
+    ServiceError,
+    StorageError,
+)
+from dataforce_studio.infra.presigner import S3Presigner
+from dataforce_studio.infra.unit_of_work import release_unit_of_work
+from dataforce_studio.schemas.bucket_secrets import (
+    BucketSecret,
+    BucketSecretCreate,
+    BucketSecretUpdate,
+)
+from dataforce_studio.schemas.stats import CacheStats
+from dataforce_studio.settings import config
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+MIN_PART_SIZE = 5 * 1024**2
+MAX_PART_SIZE = 5 * 1024**3
+MAX_PARTS = 10_000
+
+MODEL_OBJECT_PREFIX = "orbit-"
+MODEL_OBJECT_PATTERN = re.compile(r"orbit-\d+/collection-\d+/[0-9a-f]{32}-")
+
+
+class StorageClient(NamedTuple):
+    secret: BucketSecret
+    client: Minio
+    presigner: S3Presigner
+
+
+_storage_clients: TTLCache[str, StorageClient] = TTLCache(
+    "storage_clients",
+    config.STORAGE_CLIENTS_CACHE_MAXSIZE,
+    config.STORAGE_CLIENTS_CACHE_TTL,
+)
+register_local_cache(_storage_clients)
+
+
+def create_minio_client(
+    secret: BucketSecret | BucketSecretCreate | BucketSecretUpdate,
+) -> Minio:
+    return Minio(
+        secret.endpoint,
+        access_key=secret.access_key,
+        secret_key=secret.secret_key,
+        session_token=secret.session_token,
+        secure=secret.secure if secret.secure is not None else True,
+        region=secret.region,
+        cert_check=secret.cert_check if secret.cert_check is not None else True,
+    )
+
+
+def get_storage_client(secret_id: int) -> StorageClient | None:
+    return _storage_clients.get(str(secret_id))
+
+
+async def resolve_bucket_region(
+    secret: BucketSecret | BucketSecretCreate | BucketSecretUpdate,
+    client: Minio | None = None,
+) -> str:
+    if secret.region:
+        return secret.region
+    client = client or create_minio_client(secret)
+    return await _call(client._get_region, secret.bucket_name)
+
+
+async def set_storage_client(secret: BucketSecret) -> StorageClient:
+    client = create_minio_client(secret)
+    region = await resolve_bucket_region(secret, client)
+    storage_client = StorageClient(
+        secret, client, S3Presigner.from_bucket_secret(secret, region)
+    )
+    _storage_clients.set(str(secret.id), storage_client)
+    return storage_client
+
+
+async def invalidate_storage_client(secret_id: int) -> None:
+    await invalidate(_storage_clients.name, key=str(secret_id))
+
+
+def get_storage_clients_stats() -> CacheStats:
+    return _storage_clients.stats()
+
+
+class ObjectStream(NamedTuple):
+    chunks: AsyncIterator[bytes]
+    size: int
+    close: Callable[[], Awaitable[None]]
+
+
+def choose_part_size(size: int) -> tuple[int, int]:
+    part_size = max(config.MULTIPART_PART_SIZE, MIN_PART_SIZE, -(-size // MAX_PARTS))
+    part_size = -(-part_size // 1024**2) * 1024**2
+    if part_size > MAX_PART_SIZE:
+        raise ServiceError("Model file is too large", 413)
+    return part_size, max(1, -(-size // part_size))
+
+
+async def _call(func: Callable[P, R], *args: P.args, **kwargs: P.kwargs) -> R:
+    try:
+        return await asyncio.to_thread(func, *args, **kwargs)
+    except (MinioException, HTTPError) as error:
+        raise StorageError(f"Storage request failed: {error}") from error
+
+
+async def _run(func: Callable[P, R], *args: P.args, **kwargs: P.kwargs) -> R:
+    await release_unit_of_work()
+    return await _call(func, *args, **kwargs)
+
+
+# minio has no public multipart or region API. The private methods used below
+# are tied to the exact minio pin and their signatures are checked in tests.
+async def create_multipart_upload(storage: StorageClient, object_name: str) -> str:
+    return await _run(
+        storage.client._create_multipart_upload,
+        storage.secret.bucket_name,
+        object_name,
+        {},
+    )
+
+
+def presign_upload_part(
+    storage: StorageClient,
+    object_name: str,
+    upload_id: str,
+    part_number: int,
+    expires: timedelta = timedelta(hours=1),
+) -> str:
+    return storage.presigner.presign(
+        "PUT",
+        storage.secret.bucket_name,
+        object_name,
+        expires=expires,
+        query_params={"partNumber": str(part_number), "uploadId": upload_id},
+    )
+
+
+def _list_all_parts(
+    storage: StorageClient, object_name: str, upload_id: str
+) -> list[Part]:
+    parts: list[Part] = []
+    marker: str | None = None
+    while True:
+        result = storage.client._list_parts(
+            storage.secret.bucket_name,
+            object_name,
+            upload_id,
+            part_number_marker=marker,
+        )
+        parts.extend(result.parts)
+        if not result.is_truncated:
+            return parts
+        marker = str(result.next_part_number_marker)
+
+
+async def list_uploaded_parts(
+    storage: StorageClient, object_name: str, upload_id: str
+) -> list[Part]:
+    return await _run(_list_all_parts, storage, object_name, upload_id)
+
+
+async def complete_multipart_upload(
+    storage: StorageClient, object_name: str, upload_id: str, parts: list[Part]
+) -> None:
+    await _run(
+        storage.client._complete_multipart_upload,
+        storage.secret.bucket_name,
+        object_name,
+        upload_id,
+        parts,
+    )
+
+
+async def abort_multipart_upload(
+    storage: StorageClient, object_name: str, upload_id: str
+) -> None:
+    await _run(
+        storage.client._abort_multipart_upload,
+        storage.secret.bucket_name,
+        object_name,
+        upload_id,
+    )
+
+
+def _list_objects_page(
+    storage: StorageClient, prefix: str, start_after: str | None, limit: int
+) -> list[Object]:
+    objects = storage.client.list_objects(
+        storage.secret.bucket_name,
+        prefix=prefix,
+        recursive=True,
+        start_after=start_after,
+    )
+    return list(islice(objects, limit))
+
+
+async def list_objects_page(
+    storage: StorageClient, prefix: str, start_after: str | None, limit: int
+) -> list[Object]:
+    return await _run(_list_objects_page, storage, prefix, start_after, limit)
+
+
+def _remove_objects(storage: StorageClient, object_names: list[str]) -> list[str]:
+    errors = storage.client.remove_objects(
+        storage.secret.bucket_name, [DeleteObject(name) for name in object_names]
+    )
+    return [error.name or "" for error in errors]
+
+
+async def remove_objects(storage: StorageClient, object_names: list[str]) -> list[str]:
+    if not object_names:
+        return []
+    return await _run(_remove_objects, storage, object_names)
+
+
+def range_header(offset: int, size: int) -> dict[str, str]:
+    return {"Range": f"bytes={offset}-{offset + size - 1}"}
+
+
+async def _empty_chunks() -> AsyncIterator[bytes]:
+    empty: tuple[bytes, ...] = ()
+    for chunk in empty:
+        yield chunk
+
+
+async def _close_nothing() -> None:
+    return None
+
+
+async def _open_stream(
+    url: str, headers: dict[str, str], expected_status: int
+) -> tuple[httpx.Response, Callable[[], Awaitable[None]]]:
+    await release_unit_of_work()
+    client = httpx.AsyncClient(timeout=config.STORAGE_STREAM_TIMEOUT)
+    try:
+        response = await client.send(
+            client.build_request("GET", url, headers=headers), stream=True
+        )
+    except httpx.HTTPError as error:
+        await client.aclose()
+        raise StorageError(f"Storage request failed: {error}") from error
+
+    async def close() -> None:
+        await response.aclose()
+        await client.aclose()
+
+    if response.status_code != expected_status:
+        await close()
+        if response.status_code == httpx.codes.NOT_FOUND:
+            raise NotFoundError("Object not found in storage")
+        raise StorageError(f"Storage responded with {response.status_code}")
+    return response, close
+
+
+async def open_object(url: str) -> ObjectStream:
+    response, close = await _open_stream(url, {}, httpx.codes.OK)
+    size = int(response.headers.get("Content-Length", -1))
+    return ObjectStream(
+        response.aiter_bytes(config.STORAGE_STREAM_CHUNK_SIZE), size, close
+    )
+
+
+def empty_object() -> ObjectStream:
+    return ObjectStream(_empty_chunks(), 0, _close_nothing)
+
+
+async def open_object_range(url: str, offset: int, size: int) -> ObjectStream:
+    if not size:
+        return empty_object()
+
+    response, close = await _open_stream(
+        url, range_header(offset, size), httpx.codes.PARTIAL_CONTENT
+    )
+    return ObjectStream(
+        response.aiter_bytes(config.STORAGE_STREAM_CHUNK_SIZE), size, close
+    )
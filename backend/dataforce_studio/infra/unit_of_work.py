@@ -0,0 +1,153 @@
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, AsyncSessionTransaction
+from sqlalchemy.orm import ORMExecuteState, Session
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from dataforce_studio.infra.db import engine
+
+AfterCommit = Callable[[], Awaitable[None]]
+
+
+class CurrentStateSession(Session):
+    pass
+
+
+@event.listens_for(CurrentStateSession, "do_orm_execute")
+def _populate_existing(state: ORMExecuteState) -> None:
+    if state.is_select:
+        state.update_execution_options(populate_existing=True)
+
+
+class RepositorySession(AsyncSession):
+    sync_session_class = CurrentStateSession
+
+    def __init__(self, db_engine: AsyncEngine) -> None:
+        super().__init__(db_engine, expire_on_commit=False)
+
+
+class UnitOfWorkSession(RepositorySession):
+    async def commit(self) -> None:
+        await self.flush()
+
+    def begin(self) -> AsyncSessionTransaction:
+        if self.in_transaction():
+            return self.begin_nested()
+        return super().begin()
+
+    async def commit_unit(self) -> None:
+        await super().commit()
+
+
+class UnitOfWork:
+    def __init__(self, db_engine: AsyncEngine) -> None:
+        self.session = UnitOfWorkSession(db_engine)
+        self.task = asyncio.current_task()
+        self.active = True
+        self.after_commit: list[AfterCommit] = []
+
+    def is_current(self) -> bool:
+        return self.active and self.task is asyncio.current_task()
+
+    def joins(self, db_engine: AsyncEngine) -> bool:
+        return self.is_current() and self.session.bind is db_engine
+
+    async def _commit(self) -> None:
+        await self.session.commit_unit()
+        callbacks, self.after_commit = self.after_commit, []
+        for callback in callbacks:
+            await callback()
+
+    async def commit(self) -> None:
+        self.active = False
+        await self._commit()
+
+    async def release(self) -> None:
+        if not self.session.in_nested_transaction():
+            await self._commit()
+
+    async def rollback(self) -> None:
+        self.active = False
+        self.after_commit.clear()
+        await self.session.rollback()
+
+    async def close(self) -> None:
+        self.active = False
+        await self.session.close()
+
+
+_unit_of_work: ContextVar[UnitOfWork | None] = ContextVar("unit_of_work", default=None)
+
+
+def get_unit_of_work_session(db_engine: AsyncEngine) -> AsyncSession | None:
+    work = _unit_of_work.get()
+    return work.session if work and work.joins(db_engine) else None
+
+
+def _current_unit_of_work() -> UnitOfWork | None:
+    work = _unit_of_work.get()
+    return work if work and work.is_current() else None
+
+
+async def after_commit(callback: AfterCommit) -> None:
+    work = _current_unit_of_work()
+    if work:
+        work.after_commit.append(callback)
+    else:
+        await callback()
+
+
+async def release_unit_of_work() -> None:
+    work = _current_unit_of_work()
+    if work:
+        await work.release()
+
+
+@asynccontextmanager
+async def unit_of_work(db_engine: AsyncEngine = engine) -> AsyncIterator[AsyncSession]:
+    session = get_unit_of_work_session(db_engine)
+    if session:
+        async with session.begin_nested():
+            yield session
+        return
+
+    work = UnitOfWork(db_engine)
+    token = _unit_of_work.set(work)
+    try:
+        yield work.session
+        await work.commit()
+    finally:
+        _unit_of_work.reset(token)
+        await work.close()
+
+
+class UnitOfWorkMiddleware:
+    def __init__(self, app: ASGIApp, db_engine: AsyncEngine = engine) -> None:
+        self.app = app
+        self.engine = db_engine
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        work = UnitOfWork(self.engine)
+        token = _unit_of_work.set(work)
+
+        async def send_after_commit(message: Message) -> None:
+            if message["type"] == "http.response.start" and work.active:
+                if message["status"] < 400:
+                    await work.commit()
+                else:
+                    await work.rollback()
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_after_commit)
+        finally:
+            _unit_of_work.reset(token)
+            await work.close()
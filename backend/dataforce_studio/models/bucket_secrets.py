@@ -11,7 +11,10 @@ class BucketSecretOrm(TimestampMixin, Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     organization_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False
+        Integer,
+        ForeignKey("organizations.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
     endpoint: Mapped[str] = mapped_column(String, nullable=False)
     bucket_name: Mapped[str] = mapped_column(String, nullable=False)
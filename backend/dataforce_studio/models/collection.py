@@ -1,6 +1,6 @@
-from sqlalchemy import ForeignKey, Integer, String, func, select
+from sqlalchemy import ForeignKey, Integer, String
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import Mapped, column_property, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from dataforce_studio.models import Base
 from dataforce_studio.models.base import TimestampMixin
@@ -13,12 +13,15 @@ class CollectionOrm(TimestampMixin, Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     orbit_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("orbits.id", ondelete="CASCADE"), nullable=False
+        Integer, ForeignKey("orbits.id", ondelete="CASCADE"), nullable=False, index=True
     )
     description: Mapped[str] = mapped_column(String, nullable=False)
     name: Mapped[str] = mapped_column(String, nullable=False)
     collection_type: Mapped[str] = mapped_column("type", String, nullable=False)
     tags: Mapped[list[str] | None] = mapped_column(JSONB, nullable=True, default=list)
+    total_models: Mapped[int] = mapped_column(
+        Integer, server_default="0", nullable=False
+    )
 
     orbit: Mapped["OrbitOrm"] = relationship(  # type: ignore[name-defined]  # noqa: F821
         "OrbitOrm", back_populates="collections", lazy="selectin"
@@ -27,13 +30,6 @@ class CollectionOrm(TimestampMixin, Base):
         back_populates="collection", cascade="all, delete, delete-orphan"
     )
 
-    total_models = column_property(
-        select(func.count(MLModelOrm.id))
-        .where(MLModelOrm.collection_id == id)
-        .correlate_except(MLModelOrm)
-        .scalar_subquery()
-    )
-
     def __repr__(self) -> str:
         return f"Collection(id={self.id!r}, name={self.name!r})"
 
@@ -1,4 +1,4 @@
-from sqlalchemy import ForeignKey, Integer, String
+from sqlalchemy import BigInteger, ForeignKey, Index, Integer, String
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -8,6 +8,23 @@ from dataforce_studio.schemas.ml_models import MLModel, MLModelStatus
 
 class MLModelOrm(TimestampMixin, Base):
     __tablename__ = "ml_models"
+    __table_args__ = (
+        Index("ix_ml_models_file_hash_size", "file_hash", "size"),
+        Index(
+            "ix_ml_models_collection_id_created_at_id",
+            "collection_id",
+            "created_at",
+            "id",
+        ),
+        Index("ix_ml_models_collection_id_status", "collection_id", "status"),
+        Index(
+            "ix_ml_models_tags",
+            "tags",
+            postgresql_using="gin",
+            postgresql_ops={"tags": "jsonb_path_ops"},
+        ),
+        Index("ix_ml_models_metrics", "metrics", postgresql_using="gin"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     collection_id: Mapped[int] = mapped_column(
@@ -22,8 +39,8 @@ class MLModelOrm(TimestampMixin, Base):
     file_index: Mapped[dict[str, tuple[int, int]]] = mapped_column(
         JSONB, nullable=False
     )
-    bucket_location: Mapped[str] = mapped_column(String, nullable=False)
-    size: Mapped[int] = mapped_column(Integer, nullable=False)
+    bucket_location: Mapped[str] = mapped_column(String, nullable=False, index=True)
+    size: Mapped[int] = mapped_column(BigInteger, nullable=False)
     unique_identifier: Mapped[str] = mapped_column(String, nullable=False)
     tags: Mapped[list[str] | None] = mapped_column(JSONB, nullable=True, default=list)
     status: Mapped[str] = mapped_column(
@@ -31,6 +48,15 @@ class MLModelOrm(TimestampMixin, Base):
         nullable=False,
         default=MLModelStatus.PENDING_UPLOAD.value,
     )
+    upload_id: Mapped[str | None] = mapped_column(String, nullable=True)
+    upload_part_size: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    upload_parts_count: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    uploaded_parts_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    uploaded_bytes: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=0, server_default="0"
+    )
 
     collection: Mapped["CollectionOrm"] = relationship(  # type: ignore[name-defined]  # noqa: F821
         "CollectionOrm", back_populates="models", lazy="selectin"
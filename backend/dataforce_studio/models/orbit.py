@@ -1,14 +1,7 @@
 from collections.abc import Sequence
 
-from sqlalchemy import (
-    ForeignKey,
-    Integer,
-    String,
-    UniqueConstraint,
-    func,
-    select,
-)
-from sqlalchemy.orm import Mapped, column_property, mapped_column, relationship
+from sqlalchemy import ForeignKey, Integer, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from dataforce_studio.models import CollectionOrm
 from dataforce_studio.models.base import Base, TimestampMixin
@@ -25,7 +18,10 @@ class OrbitMembersOrm(TimestampMixin, Base):
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
 
     user_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        Integer,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
     orbit_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("orbits.id", ondelete="CASCADE"), nullable=False
@@ -60,12 +56,19 @@ class OrbitOrm(TimestampMixin, Base):
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String, nullable=False)
     organization_id: Mapped[int] = mapped_column(
-        ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False
+        ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False, index=True
     )
     bucket_secret_id: Mapped[int] = mapped_column(
         Integer,
-        ForeignKey("bucket_secrets.id", ondelete="CASCADE"),
+        ForeignKey("bucket_secrets.id"),
         nullable=False,
+        index=True,
+    )
+    total_members: Mapped[int] = mapped_column(
+        Integer, server_default="0", nullable=False
+    )
+    total_collections: Mapped[int] = mapped_column(
+        Integer, server_default="0", nullable=False
     )
 
     members: Mapped[list["OrbitMembersOrm"]] = relationship(
@@ -88,20 +91,6 @@ class OrbitOrm(TimestampMixin, Base):
         lazy="selectin",
     )
 
-    total_members = column_property(
-        select(func.count(OrbitMembersOrm.id))
-        .where(OrbitMembersOrm.orbit_id == id)
-        .correlate_except(OrbitMembersOrm)
-        .scalar_subquery()
-    )
-
-    total_collections = column_property(
-        select(func.count(CollectionOrm.id))
-        .where(CollectionOrm.orbit_id == id)
-        .correlate_except(CollectionOrm)
-        .scalar_subquery()
-    )
-
     def __repr__(self) -> str:
         return f"Orbit(id={self.id!r})"
 
@@ -59,7 +59,10 @@ class OrganizationMemberOrm(TimestampMixin, Base):
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
 
     user_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        Integer,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
     organization_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False
@@ -87,15 +90,21 @@ class OrganizationMemberOrm(TimestampMixin, Base):
 
 class OrganizationInviteOrm(TimestampMixin, Base):
     __tablename__ = "organization_invites"
+    __table_args__ = (
+        UniqueConstraint("organization_id", "email", name="org_invite_email"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    email: Mapped[EmailStr] = mapped_column(String, nullable=False)
+    email: Mapped[EmailStr] = mapped_column(String, nullable=False, index=True)
     role: Mapped[str] = mapped_column(String, nullable=False)
     organization_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False
     )
     invited_by: Mapped[int] = mapped_column(
-        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        Integer,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
 
     organization: Mapped["OrganizationOrm"] = relationship(back_populates="invites")
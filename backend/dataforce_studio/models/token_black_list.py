@@ -8,5 +8,5 @@ class TokenBlackListOrm(Base):
     __tablename__ = "token_black_list"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    token: Mapped[str] = mapped_column(String, nullable=False)
-    expire_at: Mapped[int] = mapped_column(Integer, nullable=False)
+    token_digest: Mapped[str] = mapped_column(String(64), nullable=False, unique=True)
+    expire_at: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
@@ -1,10 +1,15 @@
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
+from contextlib import asynccontextmanager
 from typing import Any, TypeVar
 
 from pydantic import BaseModel
-from sqlalchemy import delete, func, select
+from sqlalchemy import delete, func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
+from dataforce_studio.infra.unit_of_work import (
+    RepositorySession,
+    get_unit_of_work_session,
+)
 from dataforce_studio.models.base import Base
 
 TOrm = TypeVar("TOrm", bound=Base)
@@ -15,32 +20,41 @@ class RepositoryBase:
     def __init__(self, engine: AsyncEngine) -> None:
         self._engine = engine
 
-    def _get_session(self) -> AsyncSession:
-        return AsyncSession(self._engine, expire_on_commit=True)
+    @asynccontextmanager
+    async def _get_session(self) -> AsyncIterator[AsyncSession]:
+        session = get_unit_of_work_session(self._engine)
+        if session:
+            yield session
+            return
+        async with RepositorySession(self._engine) as session:
+            yield session
 
 
 class CrudMixin:
     async def create_model(
         self, session: AsyncSession, orm_class: type[TOrm], data: TPydantic
     ) -> TOrm:
-        db_obj = orm_class(**data.model_dump())
-        session.add(db_obj)
+        result = await session.execute(
+            insert(orm_class).values(**data.model_dump()).returning(orm_class)
+        )
+        db_obj = result.scalar_one()
         await session.commit()
-        await session.refresh(db_obj)
         return db_obj
 
     async def create_models(
         self,
         session: AsyncSession,
-        orm_class: type,
+        orm_class: type[TOrm],
         data_list: list[TPydantic],
-    ) -> list:
-        db_objects = [orm_class(**item.model_dump()) for item in data_list]
-        session.add_all(db_objects)
-        await session.flush()
+    ) -> list[TOrm]:
+        if not data_list:
+            return []
+        result = await session.scalars(
+            insert(orm_class).returning(orm_class, sort_by_parameter_order=True),
+            [item.model_dump() for item in data_list],
+        )
+        db_objects = list(result)
         await session.commit()
-        for obj in db_objects:
-            await session.refresh(obj)
         return db_objects
 
     async def update_model_where(
@@ -50,22 +64,18 @@ class CrudMixin:
         data: TPydantic,
         *where_conditions,
     ) -> TOrm | None:
-        result = await session.execute(select(orm_class).where(*where_conditions))
-        db_obj = result.scalar_one_or_none()
-
-        if not db_obj:
-            return None
-
         fields_to_update = data.model_dump(exclude_unset=True)
         if not fields_to_update:
-            return db_obj
-
-        for field, value in fields_to_update.items():
-            setattr(db_obj, field, value)
+            return await self.get_model_where(session, orm_class, *where_conditions)
 
+        result = await session.execute(
+            update(orm_class)
+            .where(*where_conditions)
+            .values(**fields_to_update)
+            .returning(orm_class)
+        )
+        db_obj = result.scalar_one_or_none()
         await session.commit()
-        await session.refresh(db_obj)
-
         return db_obj
 
     async def update_model(
@@ -87,22 +97,12 @@ class CrudMixin:
         orm_class: type[TOrm],
         obj_id: int,
     ) -> None:
-        result = await session.execute(select(orm_class).where(orm_class.id == obj_id))  # type: ignore[attr-defined]
-        db_obj = result.scalar_one_or_none()
-
-        if db_obj:
-            await session.delete(db_obj)
-            await session.commit()
+        await self.delete_models_where(session, orm_class, orm_class.id == obj_id)  # type: ignore[attr-defined]
 
     async def delete_model_where(
         self, session: AsyncSession, orm_class: type[TOrm], *where_conditions
     ) -> None:
-        result = await session.execute(select(orm_class).where(*where_conditions))  # type: ignore[attr-defined]
-        obj = result.scalar_one_or_none()
-
-        if obj:
-            await session.delete(obj)
-            await session.commit()
+        await self.delete_models_where(session, orm_class, *where_conditions)
 
     async def delete_models_where(
         self, session: AsyncSession, orm_class: type[TOrm], *where_conditions
@@ -24,6 +24,16 @@ class BucketSecretRepository(RepositoryBase, CrudMixin):
             db_secret = await self.get_model(session, BucketSecretOrm, secret_id)
             return db_secret.to_bucket_secret() if db_secret else None
 
+    async def get_bucket_secrets(self, after_id: int, limit: int) -> list[BucketSecret]:
+        async with self._get_session() as session:
+            result = await session.execute(
+                select(BucketSecretOrm)
+                .where(BucketSecretOrm.id > after_id)
+                .order_by(BucketSecretOrm.id)
+                .limit(limit)
+            )
+            return [secret.to_bucket_secret() for secret in result.scalars().all()]
+
     async def get_organization_bucket_secrets(
         self, organization_id: int
     ) -> list[BucketSecret]:
@@ -0,0 +1,53 @@
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import InstrumentedAttribute
+
+from dataforce_studio.models import (
+    CollectionOrm,
+    MLModelOrm,
+    OrbitMembersOrm,
+    OrbitOrm,
+)
+from dataforce_studio.repositories.base import RepositoryBase
+
+COUNTERS: list[
+    tuple[
+        type[OrbitOrm] | type[CollectionOrm],
+        InstrumentedAttribute[int],
+        InstrumentedAttribute[int],
+    ]
+] = [
+    (OrbitOrm, OrbitOrm.total_members, OrbitMembersOrm.orbit_id),
+    (OrbitOrm, OrbitOrm.total_collections, CollectionOrm.orbit_id),
+    (CollectionOrm, CollectionOrm.total_models, MLModelOrm.collection_id),
+]
+
+
+class CounterRepository(RepositoryBase):
+    async def repair_counters(self) -> dict[str, int]:
+        repaired = {}
+        async with self._get_session() as session:
+            for parent, counter, foreign_key in COUNTERS:
+                actual = (
+                    select(func.count())
+                    .where(foreign_key == parent.id)
+                    .correlate(parent)
+                    .scalar_subquery()
+                )
+                ids = (
+                    await session.scalars(
+                        select(parent.id)
+                        .where(counter != actual)
+                        .order_by(parent.id)
+                        .with_for_update()
+                    )
+                ).all()
+                if ids:
+                    await session.execute(
+                        update(parent)
+                        .where(parent.id.in_(ids))
+                        .values({counter: actual, parent.updated_at: parent.updated_at})
+                        .execution_options(synchronize_session=False)
+                    )
+                repaired[f"{parent.__tablename__}.{counter.key}"] = len(ids)
+            await session.commit()
+        return repaired
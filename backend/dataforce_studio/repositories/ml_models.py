@@ -1,14 +1,48 @@
-from sqlalchemy import func, select
+import operator
+from datetime import datetime
+from itertools import chain
+from typing import TypeVar
 
-from dataforce_studio.models import MLModelOrm
+from sqlalchemy import (
+    ColumnElement,
+    Float,
+    Select,
+    case,
+    func,
+    or_,
+    select,
+    tuple_,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from dataforce_studio.models import CollectionOrm, MLModelOrm, OrbitOrm
 from dataforce_studio.repositories.base import CrudMixin, RepositoryBase
 from dataforce_studio.schemas.ml_models import (
+    MetricOperator,
     MLModel,
     MLModelCreate,
+    MLModelDownloadSummary,
+    MLModelListFilters,
     MLModelStatus,
+    MLModelSummary,
     MLModelUpdate,
+    MLModelUploadUpdate,
+    MLModelWithSecret,
+    SortOrder,
 )
 
+METRIC_OPERATORS = {
+    MetricOperator.EQ: operator.eq,
+    MetricOperator.GT: operator.gt,
+    MetricOperator.GTE: operator.ge,
+    MetricOperator.LT: operator.lt,
+    MetricOperator.LTE: operator.le,
+}
+
+DELETING_STATUSES = (MLModelStatus.PENDING_DELETION, MLModelStatus.DELETION_FAILED)
+
+SummaryT = TypeVar("SummaryT", bound=MLModelSummary)
+
 
 class MLModelRepository(RepositoryBase, CrudMixin):
     async def create_ml_model(self, model: MLModelCreate) -> MLModel:
@@ -17,28 +51,303 @@ class MLModelRepository(RepositoryBase, CrudMixin):
             return db_model.to_ml_model()
 
     async def update_status(
-        self, model_id: int, status: MLModelStatus
+        self,
+        model_id: int,
+        status: MLModelStatus,
+        current_status: MLModelStatus | None = None,
     ) -> MLModel | None:
+        conditions = [MLModelOrm.id == model_id]
+        if current_status is not None:
+            conditions.append(MLModelOrm.status == current_status)
         async with self._get_session() as session:
             db_model = await self.update_model_where(
                 session,
                 MLModelOrm,
                 MLModelUpdate(id=model_id, status=status),
-                MLModelOrm.id == model_id,
+                *conditions,
             )
             return db_model.to_ml_model() if db_model else None
 
+    async def get_uploaded_model_by_hash(
+        self, orbit_id: int, file_hash: str, size: int
+    ) -> MLModel | None:
+        async with self._get_session() as session:
+            result = await session.execute(
+                select(MLModelOrm)
+                .join(CollectionOrm, CollectionOrm.id == MLModelOrm.collection_id)
+                .where(
+                    CollectionOrm.orbit_id == orbit_id,
+                    MLModelOrm.file_hash == file_hash,
+                    MLModelOrm.size == size,
+                    MLModelOrm.status == MLModelStatus.UPLOADED,
+                )
+                .order_by(MLModelOrm.id)
+                .limit(1)
+            )
+            db_model = result.scalar_one_or_none()
+            return db_model.to_ml_model() if db_model else None
+
+    @staticmethod
+    async def _lock_object(session: AsyncSession, bucket_location: str) -> None:
+        await session.execute(
+            select(
+                func.pg_advisory_xact_lock(func.hashtextextended(bucket_location, 0))
+            )
+        )
+
+    @staticmethod
+    async def _count_object_references(
+        session: AsyncSession, bucket_location: str, exclude_model_id: int
+    ) -> int:
+        result = await session.execute(
+            select(func.count())
+            .select_from(MLModelOrm)
+            .where(
+                MLModelOrm.bucket_location == bucket_location,
+                MLModelOrm.id != exclude_model_id,
+                MLModelOrm.status.not_in(DELETING_STATUSES),
+            )
+        )
+        return result.scalar() or 0
+
+    async def get_object_references_count(
+        self, bucket_location: str, exclude_model_id: int
+    ) -> int:
+        async with self._get_session() as session:
+            return await self._count_object_references(
+                session, bucket_location, exclude_model_id
+            )
+
+    async def create_ml_model_copy(self, model: MLModelCreate) -> MLModel | None:
+        async with self._get_session() as session:
+            await self._lock_object(session, model.bucket_location)
+            source = await session.scalar(
+                select(MLModelOrm.id)
+                .where(
+                    MLModelOrm.bucket_location == model.bucket_location,
+                    MLModelOrm.status == MLModelStatus.UPLOADED,
+                )
+                .limit(1)
+            )
+            if source is None:
+                return None
+            db_model = await self.create_model(session, MLModelOrm, model)
+            return db_model.to_ml_model()
+
+    async def mark_for_deletion(self, model_id: int, bucket_location: str) -> bool:
+        async with self._get_session() as session:
+            await self._lock_object(session, bucket_location)
+            references = await self._count_object_references(
+                session, bucket_location, model_id
+            )
+            await self.update_model_where(
+                session,
+                MLModelOrm,
+                MLModelUpdate(id=model_id, status=MLModelStatus.PENDING_DELETION),
+                MLModelOrm.id == model_id,
+            )
+            return not references
+
+    @staticmethod
+    def _with_secret_query() -> Select[tuple[MLModelOrm, int]]:
+        return (
+            select(MLModelOrm, OrbitOrm.bucket_secret_id)
+            .join(CollectionOrm, CollectionOrm.id == MLModelOrm.collection_id)
+            .join(OrbitOrm, OrbitOrm.id == CollectionOrm.orbit_id)
+        )
+
+    async def _get_models_with_secret(
+        self, query: Select[tuple[MLModelOrm, int]]
+    ) -> list[MLModelWithSecret]:
+        async with self._get_session() as session:
+            result = await session.execute(query)
+            return [
+                MLModelWithSecret(
+                    model=db_model.to_ml_model(), bucket_secret_id=secret_id
+                )
+                for db_model, secret_id in result.all()
+            ]
+
+    async def get_models_to_verify(self, limit: int) -> list[MLModelWithSecret]:
+        return await self._get_models_with_secret(
+            self._with_secret_query()
+            .where(MLModelOrm.status == MLModelStatus.VERIFYING)
+            .order_by(MLModelOrm.updated_at)
+            .limit(limit)
+        )
+
+    async def get_stale_models(
+        self,
+        status: MLModelStatus,
+        updated_before: datetime,
+        after_id: int,
+        limit: int,
+    ) -> list[MLModelWithSecret]:
+        return await self._get_models_with_secret(
+            self._with_secret_query()
+            .where(
+                MLModelOrm.status == status,
+                func.coalesce(MLModelOrm.updated_at, MLModelOrm.created_at)
+                < updated_before,
+                MLModelOrm.id > after_id,
+            )
+            .order_by(MLModelOrm.id)
+            .limit(limit)
+        )
+
+    async def get_existing_locations(self, bucket_locations: list[str]) -> set[str]:
+        if not bucket_locations:
+            return set()
+        async with self._get_session() as session:
+            result = await session.execute(
+                select(MLModelOrm.bucket_location)
+                .where(MLModelOrm.bucket_location.in_(bucket_locations))
+                .distinct()
+            )
+            return set(result.scalars().all())
+
     async def delete_ml_model(self, model_id: int) -> None:
         async with self._get_session() as session:
             await self.delete_model(session, MLModelOrm, model_id)
 
-    async def get_collection_models(self, collection_id: int) -> list[MLModel]:
+    @staticmethod
+    def _metric_value(key: str) -> ColumnElement[float]:
+        value = MLModelOrm.metrics[key]
+        return case((func.jsonb_typeof(value) == "number", value.astext.cast(Float)))
+
+    @classmethod
+    def _filter_conditions(
+        cls, filters: MLModelListFilters
+    ) -> list[ColumnElement[bool]]:
+        conditions: list[ColumnElement[bool]] = []
+        if filters.ids is not None:
+            conditions.append(MLModelOrm.id.in_(filters.ids))
+        if filters.tags:
+            conditions.append(MLModelOrm.tags.contains(filters.tags))
+        if filters.status:
+            conditions.append(MLModelOrm.status.in_(filters.status))
+        if filters.search:
+            conditions.append(
+                or_(
+                    MLModelOrm.file_name.icontains(filters.search, autoescape=True),
+                    MLModelOrm.model_name.icontains(filters.search, autoescape=True),
+                    MLModelOrm.description.icontains(filters.search, autoescape=True),
+                )
+            )
+        for metric in filters.metrics:
+            conditions.append(MLModelOrm.metrics.has_key(metric.key))
+            conditions.append(
+                METRIC_OPERATORS[metric.operator](
+                    cls._metric_value(metric.key), metric.value
+                )
+            )
+        if filters.sort_metric:
+            conditions.append(MLModelOrm.metrics.has_key(filters.sort_metric))
+            conditions.append(cls._metric_value(filters.sort_metric).is_not(None))
+        return conditions
+
+    @classmethod
+    def _collection_page_query(
+        cls,
+        query: Select,
+        collection_id: int,
+        limit: int | None,
+        before: tuple[datetime | float, int] | None = None,
+        filters: MLModelListFilters | None = None,
+    ) -> Select:
+        filters = filters or MLModelListFilters()
+        sort_column: ColumnElement = (
+            cls._metric_value(filters.sort_metric)
+            if filters.sort_metric
+            else MLModelOrm.created_at.expression
+        )
+        query = query.where(
+            MLModelOrm.collection_id == collection_id,
+            *cls._filter_conditions(filters),
+        )
+        if filters.order == SortOrder.ASC:
+            if before is not None:
+                query = query.where(tuple_(sort_column, MLModelOrm.id) > before)
+            query = query.order_by(sort_column.asc(), MLModelOrm.id.asc())
+        else:
+            if before is not None:
+                query = query.where(tuple_(sort_column, MLModelOrm.id) < before)
+            query = query.order_by(sort_column.desc(), MLModelOrm.id.desc())
+        return query.limit(limit)
+
+    async def get_collection_models_page(
+        self,
+        collection_id: int,
+        limit: int | None,
+        before: tuple[datetime | float, int] | None = None,
+        filters: MLModelListFilters | None = None,
+    ) -> list[MLModel]:
+        query = self._collection_page_query(
+            select(MLModelOrm), collection_id, limit, before, filters
+        )
         async with self._get_session() as session:
-            result = await session.execute(
-                select(MLModelOrm).where(MLModelOrm.collection_id == collection_id)
+            result = await session.execute(query)
+            return [db_model.to_ml_model() for db_model in result.scalars().all()]
+
+    async def get_collection_model_summaries_page(
+        self,
+        collection_id: int,
+        limit: int,
+        before: tuple[datetime | float, int] | None = None,
+        metric_keys: list[str] | None = None,
+        filters: MLModelListFilters | None = None,
+    ) -> list[MLModelSummary]:
+        return await self._get_summaries_page(
+            MLModelSummary, collection_id, limit, before, metric_keys, filters
+        )
+
+    async def get_collection_model_downloads_page(
+        self,
+        collection_id: int,
+        limit: int,
+        before: tuple[datetime | float, int] | None = None,
+        filters: MLModelListFilters | None = None,
+    ) -> list[MLModelDownloadSummary]:
+        return await self._get_summaries_page(
+            MLModelDownloadSummary, collection_id, limit, before, [], filters
+        )
+
+    async def _get_summaries_page(
+        self,
+        schema: type[SummaryT],
+        collection_id: int,
+        limit: int,
+        before: tuple[datetime | float, int] | None = None,
+        metric_keys: list[str] | None = None,
+        filters: MLModelListFilters | None = None,
+    ) -> list[SummaryT]:
+        columns = [
+            getattr(MLModelOrm, field)
+            for field in schema.model_fields
+            if field != "metrics"
+        ]
+        metrics: ColumnElement[dict] = MLModelOrm.metrics.expression
+        if metric_keys is not None:
+            sort_metric = filters.sort_metric if filters else None
+            if sort_metric and sort_metric not in metric_keys:
+                metric_keys = [*metric_keys, sort_metric]
+            metrics = func.jsonb_strip_nulls(
+                func.jsonb_build_object(
+                    *chain.from_iterable(
+                        (key, MLModelOrm.metrics[key]) for key in metric_keys
+                    )
+                )
             )
-            db_versions = result.scalars().all()
-            return [v.to_ml_model() for v in db_versions]
+        query = self._collection_page_query(
+            select(*columns, metrics.label("metrics")),
+            collection_id,
+            limit,
+            before,
+            filters,
+        )
+        async with self._get_session() as session:
+            result = await session.execute(query)
+            return [schema.model_validate(row) for row in result.all()]
 
     async def get_ml_model(self, model_id: int, collection_id: int) -> MLModel | None:
         async with self._get_session() as session:
@@ -72,3 +381,16 @@ class MLModelRepository(RepositoryBase, CrudMixin):
                 .where(MLModelOrm.collection_id == collection_id)
             )
             return result.scalar() or 0
+
+    async def update_upload(
+        self, model_id: int, upload_id: str, data: MLModelUploadUpdate
+    ) -> MLModel | None:
+        async with self._get_session() as session:
+            db_model = await self.update_model_where(
+                session,
+                MLModelOrm,
+                data,
+                MLModelOrm.id == model_id,
+                MLModelOrm.upload_id == upload_id,
+            )
+            return db_model.to_ml_model() if db_model else None
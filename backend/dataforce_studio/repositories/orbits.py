@@ -1,7 +1,13 @@
-from sqlalchemy import case, select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import and_, case, select
+from sqlalchemy.orm import lazyload, selectinload
 
-from dataforce_studio.models import OrbitMembersOrm, OrbitOrm
+from dataforce_studio.infra.unit_of_work import unit_of_work
+from dataforce_studio.models import (
+    CollectionOrm,
+    OrbitMembersOrm,
+    OrbitOrm,
+    OrganizationMemberOrm,
+)
 from dataforce_studio.repositories.base import CrudMixin, RepositoryBase
 from dataforce_studio.schemas.orbit import (
     Orbit,
@@ -14,6 +20,7 @@ from dataforce_studio.schemas.orbit import (
     OrbitUpdate,
     UpdateOrbitMember,
 )
+from dataforce_studio.schemas.permissions import OrbitAccess
 from dataforce_studio.utils.organizations import convert_orbit_simple_members
 
 
@@ -95,7 +102,7 @@ class OrbitRepository(RepositoryBase, CrudMixin):
     async def create_orbit(
         self, organization_id: int, orbit: OrbitCreateIn
     ) -> OrbitDetails | None:
-        async with self._get_session() as session:
+        async with unit_of_work(self._engine) as session:
             db_orbit = await self.create_model(
                 session,
                 OrbitOrm,
@@ -105,15 +112,16 @@ class OrbitRepository(RepositoryBase, CrudMixin):
                     organization_id=organization_id,
                 ),
             )
+            orbit_id = db_orbit.id
 
             if orbit.members:
                 await self.create_models(
                     session,
                     OrbitMembersOrm,
-                    convert_orbit_simple_members(db_orbit.id, orbit.members),
+                    convert_orbit_simple_members(orbit_id, orbit.members),
                 )
 
-            return await self.get_orbit(db_orbit.id, organization_id)
+            return await self.get_orbit(orbit_id, organization_id)
 
     async def update_orbit(self, orbit_id: int, orbit: OrbitUpdate) -> Orbit | None:
         orbit.id = orbit_id
@@ -195,3 +203,66 @@ class OrbitRepository(RepositoryBase, CrudMixin):
             OrbitMembersOrm.orbit_id == orbit_id, OrbitMembersOrm.user_id == user_id
         )
         return str(member.role) if member else None
+
+    async def get_orbit_access(
+        self,
+        organization_id: int,
+        orbit_id: int,
+        user_id: int,
+        collection_id: int | None = None,
+    ) -> OrbitAccess | None:
+        stmt = (
+            select(OrganizationMemberOrm.role, OrbitMembersOrm.role, OrbitOrm)
+            .select_from(OrganizationMemberOrm)
+            .outerjoin(
+                OrbitOrm,
+                and_(
+                    OrbitOrm.id == orbit_id,
+                    OrbitOrm.organization_id == OrganizationMemberOrm.organization_id,
+                ),
+            )
+            .outerjoin(
+                OrbitMembersOrm,
+                and_(
+                    OrbitMembersOrm.orbit_id == OrbitOrm.id,
+                    OrbitMembersOrm.user_id == user_id,
+                ),
+            )
+            .where(
+                OrganizationMemberOrm.organization_id == organization_id,
+                OrganizationMemberOrm.user_id == user_id,
+            )
+            .options(lazyload(OrbitOrm.bucket_secret), lazyload(OrbitOrm.organization))
+        )
+
+        if collection_id is not None:
+            stmt = (
+                stmt.add_columns(CollectionOrm)
+                .outerjoin(
+                    CollectionOrm,
+                    and_(
+                        CollectionOrm.id == collection_id,
+                        CollectionOrm.orbit_id == OrbitOrm.id,
+                    ),
+                )
+                .options(lazyload(CollectionOrm.orbit))
+            )
+
+        async with self._get_session() as session:
+            result = await session.execute(stmt)
+            row = result.first()
+
+            if not row:
+                return None
+
+            org_role, orbit_role, db_orbit, *rest = row
+            db_collection = rest[0] if rest else None
+
+            return OrbitAccess(
+                organization_id=organization_id,
+                user_id=user_id,
+                org_role=org_role,
+                orbit_role=orbit_role,
+                orbit=db_orbit.to_orbit() if db_orbit else None,
+                collection=db_collection.to_collection() if db_collection else None,
+            )
@@ -1,31 +1,56 @@
 import time
 
 from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
 
 from dataforce_studio.models import TokenBlackListOrm
 from dataforce_studio.repositories.base import RepositoryBase
 
 
 class TokenBlackListRepository(RepositoryBase):
-    async def add_token(self, token: str, expire_at: int) -> None:
+    async def add_token(self, token_digest: str, expire_at: int) -> None:
         async with self._get_session() as session:
-            token_black_list = TokenBlackListOrm(token=token, expire_at=expire_at)
-            session.add(token_black_list)
+            await session.execute(
+                insert(TokenBlackListOrm)
+                .values(token_digest=token_digest, expire_at=expire_at)
+                .on_conflict_do_nothing(index_elements=["token_digest"])
+            )
             await session.commit()
-        await self.delete_expired_tokens()
 
-    async def is_token_blacklisted(self, token: str) -> bool:
+    async def is_token_blacklisted(self, token_digest: str) -> bool:
         async with self._get_session() as session:
             result = await session.execute(
-                select(TokenBlackListOrm).filter(TokenBlackListOrm.token == token)
+                select(TokenBlackListOrm.id).filter(
+                    TokenBlackListOrm.token_digest == token_digest,
+                    TokenBlackListOrm.expire_at >= int(time.time()),
+                )
             )
             return result.scalar_one_or_none() is not None
 
-    async def delete_expired_tokens(self) -> None:
+    async def get_active_tokens(self) -> list[tuple[str, int]]:
         async with self._get_session() as session:
-            await session.execute(
-                delete(TokenBlackListOrm).filter(
-                    TokenBlackListOrm.expire_at < int(time.time())
-                )
+            result = await session.execute(
+                select(
+                    TokenBlackListOrm.token_digest, TokenBlackListOrm.expire_at
+                ).filter(TokenBlackListOrm.expire_at >= int(time.time()))
+            )
+            return [
+                (token_digest, expire_at) for token_digest, expire_at in result.all()
+            ]
+
+    async def delete_expired_tokens(self, batch_size: int = 1000) -> int:
+        expired = (
+            select(TokenBlackListOrm.id)
+            .filter(TokenBlackListOrm.expire_at < int(time.time()))
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        async with self._get_session() as session:
+            result = await session.execute(
+                delete(TokenBlackListOrm)
+                .filter(TokenBlackListOrm.id.in_(expired))
+                .returning(TokenBlackListOrm.id)
             )
             await session.commit()
+            return len(result.all())
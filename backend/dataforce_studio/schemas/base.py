@@ -1,5 +1,14 @@
-from pydantic import ConfigDict
+from typing import Generic, TypeVar
+
+from pydantic import BaseModel, ConfigDict
+
+T = TypeVar("T")
 
 
 class BaseOrmConfig:
     model_config = ConfigDict(from_attributes=True, arbitrary_types_allowed=True)
+
+
+class Page(BaseModel, Generic[T]):
+    items: list[T]
+    cursor: str | None = None
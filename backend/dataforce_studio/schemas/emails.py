@@ -0,0 +1,10 @@
+from pydantic import BaseModel, EmailStr
+
+
+class EmailMessage(BaseModel):
+    email: EmailStr
+    from_email: EmailStr
+    template_id: str
+    subject: str | None = None
+    data: dict[str, str]
+    description: str
@@ -1,3 +1,4 @@
+import math
 from datetime import datetime
 from enum import StrEnum
 from typing import Annotated, Literal
@@ -64,6 +65,7 @@ class CollectionUpdateIn(BaseModel):
 class MLModelStatus(StrEnum):
     PENDING_UPLOAD = "pending_upload"
     UPLOADED = "uploaded"
+    VERIFYING = "verifying"
     PENDING_DELETION = "pending_deletion"
     UPLOAD_FAILED = "upload_failed"
     DELETION_FAILED = "deletion_failed"
@@ -128,6 +130,9 @@ class MLModelCreate(BaseModel):
     unique_identifier: str
     tags: list[str] | None = None
     status: MLModelStatus = MLModelStatus.PENDING_UPLOAD
+    upload_id: str | None = None
+    upload_part_size: int | None = None
+    upload_parts_count: int | None = None
 
 
 class MLModelIn(BaseModel):
@@ -181,10 +186,127 @@ class MLModel(BaseModel, BaseOrmConfig):
     unique_identifier: str
     tags: list[str] | None = None
     status: MLModelStatus
+    upload_id: str | None = None
+    upload_part_size: int | None = None
+    upload_parts_count: int | None = None
+    uploaded_parts_count: int = 0
+    uploaded_bytes: int = 0
     created_at: datetime
     updated_at: datetime | None = None
 
 
+class MLModelSummary(BaseModel, BaseOrmConfig):
+    id: int
+    collection_id: int
+    file_name: str
+    model_name: str | None = None
+    description: str | None = None
+    metrics: dict
+    size: int
+    tags: list[str] | None = None
+    status: MLModelStatus
+    created_at: datetime
+    updated_at: datetime | None = None
+
+
+class SortOrder(StrEnum):
+    ASC = "asc"
+    DESC = "desc"
+
+
+class MetricOperator(StrEnum):
+    EQ = "eq"
+    GT = "gt"
+    GTE = "gte"
+    LT = "lt"
+    LTE = "lte"
+
+
+class MetricFilter(BaseModel):
+    key: str
+    operator: MetricOperator
+    value: float
+
+    @classmethod
+    def parse(cls, value: str) -> "MetricFilter":
+        key, operator, threshold = value.rsplit(":", 2)
+        if not key or not math.isfinite(float(threshold)):
+            raise ValueError(f"Invalid metric filter '{value}'")
+        return cls(key=key, operator=MetricOperator(operator), value=float(threshold))
+
+
+class MLModelListFilters(BaseModel):
+    ids: list[int] | None = None
+    tags: list[str] | None = None
+    status: list[MLModelStatus] | None = None
+    search: str | None = None
+    metrics: list[MetricFilter] = []
+    sort_metric: str | None = None
+    order: SortOrder = SortOrder.DESC
+
+
 class CreateMLModelResponse(BaseModel):
     model: MLModel
+    url: str | None
+
+
+class MLModelDownloadSummary(MLModelSummary):
+    bucket_location: str
+
+
+class MLModelWithUrl(BaseModel):
+    model: MLModelSummary
     url: str
+
+
+class MLModelUploadUpdate(BaseModel):
+    id: int
+    status: MLModelStatus | None = None
+    upload_id: str | None = None
+    uploaded_parts_count: int | None = None
+    uploaded_bytes: int | None = None
+
+
+class UploadPartUrl(BaseModel):
+    part_number: int
+    url: str
+
+
+class UploadedPart(BaseModel):
+    part_number: int = Field(..., ge=1)
+    etag: str
+    size: int | None = None
+
+
+class MultipartUpload(BaseModel):
+    model: MLModel
+    part_size: int
+    parts_count: int
+    parts: list[UploadPartUrl]
+
+
+class MultipartUploadProgress(BaseModel):
+    part_size: int
+    parts_count: int
+    uploaded_parts: list[UploadedPart]
+    uploaded_bytes: int
+
+
+class UploadPartsIn(BaseModel):
+    part_numbers: list[int] = Field(..., min_length=1)
+
+
+class CompleteMultipartUploadIn(BaseModel):
+    parts: list[UploadedPart] = Field(..., min_length=1)
+
+
+class MLModelWithSecret(BaseModel):
+    model: MLModel
+    bucket_secret_id: int
+
+
+class MLModelFileUrl(BaseModel):
+    url: str | None
+    headers: dict[str, str]
+    offset: int
+    size: int
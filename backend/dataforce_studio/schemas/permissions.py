@@ -3,7 +3,8 @@ from enum import StrEnum
 from pydantic import BaseModel
 
 from dataforce_studio.schemas.base import BaseOrmConfig
-from dataforce_studio.schemas.orbit import OrbitRole
+from dataforce_studio.schemas.ml_models import Collection
+from dataforce_studio.schemas.orbit import Orbit, OrbitRole
 from dataforce_studio.schemas.organization import OrgRole
 
 
@@ -43,6 +44,15 @@ class OrbitPermission(BaseModel, BaseOrmConfig):
     action: Action
 
 
+class OrbitAccess(BaseModel):
+    organization_id: int
+    user_id: int
+    org_role: OrgRole
+    orbit_role: OrbitRole | None = None
+    orbit: Orbit | None = None
+    collection: Collection | None = None
+
+
 organization_permissions = {
     OrgRole.OWNER: {
         Resource.ORGANIZATION: [Action.READ, Action.UPDATE, Action.DELETE],
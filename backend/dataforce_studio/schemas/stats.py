@@ -15,3 +15,60 @@ class StatsEmailSendOut(BaseModel, BaseOrmConfig):
     email: EmailStr
     description: str
     created_at: datetime
+
+
+class CacheStats(BaseModel):
+    name: str
+    size: int
+    maxsize: int
+    ttl: float
+    hits: int
+    misses: int
+
+
+class JobReport(BaseModel):
+    name: str
+    rows: int
+    seconds: float
+
+
+class StorageGCSecretReport(BaseModel):
+    bucket_secret_id: int
+    scanned_objects: int = 0
+    orphaned_objects: int = 0
+    deleted_objects: int = 0
+    failed_deletions: int = 0
+    expired_pending_deletions: int = 0
+    expired_pending_uploads: int = 0
+    orphans_sample: list[str] = []
+    errors: list[str] = []
+
+
+class StorageGCReport(BaseModel):
+    dry_run: bool
+    seconds: float = 0
+    secrets: list[StorageGCSecretReport] = []
+
+
+class PoolStats(BaseModel):
+    size: int
+    max_overflow: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    checkouts: int
+    timeouts: int
+    wait_seconds: float
+    max_wait_seconds: float
+
+
+class ExecutorStats(BaseModel):
+    name: str
+    max_workers: int
+    max_queue: int
+    pending: int
+    completed: int
+    rejected: int
+    queue_wait_seconds: float
+    max_queue_wait_seconds: float
+    run_seconds: float
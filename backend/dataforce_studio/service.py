@@ -1,28 +1,47 @@
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator
+
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
 from fastapi.responses import JSONResponse
 from starlette.middleware.authentication import AuthenticationMiddleware
 
-from dataforce_studio.api.auth import auth_router
+from dataforce_studio.api.auth import auth_handler, auth_router
 from dataforce_studio.api.email_routes import email_routers
+from dataforce_studio.api.orbits.orbit_ml_models import NEXT_CURSOR_HEADER
 from dataforce_studio.api.organization.organization import organization_router
 from dataforce_studio.api.organization_routes import organization_all_routers
+from dataforce_studio.api.stats_routes import stats_routers
 from dataforce_studio.api.user_routes import users_routers
+from dataforce_studio.handlers.counters import CounterCheckHandler
+from dataforce_studio.handlers.emails import EmailHandler
+from dataforce_studio.handlers.ml_models import MLModelHandler
+from dataforce_studio.handlers.storage_gc import StorageGCHandler
+from dataforce_studio.infra.background import run_periodically
+from dataforce_studio.infra.cache import get_cache, listen_for_invalidations
 from dataforce_studio.infra.exceptions import ServiceError
+from dataforce_studio.infra.request_cache import RequestCacheMiddleware
 from dataforce_studio.infra.security import JWTAuthenticationBackend
+from dataforce_studio.infra.unit_of_work import UnitOfWorkMiddleware
+from dataforce_studio.settings import config
 
 
 class AppService(FastAPI):
     def __init__(self, *args, **kwargs) -> None:  # type: ignore
-        super().__init__(*args, **kwargs)
+        super().__init__(*args, lifespan=self.lifespan, **kwargs)
 
         self.include_router(router=auth_router, tags=["auth"])
         self.include_router(router=email_routers)
         self.include_router(router=users_routers)
         self.include_router(router=organization_router)
         self.include_router(router=organization_all_routers)
+        if config.STATS_ENDPOINTS_ENABLED:
+            self.include_router(router=stats_routers)
         self.include_authentication()
+        self.add_middleware(RequestCacheMiddleware)
+        self.add_middleware(UnitOfWorkMiddleware)
         self.include_error_handlers()
         self.custom_openapi()
 
@@ -32,8 +51,48 @@ class AppService(FastAPI):
             allow_credentials=True,
             allow_methods=["*"],
             allow_headers=["*"],
+            expose_headers=[NEXT_CURSOR_HEADER],
         )
 
+    @contextlib.asynccontextmanager
+    async def lifespan(self, app: FastAPI) -> AsyncIterator[None]:
+        listeners = [
+            asyncio.create_task(listen_for_invalidations()),
+            asyncio.create_task(auth_handler.listen_for_blacklisted_tokens()),
+            asyncio.create_task(
+                run_periodically(
+                    auth_handler.reap_expired_tokens, config.TOKEN_REAPER_INTERVAL
+                )
+            ),
+            asyncio.create_task(
+                run_periodically(
+                    MLModelHandler().resume_upload_verifications,
+                    config.UPLOAD_VERIFY_RESUME_INTERVAL,
+                )
+            ),
+            asyncio.create_task(
+                run_periodically(
+                    StorageGCHandler().run_garbage_collection,
+                    config.STORAGE_GC_INTERVAL,
+                )
+            ),
+            asyncio.create_task(
+                run_periodically(
+                    CounterCheckHandler().run_counter_check,
+                    config.COUNTER_CHECK_INTERVAL,
+                )
+            ),
+        ]
+        try:
+            yield
+        finally:
+            for listener in listeners:
+                listener.cancel()
+            await asyncio.gather(*listeners, return_exceptions=True)
+            await MLModelHandler().close()
+            await EmailHandler().close()
+            await get_cache().close()
+
     def include_authentication(self) -> None:
         self.add_middleware(
             AuthenticationMiddleware,
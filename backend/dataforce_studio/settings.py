@@ -9,6 +9,13 @@ class Settings(BaseSettings):
     BUCKET_SECRET_KEY: str
 
     POSTGRESQL_DSN: str
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    DB_PGBOUNCER_MODE: bool = False
 
     GOOGLE_CLIENT_ID: str
     GOOGLE_CLIENT_SECRET: str
@@ -27,6 +34,56 @@ class Settings(BaseSettings):
     TEMPLATE_ID_ORGANIZATION_INVITE_EMAIL: str
     TEMPLATE_ID_ADDED_TO_ORBIT_EMAIL: str
 
+    EMAIL_TRANSPORT: str = "sendgrid"
+    EMAIL_OUTBOX_WORKERS: int = 2
+    EMAIL_OUTBOX_QUEUE_SIZE: int = 10_000
+    EMAIL_OUTBOX_BATCH_SIZE: int = 50
+    EMAIL_OUTBOX_RATE_LIMIT: float = 10
+    EMAIL_OUTBOX_MAX_ATTEMPTS: int = 5
+    EMAIL_OUTBOX_RETRY_DELAY: float = 1
+    EMAIL_OUTBOX_SHUTDOWN_TIMEOUT: float = 10
+
+    CACHE_URL: str | None = None
+    STATS_ENDPOINTS_ENABLED: bool = False
+
+    ROLES_CACHE_TTL: int = 60
+    ROLES_CACHE_MAXSIZE: int = 10_000
+
+    AUTH_USER_CACHE_TTL: int = 30
+    AUTH_USER_CACHE_MAXSIZE: int = 10_000
+
+    STORAGE_CLIENTS_CACHE_TTL: int = 300
+    STORAGE_CLIENTS_CACHE_MAXSIZE: int = 1_000
+
+    MULTIPART_PART_SIZE: int = 64 * 1024**2
+    MULTIPART_PRESIGN_BATCH_SIZE: int = 100
+    STORAGE_STREAM_TIMEOUT: float = 30
+    STORAGE_STREAM_CHUNK_SIZE: int = 1024**2
+    UPLOAD_VERIFY_CONCURRENCY: int = 2
+    UPLOAD_VERIFY_RESUME_INTERVAL: float = 300
+    UPLOAD_VERIFY_RESUME_BATCH_SIZE: int = 100
+    ML_MODELS_PAGE_SIZE: int = 100
+    ML_MODELS_MAX_PAGE_SIZE: int = 500
+    STORAGE_GC_INTERVAL: float = 3600
+    STORAGE_GC_DRY_RUN: bool = True
+    STORAGE_GC_BATCH_SIZE: int = 1000
+    STORAGE_GC_RATE_LIMIT: float = 100
+    STORAGE_GC_PENDING_TTL: int = 86400
+    STORAGE_GC_ORPHAN_GRACE: int = 86400
+    STORAGE_GC_REPORT_SAMPLE_SIZE: int = 100
+    COUNTER_CHECK_INTERVAL: float = 3600
+
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_QUEUE_SIZE: int = 64
+
+    TOKEN_BLACKLIST_FILTER_ENABLED: bool = True
+    TOKEN_BLACKLIST_FILTER_CAPACITY: int = 50_000
+    TOKEN_BLACKLIST_FILTER_ERROR_RATE: float = 0.001
+    TOKEN_BLACKLIST_FILTER_BUCKET_SECONDS: int = 86_400
+
+    TOKEN_REAPER_INTERVAL: int = 300
+    TOKEN_REAPER_BATCH_SIZE: int = 1000
+
     # quickfix, to be refactored later
     model_config = SettingsConfigDict(
         env_file=".env.test" if "PYTEST_VERSION" in os.environ else ".env",
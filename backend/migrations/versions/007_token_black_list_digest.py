@@ -0,0 +1,51 @@
+"""Store token blacklist entries as unique digests
+
+Revision ID: 007
+Revises: 006
+Create Date: 2025-07-10 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "007"
+down_revision: str | None = "006"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "token_black_list",
+        sa.Column("token_digest", sa.String(length=64), nullable=True),
+    )
+    op.execute(
+        "UPDATE token_black_list "
+        "SET token_digest = encode(sha256(convert_to(token, 'UTF8')), 'hex')"
+    )
+    op.execute(
+        """
+        DELETE FROM token_black_list AS t
+        USING token_black_list AS d
+        WHERE t.token_digest = d.token_digest
+          AND (t.expire_at, t.id) < (d.expire_at, d.id)
+        """
+    )
+    op.alter_column("token_black_list", "token_digest", nullable=False)
+    op.create_unique_constraint(
+        "token_black_list_token_digest_key", "token_black_list", ["token_digest"]
+    )
+    op.drop_column("token_black_list", "token")
+
+
+def downgrade() -> None:
+    op.add_column("token_black_list", sa.Column("token", sa.String(), nullable=True))
+    op.execute("UPDATE token_black_list SET token = token_digest")
+    op.alter_column("token_black_list", "token", nullable=False)
+    op.drop_constraint(
+        "token_black_list_token_digest_key", "token_black_list", type_="unique"
+    )
+    op.drop_column("token_black_list", "token_digest")
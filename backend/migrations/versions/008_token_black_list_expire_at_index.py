@@ -0,0 +1,29 @@
+"""Index token blacklist expiry
+
+Revision ID: 008
+Revises: 007
+Create Date: 2025-07-12 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "008"
+down_revision: str | None = "007"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        op.f("ix_token_black_list_expire_at"),
+        "token_black_list",
+        ["expire_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_token_black_list_expire_at"), table_name="token_black_list")
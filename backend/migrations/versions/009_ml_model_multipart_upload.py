@@ -0,0 +1,64 @@
+"""Track multipart uploads of ML models
+
+Revision ID: 009
+Revises: 008
+Create Date: 2025-07-14 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "009"
+down_revision: str | None = "008"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "ml_models",
+        "size",
+        existing_type=sa.Integer(),
+        type_=sa.BigInteger(),
+        existing_nullable=False,
+    )
+    op.add_column("ml_models", sa.Column("upload_id", sa.String(), nullable=True))
+    op.add_column(
+        "ml_models", sa.Column("upload_part_size", sa.BigInteger(), nullable=True)
+    )
+    op.add_column(
+        "ml_models", sa.Column("upload_parts_count", sa.Integer(), nullable=True)
+    )
+    op.add_column(
+        "ml_models",
+        sa.Column(
+            "uploaded_parts_count",
+            sa.Integer(),
+            nullable=False,
+            server_default="0",
+        ),
+    )
+    op.add_column(
+        "ml_models",
+        sa.Column(
+            "uploaded_bytes", sa.BigInteger(), nullable=False, server_default="0"
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("ml_models", "uploaded_bytes")
+    op.drop_column("ml_models", "uploaded_parts_count")
+    op.drop_column("ml_models", "upload_parts_count")
+    op.drop_column("ml_models", "upload_part_size")
+    op.drop_column("ml_models", "upload_id")
+    op.alter_column(
+        "ml_models",
+        "size",
+        existing_type=sa.BigInteger(),
+        type_=sa.Integer(),
+        existing_nullable=False,
+    )
@@ -0,0 +1,36 @@
+"""Index ML model artifacts for deduplication
+
+Revision ID: 010
+Revises: 009
+Create Date: 2025-07-16 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "010"
+down_revision: str | None = "009"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        op.f("ix_ml_models_file_hash_size"),
+        "ml_models",
+        ["file_hash", "size"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_ml_models_bucket_location"),
+        "ml_models",
+        ["bucket_location"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_ml_models_bucket_location"), table_name="ml_models")
+    op.drop_index(op.f("ix_ml_models_file_hash_size"), table_name="ml_models")
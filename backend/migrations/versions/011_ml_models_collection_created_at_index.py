@@ -0,0 +1,31 @@
+"""Index ML models for keyset pagination
+
+Revision ID: 011
+Revises: 010
+Create Date: 2025-07-18 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "011"
+down_revision: str | None = "010"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        op.f("ix_ml_models_collection_id_created_at_id"),
+        "ml_models",
+        ["collection_id", "created_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f("ix_ml_models_collection_id_created_at_id"), table_name="ml_models"
+    )
@@ -0,0 +1,46 @@
+"""Index ML model tags, metrics and status for filtered listings
+
+Revision ID: 012
+Revises: 011
+Create Date: 2025-07-19 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "012"
+down_revision: str | None = "011"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        op.f("ix_ml_models_collection_id_status"),
+        "ml_models",
+        ["collection_id", "status"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_ml_models_tags"),
+        "ml_models",
+        ["tags"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"tags": "jsonb_path_ops"},
+    )
+    op.create_index(
+        op.f("ix_ml_models_metrics"),
+        "ml_models",
+        ["metrics"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_ml_models_metrics"), table_name="ml_models")
+    op.drop_index(op.f("ix_ml_models_tags"), table_name="ml_models")
+    op.drop_index(op.f("ix_ml_models_collection_id_status"), table_name="ml_models")
@@ -0,0 +1,51 @@
+"""Add indexes for foreign key and email lookups
+
+Revision ID: 013
+Revises: 012
+Create Date: 2025-07-20 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "013"
+down_revision: str | None = "012"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+INDEXES = [
+    ("bucket_secrets", "organization_id"),
+    ("collections", "orbit_id"),
+    ("orbits", "organization_id"),
+    ("orbits", "bucket_secret_id"),
+    ("orbit_members", "user_id"),
+    ("organization_members", "user_id"),
+    ("organization_invites", "email"),
+    ("organization_invites", "invited_by"),
+]
+
+
+def upgrade() -> None:
+    for table, column in INDEXES:
+        op.create_index(op.f(f"ix_{table}_{column}"), table, [column], unique=False)
+
+    op.execute(
+        """
+        DELETE FROM organization_invites AS invite
+        USING organization_invites AS duplicate
+        WHERE invite.organization_id = duplicate.organization_id
+          AND invite.email = duplicate.email
+          AND invite.id > duplicate.id
+        """
+    )
+    op.create_unique_constraint(
+        "org_invite_email", "organization_invites", ["organization_id", "email"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("org_invite_email", "organization_invites", type_="unique")
+    for table, column in reversed(INDEXES):
+        op.drop_index(op.f(f"ix_{table}_{column}"), table_name=table)
@@ -0,0 +1,107 @@
+"""Store orbit and collection counters as trigger-maintained columns
+
+Revision ID: 014
+Revises: 013
+Create Date: 2025-07-27 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "014"
+down_revision: str | None = "013"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+COUNTERS = [
+    ("orbits", "total_members", "orbit_members", "orbit_id"),
+    ("orbits", "total_collections", "collections", "orbit_id"),
+    ("collections", "total_models", "ml_models", "collection_id"),
+]
+
+TRANSITION_TABLES = {
+    "INSERT": "NEW TABLE AS new_rows",
+    "DELETE": "OLD TABLE AS old_rows",
+    "UPDATE": "OLD TABLE AS old_rows NEW TABLE AS new_rows",
+}
+
+ADJUST_COUNTER = """
+CREATE FUNCTION adjust_counter() RETURNS trigger LANGUAGE plpgsql AS $$
+DECLARE
+    changes text;
+BEGIN
+    changes := CASE TG_OP
+        WHEN 'INSERT' THEN
+            format('SELECT %1$I AS id, 1 AS change FROM new_rows', TG_ARGV[1])
+        WHEN 'DELETE' THEN
+            format('SELECT %1$I AS id, -1 AS change FROM old_rows', TG_ARGV[1])
+        ELSE
+            format(
+                'SELECT %1$I AS id, 1 AS change FROM new_rows '
+                'UNION ALL SELECT %1$I, -1 FROM old_rows',
+                TG_ARGV[1]
+            )
+    END;
+    EXECUTE format(
+        'UPDATE %1$I AS parent SET %2$I = parent.%2$I + delta.change '
+        'FROM (SELECT id, sum(change) AS change FROM (%3$s) AS changes '
+        'GROUP BY id HAVING sum(change) <> 0) AS delta '
+        'WHERE parent.id = delta.id',
+        TG_ARGV[0],
+        TG_ARGV[2],
+        changes
+    );
+    RETURN NULL;
+END
+$$
+"""
+
+
+def _trigger_name(child: str, counter: str, event: str) -> str:
+    return f"{child}_{counter}_{event.lower()}"
+
+
+def upgrade() -> None:
+    for parent, counter, child, foreign_key in COUNTERS:
+        op.add_column(
+            parent,
+            sa.Column(counter, sa.Integer(), server_default="0", nullable=False),
+        )
+        op.execute(
+            f"""
+            UPDATE {parent} SET {counter} = counts.total
+            FROM (
+                SELECT {foreign_key} AS id, count(*) AS total
+                FROM {child} GROUP BY {foreign_key}
+            ) AS counts
+            WHERE {parent}.id = counts.id
+            """
+        )
+
+    op.execute(ADJUST_COUNTER)
+    for parent, counter, child, foreign_key in COUNTERS:
+        for event, transition_tables in TRANSITION_TABLES.items():
+            op.execute(
+                f"""
+                CREATE TRIGGER {_trigger_name(child, counter, event)}
+                AFTER {event} ON {child}
+                REFERENCING {transition_tables}
+                FOR EACH STATEMENT
+                EXECUTE FUNCTION
+                    adjust_counter('{parent}', '{foreign_key}', '{counter}')
+                """
+            )
+
+
+def downgrade() -> None:
+    for _, counter, child, _ in reversed(COUNTERS):
+        for event in TRANSITION_TABLES:
+            op.execute(
+                f"DROP TRIGGER {_trigger_name(child, counter, event)} ON {child}"
+            )
+    op.execute("DROP FUNCTION adjust_counter()")
+    for parent, counter, _, _ in reversed(COUNTERS):
+        op.drop_column(parent, counter)
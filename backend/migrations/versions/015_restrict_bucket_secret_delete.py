@@ -0,0 +1,39 @@
+"""Reject deleting bucket secrets that are used by orbits
+
+Revision ID: 015
+Revises: 014
+Create Date: 2025-07-28 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "015"
+down_revision: str | None = "014"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.drop_constraint("orbits_bucket_secret_id_fkey", "orbits", type_="foreignkey")
+    op.create_foreign_key(
+        "orbits_bucket_secret_id_fkey",
+        "orbits",
+        "bucket_secrets",
+        ["bucket_secret_id"],
+        ["id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("orbits_bucket_secret_id_fkey", "orbits", type_="foreignkey")
+    op.create_foreign_key(
+        "orbits_bucket_secret_id_fkey",
+        "orbits",
+        "bucket_secrets",
+        ["bucket_secret_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
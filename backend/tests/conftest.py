@@ -10,6 +10,7 @@ from dataforce_studio.repositories.invites import InviteRepository
 from dataforce_studio.repositories.orbits import OrbitRepository
 from dataforce_studio.repositories.users import UserRepository
 from dataforce_studio.schemas.bucket_secrets import BucketSecretCreate
+from dataforce_studio.schemas.ml_models import Collection, CollectionType
 from dataforce_studio.schemas.orbit import (
     Orbit,
     OrbitCreateIn,
@@ -26,6 +27,7 @@ from dataforce_studio.schemas.organization import (
     OrganizationMemberCreate,
     OrganizationCreateIn,
 )
+from dataforce_studio.schemas.permissions import OrbitAccess
 from dataforce_studio.schemas.user import AuthProvider, CreateUser
 from dataforce_studio.settings import config
 from utils.db import migrate_db
@@ -138,6 +140,51 @@ member_data = {
 }
 
 
+def orbit_access(
+    organization_id: int,
+    orbit_id: int,
+    user_id: int,
+    collection_id: int | None = None,
+    org_role: OrgRole = OrgRole.OWNER,
+    orbit_role: OrbitRole | None = None,
+    with_orbit: bool = True,
+    total_models: int = 0,
+) -> OrbitAccess:
+    orbit = (
+        Orbit(
+            id=orbit_id,
+            name="test orbit",
+            organization_id=organization_id,
+            bucket_secret_id=1,
+            created_at=datetime.datetime.now(),
+        )
+        if with_orbit
+        else None
+    )
+    collection = (
+        Collection(
+            id=collection_id,
+            orbit_id=orbit_id,
+            description="description",
+            name="collection",
+            collection_type=CollectionType.MODEL,
+            tags=[],
+            total_models=total_models,
+            created_at=datetime.datetime.now(),
+        )
+        if orbit and collection_id
+        else None
+    )
+    return OrbitAccess(
+        organization_id=organization_id,
+        user_id=user_id,
+        org_role=org_role,
+        orbit_role=orbit_role,
+        orbit=orbit,
+        collection=collection,
+    )
+
+
 @pytest_asyncio.fixture(scope="function")
 def test_user(email: str | None = None) -> dict:
     return {
@@ -0,0 +1,44 @@
+import pytest
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from dataforce_studio.infra.db import engine_options, get_pool_stats
+from dataforce_studio.settings import config
+
+
+@pytest.mark.asyncio
+async def test_pool_stats(create_database_and_apply_migrations: str) -> None:
+    options = engine_options(
+        config.model_copy(
+            update={
+                "DB_POOL_SIZE": 1,
+                "DB_MAX_OVERFLOW": 0,
+                "DB_POOL_TIMEOUT": 0.05,
+                "DB_PGBOUNCER_MODE": True,
+            }
+        )
+    )
+    engine = create_async_engine(create_database_and_apply_migrations, **options)
+
+    async with engine.connect() as conn:
+        assert await conn.scalar(text("SELECT 1")) == 1
+        with pytest.raises(exc.TimeoutError):
+            async with engine.connect():
+                pass
+        stats = get_pool_stats(engine)
+
+        assert stats
+        assert stats.size == 1
+        assert stats.checked_out == 1
+        assert stats.checkouts == 2
+        assert stats.timeouts == 1
+        assert stats.max_wait_seconds >= 0.05
+
+    async with engine.connect() as conn:
+        assert await conn.scalar(text("SELECT 1")) == 1
+
+    stats = get_pool_stats(engine)
+    assert stats
+    assert stats.checked_in == 1
+    assert stats.checked_out == 0
+    await engine.dispose()
@@ -0,0 +1,165 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+
+import httpx
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from dataforce_studio.infra.db import engine_options, get_pool_stats
+from dataforce_studio.infra.unit_of_work import (
+    UnitOfWorkMiddleware,
+    after_commit,
+    get_unit_of_work_session,
+    release_unit_of_work,
+    unit_of_work,
+)
+from dataforce_studio.repositories.users import UserRepository
+from dataforce_studio.schemas.user import AuthProvider, CreateUser
+from dataforce_studio.settings import config
+
+
+def _user(name: str) -> CreateUser:
+    return CreateUser(
+        email=f"{name}@example.com",
+        full_name=name,
+        disabled=False,
+        email_verified=True,
+        auth_method=AuthProvider.EMAIL,
+    )
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_shares_session(
+    create_database_and_apply_migrations: str,
+) -> None:
+    engine = create_async_engine(
+        create_database_and_apply_migrations, **engine_options(config)
+    )
+    repo = UserRepository(engine)
+
+    async with unit_of_work(engine) as session:
+        await repo.create_user(_user("first"))
+        await repo.create_user(_user("second"))
+        assert await repo.get_user("first@example.com")
+        assert get_unit_of_work_session(engine) is session
+        assert await asyncio.create_task(_task_session(engine)) is None
+
+    stats = get_pool_stats(engine)
+    assert stats
+    assert stats.checkouts == 1
+    assert get_unit_of_work_session(engine) is None
+    assert await repo.get_user("second@example.com")
+    await engine.dispose()
+
+
+async def _task_session(engine: AsyncEngine) -> AsyncSession | None:
+    return get_unit_of_work_session(engine)
+
+
+async def _create_user_and_fail(
+    engine: AsyncEngine, repo: UserRepository, name: str
+) -> None:
+    async with unit_of_work(engine):
+        await repo.create_user(_user(name))
+        raise RuntimeError
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_rollback(create_database_and_apply_migrations: str) -> None:
+    engine = create_async_engine(create_database_and_apply_migrations)
+    repo = UserRepository(engine)
+
+    with pytest.raises(RuntimeError):
+        await _create_user_and_fail(engine, repo, "rolled-back")
+
+    async with unit_of_work(engine):
+        await repo.create_user(_user("kept"))
+        with pytest.raises(RuntimeError):
+            await _create_user_and_fail(engine, repo, "savepoint")
+
+    assert not await repo.get_user("rolled-back@example.com")
+    assert not await repo.get_user("savepoint@example.com")
+    assert await repo.get_user("kept@example.com")
+    await engine.dispose()
+
+
+async def _register_and_fail(
+    engine: AsyncEngine, callback: Callable[[], Awaitable[None]]
+) -> None:
+    async with unit_of_work(engine):
+        await after_commit(callback)
+        raise RuntimeError
+
+
+@pytest.mark.asyncio
+async def test_after_commit(create_database_and_apply_migrations: str) -> None:
+    engine = create_async_engine(create_database_and_apply_migrations)
+    repo = UserRepository(engine)
+    visible: list[bool] = []
+
+    async def check_visible() -> None:
+        visible.append(bool(await asyncio.create_task(repo.get_user("a@example.com"))))
+
+    async with unit_of_work(engine):
+        await repo.create_user(_user("a"))
+        await after_commit(check_visible)
+        assert visible == []
+
+    with pytest.raises(RuntimeError):
+        await _register_and_fail(engine, check_visible)
+
+    await after_commit(check_visible)
+
+    assert visible == [True, True]
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_release_unit_of_work(create_database_and_apply_migrations: str) -> None:
+    engine = create_async_engine(
+        create_database_and_apply_migrations, **engine_options(config)
+    )
+    repo = UserRepository(engine)
+
+    async with unit_of_work(engine) as session:
+        await repo.create_user(_user("released"))
+        await release_unit_of_work()
+
+        stats = get_pool_stats(engine)
+        assert stats
+        assert stats.checked_out == 0
+        assert await asyncio.create_task(repo.get_user("released@example.com"))
+
+        await repo.create_user(_user("after-release"))
+        assert get_unit_of_work_session(engine) is session
+
+    assert await repo.get_user("after-release@example.com")
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_middleware(
+    create_database_and_apply_migrations: str,
+) -> None:
+    engine = create_async_engine(create_database_and_apply_migrations)
+    repo = UserRepository(engine)
+
+    async def create_user(request: Request) -> JSONResponse:
+        name = request.path_params["name"]
+        await repo.create_user(_user(name))
+        return JSONResponse({}, status_code=int(request.query_params["status"]))
+
+    app = Starlette(routes=[Route("/users/{name}", create_user, methods=["POST"])])
+    app.add_middleware(UnitOfWorkMiddleware, db_engine=engine)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        assert (await client.post("/users/created?status=201")).status_code == 201
+        assert (await client.post("/users/rejected?status=409")).status_code == 409
+
+    assert await repo.get_user("created@example.com")
+    assert not await repo.get_user("rejected@example.com")
+    await engine.dispose()
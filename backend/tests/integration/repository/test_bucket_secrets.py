@@ -0,0 +1,39 @@
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from dataforce_studio.repositories.bucket_secrets import BucketSecretRepository
+from dataforce_studio.repositories.users import UserRepository
+
+
+@pytest.mark.asyncio
+async def test_delete_bucket_secret_in_use(create_orbit: dict) -> None:
+    engine, repo, orbit, organization, secret = (
+        create_orbit["engine"],
+        create_orbit["repo"],
+        create_orbit["orbit"],
+        create_orbit["organization"],
+        create_orbit["bucket_secret"],
+    )
+    secret_repo = BucketSecretRepository(engine)
+
+    with pytest.raises(IntegrityError):
+        await secret_repo.delete_bucket_secret(secret.id)
+
+    assert await secret_repo.get_bucket_secret(secret.id)
+    assert await repo.get_orbit_simple(orbit.id, organization.id)
+
+
+@pytest.mark.asyncio
+async def test_delete_organization_with_bucket_secret(create_orbit: dict) -> None:
+    engine, repo, orbit, organization, secret = (
+        create_orbit["engine"],
+        create_orbit["repo"],
+        create_orbit["orbit"],
+        create_orbit["organization"],
+        create_orbit["bucket_secret"],
+    )
+
+    await UserRepository(engine).delete_organization(organization.id)
+
+    assert not await BucketSecretRepository(engine).get_bucket_secret(secret.id)
+    assert not await repo.get_orbit_simple(orbit.id, organization.id)
@@ -0,0 +1,162 @@
+import asyncio
+
+import pytest
+from sqlalchemy import text
+
+from dataforce_studio.infra.unit_of_work import unit_of_work
+from dataforce_studio.repositories.collections import CollectionRepository
+from dataforce_studio.repositories.counters import CounterRepository
+from dataforce_studio.repositories.ml_models import MLModelRepository
+from dataforce_studio.schemas.ml_models import (
+    CollectionCreate,
+    CollectionType,
+    Manifest,
+    MLModelCreate,
+    MLModelStatus,
+)
+from dataforce_studio.schemas.orbit import OrbitMemberCreate, OrbitRole
+
+manifest = Manifest(
+    variant="pipeline",
+    description="",
+    producer_name="falcon.beastbyte.ai",
+    producer_version="0.8.0",
+    producer_tags=[],
+    inputs=[],
+    outputs=[],
+    dynamic_attributes=[],
+    env_vars=[],
+)
+
+
+def _model(collection_id: int, i: int) -> MLModelCreate:
+    return MLModelCreate(
+        collection_id=collection_id,
+        file_name=f"model-{i}.dfs",
+        metrics={},
+        manifest=manifest,
+        file_hash=f"hash-{i}",
+        file_index={},
+        bucket_location=f"model-{i}.dfs",
+        size=1,
+        unique_identifier=f"uid-{i}",
+        status=MLModelStatus.UPLOADED,
+    )
+
+
+@pytest.mark.asyncio
+async def test_counters_follow_writes(create_orbit: dict) -> None:
+    engine, repo, orbit, organization, user = (
+        create_orbit["engine"],
+        create_orbit["repo"],
+        create_orbit["orbit"],
+        create_orbit["organization"],
+        create_orbit["user"],
+    )
+    collection_repo = CollectionRepository(engine)
+    model_repo = MLModelRepository(engine)
+
+    member = await repo.create_orbit_member(
+        OrbitMemberCreate(user_id=user.id, orbit_id=orbit.id, role=OrbitRole.MEMBER)
+    )
+    collections = [
+        await collection_repo.create_collection(
+            CollectionCreate(
+                orbit_id=orbit.id,
+                description="",
+                name=f"collection-{i}",
+                collection_type=CollectionType.MODEL,
+            )
+        )
+        for i in range(2)
+    ]
+    models = [
+        await model_repo.create_ml_model(_model(collections[0].id, i)) for i in range(3)
+    ]
+    await model_repo.update_status(models[0].id, MLModelStatus.PENDING_DELETION)
+
+    fetched = await repo.get_orbit_simple(orbit.id, organization.id)
+    assert fetched
+    assert fetched.total_members == 1
+    assert fetched.total_collections == 2
+    collection = await collection_repo.get_collection(collections[0].id)
+    assert collection
+    assert collection.total_models == 3
+
+    await model_repo.delete_ml_model(models[0].id)
+    collection = await collection_repo.get_collection(collections[0].id)
+    assert collection
+    assert collection.total_models == 2
+
+    await repo.delete_orbit_member(member.id)
+    await collection_repo.delete_collection(collections[0].id)
+    fetched = await repo.get_orbit_simple(orbit.id, organization.id)
+    assert fetched
+    assert fetched.total_members == 0
+    assert fetched.total_collections == 1
+
+
+@pytest.mark.asyncio
+async def test_repair_counters(create_orbit: dict) -> None:
+    engine, repo, orbit, organization = (
+        create_orbit["engine"],
+        create_orbit["repo"],
+        create_orbit["orbit"],
+        create_orbit["organization"],
+    )
+    counter_repo = CounterRepository(engine)
+    await CollectionRepository(engine).create_collection(
+        CollectionCreate(
+            orbit_id=orbit.id,
+            description="",
+            name="collection",
+            collection_type=CollectionType.MODEL,
+        )
+    )
+
+    async with engine.begin() as conn:
+        await conn.execute(
+            text("UPDATE orbits SET total_collections = 5 WHERE id = :id"),
+            {"id": orbit.id},
+        )
+
+    assert await counter_repo.repair_counters() == {
+        "orbits.total_members": 0,
+        "orbits.total_collections": 1,
+        "collections.total_models": 0,
+    }
+    assert not any((await counter_repo.repair_counters()).values())
+    fetched = await repo.get_orbit_simple(orbit.id, organization.id)
+    assert fetched
+    assert fetched.total_collections == 1
+
+
+@pytest.mark.asyncio
+async def test_repair_counters_waits_for_concurrent_writes(create_orbit: dict) -> None:
+    engine, orbit = create_orbit["engine"], create_orbit["orbit"]
+    collection = await CollectionRepository(engine).create_collection(
+        CollectionCreate(
+            orbit_id=orbit.id,
+            description="",
+            name="collection",
+            collection_type=CollectionType.MODEL,
+        )
+    )
+    await MLModelRepository(engine).create_ml_model(_model(collection.id, 0))
+
+    async with engine.begin() as conn:
+        await conn.execute(
+            text("UPDATE collections SET total_models = 5 WHERE id = :id"),
+            {"id": collection.id},
+        )
+
+    async with unit_of_work(engine):
+        await MLModelRepository(engine).create_ml_model(_model(collection.id, 1))
+        repair = asyncio.create_task(CounterRepository(engine).repair_counters())
+        await asyncio.sleep(0.5)
+        assert not repair.done()
+
+    assert (await repair)["collections.total_models"] == 1
+    fetched = await CollectionRepository(engine).get_collection(collection.id)
+    assert fetched
+    assert fetched.total_models == 2
@@ -0,0 +1,124 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from dataforce_studio.repositories.collections import CollectionRepository
+from dataforce_studio.repositories.users import UserRepository
+from dataforce_studio.schemas.ml_models import CollectionCreate, CollectionType
+from dataforce_studio.schemas.orbit import (
+    OrbitMemberCreate,
+    OrbitRole,
+    UpdateOrbitMember,
+)
+from dataforce_studio.schemas.user import AuthProvider, CreateUser
+
+
+@contextmanager
+def _statements(engine: AsyncEngine) -> Iterator[list[str]]:
+    statements: list[str] = []
+
+    def capture(
+        conn: Connection, cursor: object, statement: str, *args: object
+    ) -> None:
+        statements.append(statement.split(None, 1)[0].upper())
+
+    event.listen(engine.sync_engine, "before_cursor_execute", capture)
+    try:
+        yield statements
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", capture)
+
+
+@pytest.mark.asyncio
+async def test_create_models_statement_count(create_orbit: dict) -> None:
+    engine, repo, orbit = (
+        create_orbit["engine"],
+        create_orbit["repo"],
+        create_orbit["orbit"],
+    )
+    user_repo = UserRepository(engine)
+    users = [
+        await user_repo.create_user(
+            CreateUser(
+                email=f"member{i}@example.com",
+                full_name=f"Member {i}",
+                disabled=False,
+                email_verified=True,
+                auth_method=AuthProvider.EMAIL,
+            )
+        )
+        for i in range(26)
+    ]
+
+    counts = []
+    for batch in (users[:1], users[1:]):
+        with _statements(engine) as statements:
+            created = await repo.create_orbit_members(
+                [
+                    OrbitMemberCreate(
+                        user_id=user.id, orbit_id=orbit.id, role=OrbitRole.MEMBER
+                    )
+                    for user in batch
+                ]
+            )
+
+        assert [member.user.id for member in created] == [user.id for user in batch]
+        assert statements[0] == "INSERT"
+        assert statements.count("INSERT") == 1
+        counts.append(len(statements))
+
+    assert counts[0] == counts[1]
+
+
+@pytest.mark.asyncio
+async def test_update_and_delete_statement_count(create_orbit: dict) -> None:
+    engine, repo, orbit, user = (
+        create_orbit["engine"],
+        create_orbit["repo"],
+        create_orbit["orbit"],
+        create_orbit["user"],
+    )
+    member = await repo.create_orbit_member(
+        OrbitMemberCreate(user_id=user.id, orbit_id=orbit.id, role=OrbitRole.MEMBER)
+    )
+
+    with _statements(engine) as statements:
+        updated = await repo.update_orbit_member(
+            UpdateOrbitMember(id=member.id, role=OrbitRole.ADMIN)
+        )
+
+    assert updated
+    assert updated.role == OrbitRole.ADMIN
+    assert statements[0] == "UPDATE"
+    assert statements.count("UPDATE") == 1
+
+    with _statements(engine) as statements:
+        await repo.delete_orbit_member(member.id)
+
+    assert statements == ["DELETE"]
+    assert await repo.get_orbit_members(orbit.id) == []
+
+
+@pytest.mark.asyncio
+async def test_create_model_statement_count(create_orbit: dict) -> None:
+    engine, orbit = create_orbit["engine"], create_orbit["orbit"]
+    repo = CollectionRepository(engine)
+
+    with _statements(engine) as statements:
+        collection = await repo.create_collection(
+            CollectionCreate(
+                orbit_id=orbit.id,
+                description="",
+                name="collection",
+                collection_type=CollectionType.MODEL,
+                tags=[],
+            )
+        )
+
+    assert collection.total_models == 0
+    assert statements[0] == "INSERT"
+    assert statements.count("INSERT") == 1
@@ -0,0 +1,406 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import pytest
+import pytest_asyncio
+
+from dataforce_studio.infra.unit_of_work import unit_of_work
+from dataforce_studio.repositories.bucket_secrets import BucketSecretRepository
+from dataforce_studio.repositories.collections import CollectionRepository
+from dataforce_studio.repositories.ml_models import MLModelRepository
+from dataforce_studio.repositories.orbits import OrbitRepository
+from dataforce_studio.schemas.ml_models import (
+    CollectionCreate,
+    CollectionType,
+    Manifest,
+    MetricFilter,
+    MLModel,
+    MLModelCreate,
+    MLModelListFilters,
+    MLModelStatus,
+    MLModelSummary,
+    MLModelUpdate,
+    MLModelUploadUpdate,
+    SortOrder,
+)
+from dataforce_studio.schemas.orbit import OrbitCreateIn
+
+manifest = Manifest(
+    variant="pipeline",
+    description="",
+    producer_name="falcon.beastbyte.ai",
+    producer_version="0.8.0",
+    producer_tags=[],
+    inputs=[],
+    outputs=[],
+    dynamic_attributes=[],
+    env_vars=[],
+)
+
+
+def _copy(model: MLModel, unique_identifier: str) -> MLModelCreate:
+    return MLModelCreate(
+        **model.model_dump(
+            exclude={"id", "created_at", "updated_at", "unique_identifier"}
+        ),
+        unique_identifier=unique_identifier,
+    )
+
+
+@pytest_asyncio.fixture(scope="function")
+async def create_collection_with_models(create_orbit: dict) -> dict:
+    engine, orbit = create_orbit["engine"], create_orbit["orbit"]
+    collection = await CollectionRepository(engine).create_collection(
+        CollectionCreate(
+            orbit_id=orbit.id,
+            description="desc",
+            name="models",
+            collection_type=CollectionType.MODEL,
+        )
+    )
+    repo = MLModelRepository(engine)
+    models = [
+        await repo.create_ml_model(
+            MLModelCreate(
+                collection_id=collection.id,
+                file_name=f"model-{i}.dfs",
+                metrics={"accuracy": i / 10},
+                manifest=manifest,
+                file_hash=f"hash-{i}",
+                file_index={},
+                bucket_location=f"orbit-{orbit.id}/model-{i}.dfs",
+                size=i + 1,
+                unique_identifier=f"uid-{i}",
+                tags=[f"tag-{i % 2}"],
+                status=MLModelStatus.UPLOADED,
+            )
+        )
+        for i in range(5)
+    ]
+    return {**create_orbit, "repo": repo, "collection": collection, "models": models}
+
+
+@pytest.mark.asyncio
+async def test_get_collection_models_page(create_collection_with_models: dict) -> None:
+    data = create_collection_with_models
+    repo, collection, models = data["repo"], data["collection"], data["models"]
+    expected = sorted(models, key=lambda m: (m.created_at, m.id), reverse=True)
+
+    pages = []
+    before = None
+    while page := await repo.get_collection_models_page(collection.id, 2, before):
+        pages.append([m.id for m in page])
+        before = (page[-1].created_at, page[-1].id)
+
+    assert pages == [
+        [m.id for m in expected[:2]],
+        [m.id for m in expected[2:4]],
+        [m.id for m in expected[4:]],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_collection_model_summaries_page(
+    create_collection_with_models: dict,
+) -> None:
+    data = create_collection_with_models
+    repo, collection, models = data["repo"], data["collection"], data["models"]
+    expected = sorted(models, key=lambda m: (m.created_at, m.id), reverse=True)
+
+    summaries = await repo.get_collection_model_summaries_page(collection.id, 10)
+    selected = await repo.get_collection_model_summaries_page(
+        collection.id, 2, None, ["accuracy", "missing"]
+    )
+    rest = await repo.get_collection_model_summaries_page(
+        collection.id, 10, (selected[-1].created_at, selected[-1].id), []
+    )
+
+    assert [s.id for s in summaries] == [m.id for m in expected]
+    assert summaries[0].model_dump() == expected[0].model_dump(
+        include=set(MLModelSummary.model_fields)
+    )
+    assert [s.metrics for s in selected] == [m.metrics for m in expected[:2]]
+    assert [s.id for s in rest] == [m.id for m in expected[2:]]
+    assert all(s.metrics == {} for s in rest)
+
+
+@pytest.mark.asyncio
+async def test_get_collection_model_downloads_page(
+    create_collection_with_models: dict,
+) -> None:
+    data = create_collection_with_models
+    repo, collection, models = data["repo"], data["collection"], data["models"]
+    await repo.update_ml_model(
+        models[3].id,
+        collection.id,
+        MLModelUpdate(id=models[3].id, status=MLModelStatus.PENDING_DELETION),
+    )
+    filters = MLModelListFilters(
+        ids=[models[1].id, models[3].id, models[4].id, 0],
+        status=[MLModelStatus.UPLOADED],
+    )
+
+    downloads = await repo.get_collection_model_downloads_page(
+        collection.id, 10, None, filters
+    )
+
+    assert [d.id for d in downloads] == [models[4].id, models[1].id]
+    assert [d.bucket_location for d in downloads] == [
+        models[4].bucket_location,
+        models[1].bucket_location,
+    ]
+    assert all(d.metrics == {} for d in downloads)
+    assert (
+        await repo.get_collection_model_downloads_page(
+            collection.id, 10, None, MLModelListFilters(ids=[])
+        )
+        == []
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_collection_models_filtered(
+    create_collection_with_models: dict,
+) -> None:
+    data = create_collection_with_models
+    repo, collection, models = data["repo"], data["collection"], data["models"]
+    await repo.update_status(models[4].id, MLModelStatus.UPLOAD_FAILED)
+
+    async def ids(filters: MLModelListFilters) -> list[int]:
+        page = await repo.get_collection_models_page(collection.id, 10, None, filters)
+        return [m.id for m in page]
+
+    accurate = MLModelListFilters(
+        metrics=[MetricFilter.parse("accuracy:gte:0.2")], tags=["tag-0"]
+    )
+    failed = MLModelListFilters(status=[MLModelStatus.UPLOAD_FAILED])
+
+    assert await ids(MLModelListFilters(tags=["tag-1"])) == [
+        models[3].id,
+        models[1].id,
+    ]
+    assert await ids(failed) == [models[4].id]
+    assert await ids(MLModelListFilters(search="EL-2")) == [models[2].id]
+    assert await ids(MLModelListFilters(search="%")) == []
+    assert await ids(accurate) == [models[4].id, models[2].id]
+    assert await ids(MLModelListFilters(metrics=[MetricFilter.parse("x:lt:1")])) == []
+
+    filters = MLModelListFilters(sort_metric="accuracy", order=SortOrder.ASC)
+    first = await repo.get_collection_models_page(collection.id, 2, None, filters)
+    rest = await repo.get_collection_models_page(
+        collection.id, 10, (first[-1].metrics["accuracy"], first[-1].id), filters
+    )
+    summaries = await repo.get_collection_model_summaries_page(
+        collection.id, 1, None, [], MLModelListFilters(sort_metric="accuracy")
+    )
+
+    assert [m.id for m in first + rest] == [m.id for m in models]
+    assert summaries[0].id == models[4].id
+    assert summaries[0].metrics == {"accuracy": 0.4}
+
+
+@pytest.mark.asyncio
+async def test_update_upload(create_collection_with_models: dict) -> None:
+    data = create_collection_with_models
+    repo, collection = data["repo"], data["collection"]
+    model = await repo.create_ml_model(
+        MLModelCreate(
+            collection_id=collection.id,
+            file_name="large.dfs",
+            metrics={},
+            manifest=manifest,
+            file_hash="hash",
+            file_index={},
+            bucket_location="orbit-1/large.dfs",
+            size=8 * 1024**3,
+            unique_identifier="uid-large",
+            upload_id="upload-id",
+            upload_part_size=64 * 1024**2,
+            upload_parts_count=128,
+        )
+    )
+
+    stale = await repo.update_upload(
+        model.id,
+        "other-upload",
+        MLModelUploadUpdate(id=model.id, status=MLModelStatus.UPLOADED),
+    )
+    progress = await repo.update_upload(
+        model.id,
+        "upload-id",
+        MLModelUploadUpdate(
+            id=model.id, uploaded_parts_count=3, uploaded_bytes=192 * 1024**2
+        ),
+    )
+    completed = await repo.update_upload(
+        model.id,
+        "upload-id",
+        MLModelUploadUpdate(id=model.id, status=MLModelStatus.UPLOADED, upload_id=None),
+    )
+
+    assert model.size == 8 * 1024**3
+    assert stale is None
+    assert progress
+    assert progress.uploaded_parts_count == 3
+    assert progress.status == MLModelStatus.PENDING_UPLOAD
+    assert completed
+    assert completed.status == MLModelStatus.UPLOADED
+    assert completed.upload_id is None
+    assert completed.uploaded_bytes == 192 * 1024**2
+
+
+@pytest.mark.asyncio
+async def test_verification_status(create_collection_with_models: dict) -> None:
+    data = create_collection_with_models
+    repo, orbit, models = data["repo"], data["orbit"], data["models"]
+
+    await repo.update_status(models[0].id, MLModelStatus.VERIFYING)
+    pending = [
+        item
+        for item in await repo.get_models_to_verify(1000)
+        if item.model.collection_id == models[0].collection_id
+    ]
+    stale = await repo.update_status(
+        models[1].id, MLModelStatus.UPLOAD_FAILED, MLModelStatus.VERIFYING
+    )
+    verified = await repo.update_status(
+        models[0].id, MLModelStatus.UPLOADED, MLModelStatus.VERIFYING
+    )
+
+    assert [item.model.id for item in pending] == [models[0].id]
+    assert pending[0].bucket_secret_id == orbit.bucket_secret_id
+    assert stale is None
+    assert verified
+    assert verified.status == MLModelStatus.UPLOADED
+
+
+@pytest.mark.asyncio
+async def test_deduplication_lookups(create_collection_with_models: dict) -> None:
+    data = create_collection_with_models
+    repo, orbit, models = data["repo"], data["orbit"], data["models"]
+    original = models[2]
+
+    duplicate = await repo.create_ml_model(
+        MLModelCreate(
+            **original.model_dump(
+                exclude={"id", "created_at", "updated_at", "unique_identifier"}
+            ),
+            unique_identifier="uid-copy",
+        )
+    )
+    await repo.update_status(models[3].id, MLModelStatus.PENDING_DELETION)
+    other = await OrbitRepository(data["engine"]).create_orbit(
+        data["organization"].id,
+        OrbitCreateIn(name="other orbit", bucket_secret_id=orbit.bucket_secret_id),
+    )
+
+    found = await repo.get_uploaded_model_by_hash(
+        orbit.id, original.file_hash, original.size
+    )
+    other_orbit = await repo.get_uploaded_model_by_hash(
+        other.id, original.file_hash, original.size
+    )
+    other_size = await repo.get_uploaded_model_by_hash(
+        orbit.id, original.file_hash, original.size + 1
+    )
+    pending = await repo.get_uploaded_model_by_hash(
+        orbit.id, models[3].file_hash, models[3].size
+    )
+
+    assert found
+    assert found.id == original.id
+    assert other_orbit is None
+    assert other_size is None
+    assert pending is None
+    assert (
+        await repo.get_object_references_count(original.bucket_location, original.id)
+        == 1
+    )
+    assert (
+        await repo.get_object_references_count(duplicate.bucket_location, duplicate.id)
+        == 1
+    )
+    assert (
+        await repo.get_object_references_count(models[4].bucket_location, models[4].id)
+        == 0
+    )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_deletes_release_shared_object(
+    create_collection_with_models: dict,
+) -> None:
+    data = create_collection_with_models
+    engine, repo, original = data["engine"], data["repo"], data["models"][2]
+    duplicate = await repo.create_ml_model(_copy(original, "uid-copy"))
+    first_marked = asyncio.Event()
+    release_first = asyncio.Event()
+
+    async def delete_first() -> bool:
+        async with unit_of_work(engine):
+            last = await repo.mark_for_deletion(original.id, original.bucket_location)
+            first_marked.set()
+            await release_first.wait()
+        return last
+
+    async def delete_second() -> bool:
+        await first_marked.wait()
+        async with unit_of_work(engine):
+            return await repo.mark_for_deletion(duplicate.id, duplicate.bucket_location)
+
+    first = asyncio.create_task(delete_first())
+    second = asyncio.create_task(delete_second())
+    await first_marked.wait()
+    await asyncio.sleep(0.2)
+    assert not second.done()
+    release_first.set()
+
+    assert await first is False
+    assert await second is True
+    assert (
+        await repo.get_object_references_count(original.bucket_location, original.id)
+        == 0
+    )
+
+
+@pytest.mark.asyncio
+async def test_copy_skips_object_being_deleted(
+    create_collection_with_models: dict,
+) -> None:
+    data = create_collection_with_models
+    repo, original = data["repo"], data["models"][2]
+
+    copy = await repo.create_ml_model_copy(_copy(original, "uid-copy"))
+    assert copy
+    assert not await repo.mark_for_deletion(original.id, original.bucket_location)
+    assert await repo.mark_for_deletion(copy.id, copy.bucket_location)
+    assert await repo.create_ml_model_copy(_copy(original, "uid-late")) is None
+
+
+@pytest.mark.asyncio
+async def test_storage_gc_lookups(create_collection_with_models: dict) -> None:
+    data = create_collection_with_models
+    engine, repo, orbit = data["engine"], data["repo"], data["orbit"]
+    models = data["models"]
+    ids = {m.id for m in models}
+    now = datetime.now(UTC)
+
+    stale = await repo.get_stale_models(
+        MLModelStatus.UPLOADED, now + timedelta(hours=1), models[0].id, 1000
+    )
+    fresh = await repo.get_stale_models(
+        MLModelStatus.UPLOADED, now - timedelta(hours=1), 0, 1000
+    )
+    existing = await repo.get_existing_locations(
+        [models[0].bucket_location, models[1].bucket_location, "orbit-0/missing"]
+    )
+    secrets = await BucketSecretRepository(engine).get_bucket_secrets(
+        orbit.bucket_secret_id - 1, 1
+    )
+
+    assert {item.model.id for item in stale} & ids == ids - {models[0].id}
+    assert all(item.bucket_secret_id == orbit.bucket_secret_id for item in stale)
+    assert not {item.model.id for item in fresh} & ids
+    assert existing == {models[0].bucket_location, models[1].bucket_location}
+    assert await repo.get_existing_locations([]) == set()
+    assert [secret.id for secret in secrets] == [orbit.bucket_secret_id]
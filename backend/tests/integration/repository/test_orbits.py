@@ -1,18 +1,23 @@
 import pytest
+from sqlalchemy.exc import IntegrityError
 
 from dataforce_studio.repositories.bucket_secrets import BucketSecretRepository
+from dataforce_studio.repositories.collections import CollectionRepository
 from dataforce_studio.repositories.orbits import OrbitRepository
 from dataforce_studio.schemas.bucket_secrets import BucketSecretCreate
+from dataforce_studio.schemas.ml_models import CollectionCreate, CollectionType
 from dataforce_studio.schemas.orbit import (
     Orbit,
     OrbitCreateIn,
     OrbitDetails,
     OrbitMember,
     OrbitMemberCreate,
+    OrbitMemberCreateSimple,
     OrbitRole,
     OrbitUpdate,
     UpdateOrbitMember,
 )
+from dataforce_studio.schemas.organization import OrgRole
 
 
 @pytest.mark.asyncio
@@ -33,6 +38,27 @@ async def test_create_orbit(create_organization_with_user: dict) -> None:
     # assert created_orbit.organization_id == orbit.organization_id
 
 
+@pytest.mark.asyncio
+async def test_create_orbit_is_atomic(create_organization_with_user: dict) -> None:
+    data = create_organization_with_user
+    engine, organization, secret = (
+        data["engine"],
+        data["organization"],
+        data["bucket_secret"],
+    )
+    repo = OrbitRepository(engine)
+
+    orbit = OrbitCreateIn(
+        name="test orbit",
+        bucket_secret_id=secret.id,
+        members=[OrbitMemberCreateSimple(user_id=999_999, role=OrbitRole.MEMBER)],
+    )
+    with pytest.raises(IntegrityError):
+        await repo.create_orbit(organization.id, orbit)
+
+    assert await repo.get_organization_orbits(organization.id) == []
+
+
 @pytest.mark.asyncio
 async def test_update_orbit(create_organization_with_user: dict) -> None:
     data = create_organization_with_user
@@ -205,3 +231,51 @@ async def test_delete_orbit_member(create_orbit: dict) -> None:
     deleted_member = await repo.delete_orbit_member(created_member.id)
 
     assert deleted_member is None
+
+
+@pytest.mark.asyncio
+async def test_get_orbit_access(create_orbit: dict) -> None:
+    data = create_orbit
+    engine, repo, orbit, user = (
+        data["engine"],
+        data["repo"],
+        data["orbit"],
+        data["user"],
+    )
+    collection = await CollectionRepository(engine).create_collection(
+        CollectionCreate(
+            orbit_id=orbit.id,
+            description="description",
+            name="collection",
+            collection_type=CollectionType.MODEL,
+        )
+    )
+
+    access = await repo.get_orbit_access(
+        orbit.organization_id, orbit.id, user.id, collection.id
+    )
+
+    assert access
+    assert access.org_role == OrgRole.OWNER
+    assert access.orbit_role is None
+    assert access.orbit
+    assert access.orbit.id == orbit.id
+    assert access.collection
+    assert access.collection.id == collection.id
+    assert access.collection.total_models == 0
+
+
+@pytest.mark.asyncio
+async def test_get_orbit_access_other_organization(create_orbit: dict) -> None:
+    data = create_orbit
+    repo, orbit, user = data["repo"], data["orbit"], data["user"]
+
+    access = await repo.get_orbit_access(orbit.organization_id + 1, orbit.id, user.id)
+    missing_orbit = await repo.get_orbit_access(
+        orbit.organization_id, orbit.id + 1, user.id
+    )
+
+    assert access is None
+    assert missing_orbit
+    assert missing_orbit.orbit is None
+    assert missing_orbit.collection is None
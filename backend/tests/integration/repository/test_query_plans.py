@@ -0,0 +1,241 @@
+import hashlib
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from dataforce_studio.repositories.bucket_secrets import BucketSecretRepository
+from dataforce_studio.repositories.collections import CollectionRepository
+from dataforce_studio.repositories.invites import InviteRepository
+from dataforce_studio.repositories.ml_models import MLModelRepository
+from dataforce_studio.repositories.orbits import OrbitRepository
+from dataforce_studio.repositories.token_blacklist import TokenBlackListRepository
+from dataforce_studio.repositories.users import UserRepository
+from dataforce_studio.schemas.ml_models import MLModelListFilters, MLModelStatus
+
+USERS = 20_000
+ORGANIZATIONS = 2_000
+ORBITS = 4_000
+COLLECTIONS = 8_000
+MODELS = 40_000
+
+MANIFEST = (
+    '{"variant": "pipeline", "producer_name": "test", "producer_version": "1", '
+    '"producer_tags": [], "inputs": [], "outputs": [], '
+    '"dynamic_attributes": [], "env_vars": []}'
+)
+
+SEED = [
+    f"""
+    INSERT INTO users (email, full_name, disabled, email_verified, auth_method)
+    SELECT 'user' || i || '@example.com', 'User ' || i, false, true, 'EMAIL'
+    FROM generate_series(1, {USERS}) AS i
+    """,
+    f"""
+    INSERT INTO organizations (name)
+    SELECT 'Organization ' || i FROM generate_series(1, {ORGANIZATIONS}) AS i
+    """,
+    f"""
+    INSERT INTO organization_members (user_id, organization_id, role)
+    SELECT i, (i - 1) % {ORGANIZATIONS} + 1, 'member'
+    FROM generate_series(1, {USERS}) AS i
+    """,
+    f"""
+    INSERT INTO bucket_secrets (organization_id, endpoint, bucket_name)
+    SELECT i, 's3.example.com', 'bucket-' || i
+    FROM generate_series(1, {ORGANIZATIONS}) AS i
+    """,
+    f"""
+    INSERT INTO orbits (name, organization_id, bucket_secret_id)
+    SELECT 'Orbit ' || i, (i - 1) % {ORGANIZATIONS} + 1, (i - 1) % {ORGANIZATIONS} + 1
+    FROM generate_series(1, {ORBITS}) AS i
+    """,
+    f"""
+    INSERT INTO orbit_members (user_id, orbit_id, role)
+    SELECT i, (i - 1) % {ORBITS} + 1, 'member' FROM generate_series(1, {USERS}) AS i
+    """,
+    f"""
+    INSERT INTO collections (orbit_id, description, name, type, tags)
+    SELECT (i - 1) % {ORBITS} + 1, '', 'Collection ' || i, 'model', '[]'
+    FROM generate_series(1, {COLLECTIONS}) AS i
+    """,
+    f"""
+    INSERT INTO ml_models (
+        collection_id, file_name, metrics, manifest, file_hash, file_index,
+        bucket_location, size, unique_identifier, tags, status
+    )
+    SELECT
+        (i - 1) % {COLLECTIONS} + 1,
+        'model-' || i || '.dfs',
+        jsonb_build_object('accuracy', i % 100 / 100.0),
+        '{MANIFEST}',
+        md5(i::text),
+        '{{}}',
+        'orbit-' || i || '/' || md5(i::text) || '-model.dfs',
+        i,
+        md5(i::text),
+        jsonb_build_array('tag-' || i % 10),
+        'uploaded'
+    FROM generate_series(1, {MODELS}) AS i
+    """,
+    f"""
+    INSERT INTO organization_invites (email, role, organization_id, invited_by)
+    SELECT 'invitee' || i || '@example.com', 'member', (i - 1) % {ORGANIZATIONS} + 1, i
+    FROM generate_series(1, {USERS}) AS i
+    """,
+    f"""
+    INSERT INTO token_black_list (token_digest, expire_at)
+    SELECT md5(i::text), extract(epoch FROM now())::int + 3600
+    FROM generate_series(1, {USERS}) AS i
+    """,
+    "ANALYZE",
+]
+
+SEEDED_TABLES = {
+    "users",
+    "organizations",
+    "organization_members",
+    "bucket_secrets",
+    "orbits",
+    "orbit_members",
+    "collections",
+    "ml_models",
+    "organization_invites",
+    "token_black_list",
+}
+
+
+@pytest_asyncio.fixture(scope="function")
+async def seeded_engine(create_database_and_apply_migrations: str) -> AsyncEngine:
+    engine = create_async_engine(create_database_and_apply_migrations)
+    async with engine.begin() as conn:
+        for statement in SEED:
+            await conn.execute(text(statement))
+    return engine
+
+
+def _digest(value: int) -> str:
+    return hashlib.md5(str(value).encode()).hexdigest()
+
+
+def _seq_scans(plan: dict) -> list[str]:
+    scans = []
+    if plan["Node Type"] == "Seq Scan" and plan["Relation Name"] in SEEDED_TABLES:
+        scans.append(plan["Relation Name"])
+    for child in plan.get("Plans", []):
+        scans.extend(_seq_scans(child))
+    return scans
+
+
+def _queries(engine: AsyncEngine) -> dict[str, Callable[[], Awaitable[Any]]]:
+    users = UserRepository(engine)
+    orbits = OrbitRepository(engine)
+    collections = CollectionRepository(engine)
+    models = MLModelRepository(engine)
+    invites = InviteRepository(engine)
+    secrets = BucketSecretRepository(engine)
+    tokens = TokenBlackListRepository(engine)
+    location = f"orbit-123/{_digest(123)}-model.dfs"
+
+    return {
+        "get_user": lambda: users.get_user("user123@example.com"),
+        "get_public_user_by_id": lambda: users.get_public_user_by_id(123),
+        "get_user_organizations": lambda: users.get_user_organizations(123),
+        "get_organization_details": lambda: users.get_organization_details(123),
+        "get_organization_members": lambda: users.get_organization_members(123),
+        "get_organization_member": lambda: users.get_organization_member(123, 123),
+        "get_organization_member_by_email": (
+            lambda: users.get_organization_member_by_email(123, "user123@example.com")
+        ),
+        "get_organization_members_count": (
+            lambda: users.get_organization_members_count(123)
+        ),
+        "get_user_organizations_membership_count": (
+            lambda: users.get_user_organizations_membership_count(123)
+        ),
+        "get_organization_orbits": lambda: orbits.get_organization_orbits(123),
+        "get_organization_orbits_for_user": (
+            lambda: orbits.get_organization_orbits_for_user(123, 123)
+        ),
+        "get_orbit": lambda: orbits.get_orbit(123, 123),
+        "get_orbit_members": lambda: orbits.get_orbit_members(123),
+        "get_orbit_member_role": lambda: orbits.get_orbit_member_role(123, 123),
+        "get_orbit_access": lambda: orbits.get_orbit_access(123, 123, 123, 123),
+        "get_orbit_collections": lambda: collections.get_orbit_collections(123),
+        "get_collection": lambda: collections.get_collection(123),
+        "get_collection_models_page": (
+            lambda: models.get_collection_models_page(123, 100)
+        ),
+        "get_collection_model_summaries_page": (
+            lambda: models.get_collection_model_summaries_page(123, 100)
+        ),
+        "get_collection_model_downloads_page": (
+            lambda: models.get_collection_model_downloads_page(
+                123, 100, None, MLModelListFilters(status=[MLModelStatus.UPLOADED])
+            )
+        ),
+        "get_ml_model": lambda: models.get_ml_model(123, 123),
+        "get_uploaded_model_by_hash": (
+            lambda: models.get_uploaded_model_by_hash(123, _digest(123), 123)
+        ),
+        "get_object_references_count": (
+            lambda: models.get_object_references_count(location, 0)
+        ),
+        "get_existing_locations": lambda: models.get_existing_locations([location]),
+        "get_organization_invite_by_email": (
+            lambda: invites.get_organization_invite_by_email(
+                123, "invitee123@example.com"
+            )
+        ),
+        "get_invites_by_organization_id": (
+            lambda: invites.get_invites_by_organization_id(123)
+        ),
+        "get_invites_by_user_email": (
+            lambda: invites.get_invites_by_user_email("invitee123@example.com")
+        ),
+        "get_organization_bucket_secrets": (
+            lambda: secrets.get_organization_bucket_secrets(123)
+        ),
+        "get_bucket_secret": lambda: secrets.get_bucket_secret(123),
+        "is_token_blacklisted": lambda: tokens.is_token_blacklisted(_digest(123)),
+    }
+
+
+@pytest.mark.asyncio
+async def test_repository_queries_use_indexes(seeded_engine: AsyncEngine) -> None:
+    statements: list[tuple[str, Any]] = []
+
+    def capture(
+        conn: Any,  # noqa: ANN401
+        cursor: Any,  # noqa: ANN401
+        statement: str,
+        parameters: Any,  # noqa: ANN401
+        context: Any,  # noqa: ANN401
+        executemany: bool,
+    ) -> None:
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    seq_scans = {}
+    for name, query in _queries(seeded_engine).items():
+        statements.clear()
+        event.listen(seeded_engine.sync_engine, "before_cursor_execute", capture)
+        try:
+            await query()
+        finally:
+            event.remove(seeded_engine.sync_engine, "before_cursor_execute", capture)
+
+        assert statements, name
+        async with seeded_engine.connect() as conn:
+            for statement, parameters in statements:
+                result = await conn.exec_driver_sql(
+                    f"EXPLAIN (FORMAT JSON) {statement}", parameters
+                )
+                scans = _seq_scans(result.scalar_one()[0]["Plan"])
+                if scans:
+                    seq_scans.setdefault(name, []).extend(scans)
+
+    assert seq_scans == {}
@@ -39,13 +39,29 @@ async def test_delete_expired_tokens(create_database_and_apply_migrations: str)
     engine = create_async_engine(create_database_and_apply_migrations)
     repo = TokenBlackListRepository(engine)
 
-    token = "test-token-test_delete_expired_tokens"
     expire = int(time.time()) - 60
-    for _ in range(3):
-        await repo.add_token(token, expire)
+    for i in range(3):
+        await repo.add_token(f"test-token-test_delete_expired_tokens-{i}", expire)
+    await repo.add_token("test-token-active", expire + 120)
 
-    deleted = await repo.delete_expired_tokens()
-    is_blacklisted = await repo.is_token_blacklisted(token)
+    first_batch = await repo.delete_expired_tokens(batch_size=2)
+    second_batch = await repo.delete_expired_tokens(batch_size=2)
+    active_tokens = await repo.get_active_tokens()
 
-    assert deleted is None
-    assert is_blacklisted is False
+    assert first_batch == 2
+    assert second_batch == 1
+    assert active_tokens == [("test-token-active", expire + 120)]
+
+
+@pytest.mark.asyncio
+async def test_get_active_tokens(create_database_and_apply_migrations: str) -> None:
+    engine = create_async_engine(create_database_and_apply_migrations)
+    repo = TokenBlackListRepository(engine)
+
+    active_expire = int(time.time()) + 60
+    await repo.add_token("test-token-active", active_expire)
+    await repo.add_token("test-token-expired", int(time.time()) - 60)
+
+    tokens = await repo.get_active_tokens()
+
+    assert tokens == [("test-token-active", active_expire)]
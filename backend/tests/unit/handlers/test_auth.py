@@ -1,4 +1,5 @@
 import random
+from hashlib import sha256
 from time import time
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
@@ -8,6 +9,8 @@ from jwt.exceptions import InvalidTokenError
 from passlib.context import CryptContext
 
 from dataforce_studio.handlers.auth import AuthHandler
+from dataforce_studio.infra.bloom_filter import ExpiringBloomFilter
+from dataforce_studio.infra.cache import create_cache, get_cache, set_cache
 from dataforce_studio.infra.exceptions import AuthError
 from dataforce_studio.models.auth import Token
 from dataforce_studio.schemas.user import (
@@ -21,6 +24,7 @@ from dataforce_studio.schemas.user import (
     SignInUser,
     SignInResponse,
 )
+from dataforce_studio.settings import config
 
 secret_key = "test"
 algorithm = "HS256"
@@ -79,20 +83,22 @@ def get_tokens() -> Token:
 
 
 @patch("passlib.context.CryptContext.hash")
-def test_get_password_hash(patched_hash: Mock) -> None:
+@pytest.mark.asyncio
+async def test_get_password_hash(patched_hash: Mock) -> None:
     patched_hash.return_value = passwords["hashed_password"]
 
-    hashed_password_from_auth_handler = handler._get_password_hash(
+    hashed_password_from_auth_handler = await handler._get_password_hash(
         passwords["password"]
     )
     assert passwords["hashed_password"] == hashed_password_from_auth_handler
 
 
 @patch("passlib.context.CryptContext.verify")
-def test_verify_password(mock_verify: Mock) -> None:
+@pytest.mark.asyncio
+async def test_verify_password(mock_verify: Mock) -> None:
     mock_verify.return_value = True
 
-    actual = handler._verify_password(
+    actual = await handler._verify_password(
         passwords["password"], passwords["hashed_password"]
     )
 
@@ -208,6 +214,19 @@ async def test_create_tokens() -> None:
     assert actual.token_type == "bearer"
 
 
+def test_create_token_jti() -> None:
+    tokens = handler._create_tokens(user_data["email"])
+    access_payload = jwt.decode(tokens.access_token, secret_key, algorithms=[algorithm])
+    refresh_payload = jwt.decode(
+        tokens.refresh_token, secret_key, algorithms=[algorithm]
+    )
+
+    assert access_payload["jti"] != refresh_payload["jti"]
+    assert handler._get_token_digest(tokens.access_token) == (
+        sha256(access_payload["jti"].encode()).hexdigest()
+    )
+
+
 @patch("dataforce_studio.handlers.auth.jwt.decode")
 def test_verify_token_valid(mock_jwt_decode: MagicMock) -> None:
     mock_jwt_decode.return_value = {"sub": user_data["email"]}
@@ -247,11 +266,11 @@ def test_verify_token_invalid_jwt(mock_jwt_decode: MagicMock) -> None:
 )
 @patch(
     "dataforce_studio.handlers.auth.EmailHandler.send_activation_email",
-    new_callable=MagicMock,
+    new_callable=AsyncMock,
 )
 @pytest.mark.asyncio
 async def test_handle_signup(
-    mock_send_activation_email: MagicMock,
+    mock_send_activation_email: AsyncMock,
     mock_create_user: AsyncMock,
     mock_get_user: AsyncMock,
     mock_hash: Mock,
@@ -271,7 +290,7 @@ async def test_handle_signup(
 
     assert actual
     assert actual["detail"] == "Please confirm your email address"
-    mock_send_activation_email.assert_called_once()
+    mock_send_activation_email.assert_awaited_once()
     mock_hash.assert_called_once_with(create_user_in.password)
     mock_get_user.assert_awaited_once_with(create_user.email)
     mock_create_user.assert_awaited_once_with(create_user=create_user)
@@ -360,7 +379,9 @@ async def test_handle_refresh_token(
     result = await handler.handle_refresh_token(tokens.refresh_token)
 
     assert result == tokens
-    mock_is_token_blacklisted.assert_awaited_once_with(tokens.refresh_token)
+    mock_is_token_blacklisted.assert_awaited_once_with(
+        sha256(tokens.refresh_token.encode()).hexdigest()
+    )
     mock_get_user.assert_awaited_once_with(user.email)
     mock_add_token.assert_awaited_once()
     mock_create_tokens.assert_called_once_with(user.email)
@@ -431,7 +452,9 @@ async def test_handle_refresh_token_has_been_revoked(
         await handler.handle_refresh_token(tokens.refresh_token)
 
     assert error.value.status_code == 400
-    mock_is_token_blacklisted.assert_awaited_once_with(tokens.refresh_token)
+    mock_is_token_blacklisted.assert_awaited_once_with(
+        sha256(tokens.refresh_token.encode()).hexdigest()
+    )
 
 
 @patch("dataforce_studio.handlers.auth.jwt.decode")
@@ -463,7 +486,9 @@ async def test_handle_refresh_token_user_not_found(
         await handler.handle_refresh_token(tokens.refresh_token)
 
     assert error.value.status_code == 404
-    mock_is_token_blacklisted.assert_awaited_once_with(tokens.refresh_token)
+    mock_is_token_blacklisted.assert_awaited_once_with(
+        sha256(tokens.refresh_token.encode()).hexdigest()
+    )
     mock_get_user.assert_awaited_once_with(user.email)
 
 
@@ -571,6 +596,49 @@ async def test_handle_get_current_account_is_disabled(
     mock_get_public_user.assert_awaited_once_with(user.email)
 
 
+@patch("dataforce_studio.handlers.auth.UserRepository.get_user", new_callable=AsyncMock)
+@patch(
+    "dataforce_studio.handlers.auth.UserRepository.update_user", new_callable=AsyncMock
+)
+@patch(
+    "dataforce_studio.handlers.auth.UserRepository.get_public_user",
+    new_callable=AsyncMock,
+)
+@pytest.mark.asyncio
+async def test_get_auth_user_cached(
+    mock_get_public_user: AsyncMock,
+    mock_update_user: AsyncMock,
+    mock_get_user: AsyncMock,
+) -> None:
+    user = UserOut.model_validate({**user_data, "email": "cached@example.com"})
+    token = handler._create_tokens(user.email).access_token
+    mock_get_public_user.return_value = user
+
+    for _ in range(3):
+        auth_user = await handler.get_auth_user(token)
+        assert auth_user.id == user.id
+        assert auth_user.email == user.email
+
+    mock_get_public_user.assert_awaited_once_with(user.email)
+
+    mock_get_user.return_value = user_data
+    await handler.update_user(user.email, UpdateUserIn(disabled=True))
+    mock_get_public_user.return_value = user.model_copy(update={"disabled": True})
+
+    with pytest.raises(AuthError, match="Account is disabled"):
+        await handler.get_auth_user(token)
+
+    assert mock_get_public_user.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_auth_user_invalid_token() -> None:
+    with pytest.raises(AuthError, match="Invalid token") as error:
+        await handler.get_auth_user("invalid")
+
+    assert error.value.status_code == 401
+
+
 @patch("dataforce_studio.handlers.auth.jwt.decode")
 @patch(
     "dataforce_studio.handlers.auth.TokenBlackListRepository.add_token",
@@ -586,8 +654,8 @@ async def test_handle_logout(mock_add_token: AsyncMock, mock_jwt_decode: Mock) -
     await handler.handle_logout(access_token, refresh_token)
 
     assert mock_jwt_decode.call_count == 2
-    mock_add_token.assert_any_await(access_token, 67890)
-    mock_add_token.assert_any_await(refresh_token, 67890)
+    mock_add_token.assert_any_await(sha256(access_token.encode()).hexdigest(), 67890)
+    mock_add_token.assert_any_await(sha256(refresh_token.encode()).hexdigest(), 12345)
     assert mock_add_token.await_count == 2
 
 
@@ -786,7 +854,7 @@ def test_generate_password_reset_token(mock_create_token: MagicMock) -> None:
 
 @patch(
     "dataforce_studio.handlers.auth.EmailHandler.send_password_reset_email",
-    new_callable=MagicMock,
+    new_callable=AsyncMock,
 )
 @patch("dataforce_studio.handlers.auth.UserRepository.get_user", new_callable=AsyncMock)
 @patch.object(AuthHandler, "_generate_password_reset_token")
@@ -796,7 +864,7 @@ async def test_send_password_reset_email(
     mock_get_password_reset_link: MagicMock,
     mock_generate_password_reset_token: MagicMock,
     mock_get_user: AsyncMock,
-    mock_send_email: MagicMock,
+    mock_send_email: AsyncMock,
     get_create_user: dict,
 ) -> None:
     user = get_create_user["user"]
@@ -812,7 +880,7 @@ async def test_send_password_reset_email(
     mock_get_user.assert_awaited_once_with(user.email)
     mock_generate_password_reset_token.assert_called_once_with(user.email)
     mock_get_password_reset_link.assert_called_once_with(token)
-    mock_send_email.assert_called_once_with(user.email, link, user.full_name)
+    mock_send_email.assert_awaited_once_with(user.email, link, user.full_name)
 
 
 @patch("dataforce_studio.handlers.auth.UserRepository.get_user", new_callable=AsyncMock)
@@ -932,7 +1000,10 @@ async def test_handle_email_confirmation_already_verified(
 @patch(
     "dataforce_studio.handlers.auth.UserRepository.update_user", new_callable=AsyncMock
 )
-@patch("dataforce_studio.handlers.auth.AuthHandler._get_password_hash")
+@patch(
+    "dataforce_studio.handlers.auth.AuthHandler._get_password_hash",
+    new_callable=AsyncMock,
+)
 @pytest.mark.asyncio
 async def test_handle_reset_password(
     mock_hash: MagicMock,
@@ -952,7 +1023,7 @@ async def test_handle_reset_password(
 
     mock_jwt_decode.assert_called_once()
     mock_get_user.assert_awaited_once_with(user.email)
-    mock_hash.assert_called_once_with(new_password)
+    mock_hash.assert_awaited_once_with(new_password)
     mock_update.assert_awaited_once_with(update_user)
 
 
@@ -1029,4 +1100,94 @@ async def test_is_token_blacklisted(mock_is_token_blacklisted: AsyncMock) -> Non
     result = await handler.is_token_blacklisted(token)
 
     assert result is True
-    mock_is_token_blacklisted.assert_awaited_once_with(token)
+    mock_is_token_blacklisted.assert_awaited_once_with(
+        sha256(token.encode()).hexdigest()
+    )
+
+
+@patch(
+    "dataforce_studio.handlers.auth.AuthHandler._AuthHandler__token_black_list_filter",
+    new_callable=lambda: ExpiringBloomFilter(100, 0.01, 3600),
+)
+@patch(
+    "dataforce_studio.handlers.auth.TokenBlackListRepository.get_active_tokens",
+    new_callable=AsyncMock,
+)
+@patch(
+    "dataforce_studio.handlers.auth.TokenBlackListRepository.is_token_blacklisted",
+    new_callable=AsyncMock,
+)
+@pytest.mark.asyncio
+async def test_is_token_blacklisted_filter(
+    mock_is_token_blacklisted: AsyncMock,
+    mock_get_active_tokens: AsyncMock,
+    token_filter: ExpiringBloomFilter,
+) -> None:
+    revoked_digest = sha256(b"revoked").hexdigest()
+    mock_get_active_tokens.return_value = [(revoked_digest, int(time()) + 60)]
+    mock_is_token_blacklisted.return_value = True
+
+    await handler.load_token_blacklist()
+
+    assert token_filter.loaded is True
+    assert await handler.is_token_blacklisted("valid") is False
+    mock_is_token_blacklisted.assert_not_awaited()
+
+    assert await handler.is_token_blacklisted("revoked") is True
+    mock_is_token_blacklisted.assert_awaited_once_with(revoked_digest)
+
+
+@patch(
+    "dataforce_studio.handlers.auth.AuthHandler._AuthHandler__token_black_list_filter",
+    new_callable=lambda: ExpiringBloomFilter(100, 0.01, 3600),
+)
+@patch(
+    "dataforce_studio.handlers.auth.TokenBlackListRepository.get_active_tokens",
+    new_callable=AsyncMock,
+    return_value=[],
+)
+@patch(
+    "dataforce_studio.handlers.auth.TokenBlackListRepository.is_token_blacklisted",
+    new_callable=AsyncMock,
+    return_value=False,
+)
+@pytest.mark.asyncio
+async def test_token_blacklist_filter_loads_on_default_cache(
+    mock_is_token_blacklisted: AsyncMock,
+    mock_get_active_tokens: AsyncMock,
+    token_filter: ExpiringBloomFilter,
+) -> None:
+    previous_cache = get_cache()
+    set_cache(create_cache(config.CACHE_URL))
+    try:
+        await handler.listen_for_blacklisted_tokens()
+    finally:
+        set_cache(previous_cache)
+
+    assert token_filter.loaded is True
+    assert await handler.is_token_blacklisted("valid") is False
+    mock_is_token_blacklisted.assert_not_awaited()
+    mock_get_active_tokens.assert_awaited_once()
+
+    await handler._sync_token_blacklist(False)
+    assert token_filter.loaded is False
+    assert await handler.is_token_blacklisted("valid") is False
+    mock_is_token_blacklisted.assert_awaited_once()
+
+    await handler._sync_token_blacklist(True)
+    assert token_filter.loaded is True
+
+
+@patch(
+    "dataforce_studio.handlers.auth.TokenBlackListRepository.delete_expired_tokens",
+    new_callable=AsyncMock,
+)
+@pytest.mark.asyncio
+async def test_reap_expired_tokens(mock_delete_expired_tokens: AsyncMock) -> None:
+    mock_delete_expired_tokens.side_effect = [1000, 1000, 7]
+
+    report = await handler.reap_expired_tokens()
+
+    assert report.rows == 2007
+    assert mock_delete_expired_tokens.await_count == 3
+    mock_delete_expired_tokens.assert_awaited_with(1000)
@@ -14,22 +14,13 @@ from dataforce_studio.schemas.ml_models import (
     CollectionUpdate,
     CollectionUpdateIn,
 )
-from dataforce_studio.schemas.orbit import OrbitRole
-from dataforce_studio.schemas.organization import OrgRole
+from tests.conftest import orbit_access
 
 handler = CollectionHandler()
 
 
 @patch(
-    "dataforce_studio.handlers.permissions.UserRepository.get_organization_member_role",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_member_role",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.collections.OrbitRepository.get_orbit_simple",
+    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_access",
     new_callable=AsyncMock,
 )
 @patch(
@@ -39,9 +30,7 @@ handler = CollectionHandler()
 @pytest.mark.asyncio
 async def test_create_collection(
     mock_create: AsyncMock,
-    mock_get_orbit_simple: AsyncMock,
-    mock_get_orbit_role: AsyncMock,
-    mock_get_org_role: AsyncMock,
+    mock_get_orbit_access: AsyncMock,
 ) -> None:
     user_id = random.randint(1, 10000)
     organization_id = random.randint(1, 10000)
@@ -60,14 +49,10 @@ async def test_create_collection(
         **data.model_dump(),
     )
 
-    class Orbit:
-        def __init__(self, organization_id: int) -> None:
-            self.organization_id = organization_id
-
     mock_create.return_value = expected
-    mock_get_orbit_simple.return_value = Orbit(organization_id)
-    mock_get_org_role.return_value = OrgRole.OWNER
-    mock_get_orbit_role.return_value = OrbitRole.MEMBER
+    mock_get_orbit_access.return_value = orbit_access(
+        organization_id, orbit_id, user_id
+    )
 
     result = await handler.create_collection(user_id, organization_id, orbit_id, data)
 
@@ -77,19 +62,13 @@ async def test_create_collection(
         **data.model_dump(),
     )
     mock_create.assert_awaited_once_with(expected_db)
-    mock_get_orbit_simple.assert_awaited_once_with(orbit_id, organization_id)
+    mock_get_orbit_access.assert_awaited_once_with(
+        organization_id, orbit_id, user_id, None
+    )
 
 
 @patch(
-    "dataforce_studio.handlers.permissions.UserRepository.get_organization_member_role",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_member_role",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.collections.OrbitRepository.get_orbit_simple",
+    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_access",
     new_callable=AsyncMock,
 )
 @patch(
@@ -99,9 +78,7 @@ async def test_create_collection(
 @pytest.mark.asyncio
 async def test_create_collection_orbit_not_found(
     mock_create: AsyncMock,
-    mock_get_orbit_simple: AsyncMock,
-    mock_get_orbit_role: AsyncMock,
-    mock_get_org_role: AsyncMock,
+    mock_get_orbit_access: AsyncMock,
 ) -> None:
     user_id = random.randint(1, 10000)
     organization_id = random.randint(1, 10000)
@@ -113,28 +90,22 @@ async def test_create_collection_orbit_not_found(
         tags=["t1"],
     )
 
-    mock_get_orbit_simple.return_value = None
-    mock_get_org_role.return_value = OrgRole.OWNER
-    mock_get_orbit_role.return_value = OrbitRole.MEMBER
+    mock_get_orbit_access.return_value = orbit_access(
+        organization_id, orbit_id, user_id, with_orbit=False
+    )
 
     with pytest.raises(NotFoundError, match="Orbit not found") as error:
         await handler.create_collection(user_id, organization_id, orbit_id, data)
 
     assert error.value.status_code == 404
     mock_create.assert_not_called()
-    mock_get_orbit_simple.assert_awaited_once_with(orbit_id, organization_id)
+    mock_get_orbit_access.assert_awaited_once_with(
+        organization_id, orbit_id, user_id, None
+    )
 
 
 @patch(
-    "dataforce_studio.handlers.permissions.UserRepository.get_organization_member_role",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_member_role",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.collections.OrbitRepository.get_orbit_simple",
+    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_access",
     new_callable=AsyncMock,
 )
 @patch(
@@ -144,36 +115,28 @@ async def test_create_collection_orbit_not_found(
 @pytest.mark.asyncio
 async def test_get_orbit_collections_orbit_not_found(
     mock_get_collections: AsyncMock,
-    mock_get_orbit_simple: AsyncMock,
-    mock_get_orbit_role: AsyncMock,
-    mock_get_org_role: AsyncMock,
+    mock_get_orbit_access: AsyncMock,
 ) -> None:
     user_id = random.randint(1, 10000)
     organization_id = random.randint(1, 10000)
     orbit_id = random.randint(1, 10000)
 
-    mock_get_orbit_simple.return_value = None
-    mock_get_org_role.return_value = OrgRole.OWNER
-    mock_get_orbit_role.return_value = OrbitRole.MEMBER
+    mock_get_orbit_access.return_value = orbit_access(
+        organization_id, orbit_id, user_id, with_orbit=False
+    )
 
     with pytest.raises(NotFoundError, match="Orbit not found") as error:
         await handler.get_orbit_collections(user_id, organization_id, orbit_id)
 
     assert error.value.status_code == 404
     mock_get_collections.assert_not_called()
-    mock_get_orbit_simple.assert_awaited_once_with(orbit_id, organization_id)
+    mock_get_orbit_access.assert_awaited_once_with(
+        organization_id, orbit_id, user_id, None
+    )
 
 
 @patch(
-    "dataforce_studio.handlers.permissions.UserRepository.get_organization_member_role",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_member_role",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.collections.OrbitRepository.get_orbit_simple",
+    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_access",
     new_callable=AsyncMock,
 )
 @patch(
@@ -183,40 +146,28 @@ async def test_get_orbit_collections_orbit_not_found(
 @pytest.mark.asyncio
 async def test_get_orbit_collections_orbit_wrong_org(
     mock_get_collections: AsyncMock,
-    mock_get_orbit_simple: AsyncMock,
-    mock_get_orbit_role: AsyncMock,
-    mock_get_org_role: AsyncMock,
+    mock_get_orbit_access: AsyncMock,
 ) -> None:
     user_id = random.randint(1, 10000)
     organization_id = random.randint(1, 10000)
     orbit_id = random.randint(1, 10000)
 
-    class Orbit:
-        def __init__(self, organization_id: int) -> None:
-            self.organization_id = organization_id
-
-    mock_get_orbit_simple.return_value = Orbit(organization_id + 1)
-    mock_get_org_role.return_value = OrgRole.OWNER
-    mock_get_orbit_role.return_value = OrbitRole.MEMBER
+    mock_get_orbit_access.return_value = orbit_access(
+        organization_id, orbit_id, user_id, with_orbit=False
+    )
 
     with pytest.raises(NotFoundError, match="Orbit not found") as error:
         await handler.get_orbit_collections(user_id, organization_id, orbit_id)
 
     assert error.value.status_code == 404
     mock_get_collections.assert_not_called()
-    mock_get_orbit_simple.assert_awaited_once_with(orbit_id, organization_id)
+    mock_get_orbit_access.assert_awaited_once_with(
+        organization_id, orbit_id, user_id, None
+    )
 
 
 @patch(
-    "dataforce_studio.handlers.permissions.UserRepository.get_organization_member_role",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_member_role",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.collections.OrbitRepository.get_orbit_simple",
+    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_access",
     new_callable=AsyncMock,
 )
 @patch(
@@ -226,9 +177,7 @@ async def test_get_orbit_collections_orbit_wrong_org(
 @pytest.mark.asyncio
 async def test_create_collection_orbit_wrong_org(
     mock_create: AsyncMock,
-    mock_get_orbit_simple: AsyncMock,
-    mock_get_orbit_role: AsyncMock,
-    mock_get_org_role: AsyncMock,
+    mock_get_orbit_access: AsyncMock,
 ) -> None:
     user_id = random.randint(1, 10000)
     organization_id = random.randint(1, 10000)
@@ -240,32 +189,22 @@ async def test_create_collection_orbit_wrong_org(
         tags=["t1"],
     )
 
-    class Orbit:
-        def __init__(self, organization_id: int) -> None:
-            self.organization_id = organization_id
-
-    mock_get_orbit_simple.return_value = Orbit(organization_id + 1)
-    mock_get_org_role.return_value = OrgRole.OWNER
-    mock_get_orbit_role.return_value = OrbitRole.MEMBER
+    mock_get_orbit_access.return_value = orbit_access(
+        organization_id, orbit_id, user_id, with_orbit=False
+    )
 
     with pytest.raises(NotFoundError, match="Orbit not found") as error:
         await handler.create_collection(user_id, organization_id, orbit_id, data)
 
     assert error.value.status_code == 404
     mock_create.assert_not_called()
-    mock_get_orbit_simple.assert_awaited_once_with(orbit_id, organization_id)
+    mock_get_orbit_access.assert_awaited_once_with(
+        organization_id, orbit_id, user_id, None
+    )
 
 
 @patch(
-    "dataforce_studio.handlers.permissions.UserRepository.get_organization_member_role",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_member_role",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.collections.OrbitRepository.get_orbit_simple",
+    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_access",
     new_callable=AsyncMock,
 )
 @patch(
@@ -275,9 +214,7 @@ async def test_create_collection_orbit_wrong_org(
 @pytest.mark.asyncio
 async def test_update_collection(
     mock_update: AsyncMock,
-    mock_get_orbit_simple: AsyncMock,
-    mock_get_orbit_role: AsyncMock,
-    mock_get_org_role: AsyncMock,
+    mock_get_orbit_access: AsyncMock,
 ) -> None:
     user_id = random.randint(1, 10000)
     organization_id = random.randint(1, 10000)
@@ -297,14 +234,10 @@ async def test_update_collection(
         updated_at=None,
     )
 
-    class Orbit:
-        def __init__(self, organization_id: int) -> None:
-            self.organization_id = organization_id
-
     mock_update.return_value = expected
-    mock_get_orbit_simple.return_value = Orbit(organization_id)
-    mock_get_org_role.return_value = OrgRole.OWNER
-    mock_get_orbit_role.return_value = OrbitRole.MEMBER
+    mock_get_orbit_access.return_value = orbit_access(
+        organization_id, orbit_id, user_id, collection_id
+    )
 
     result = await handler.update_collection(
         user_id, organization_id, orbit_id, collection_id, data_in
@@ -321,15 +254,7 @@ async def test_update_collection(
 
 
 @patch(
-    "dataforce_studio.handlers.permissions.UserRepository.get_organization_member_role",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_member_role",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.collections.OrbitRepository.get_orbit_simple",
+    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_access",
     new_callable=AsyncMock,
 )
 @patch(
@@ -339,9 +264,7 @@ async def test_update_collection(
 @pytest.mark.asyncio
 async def test_update_collection_not_found(
     mock_update: AsyncMock,
-    mock_get_orbit_simple: AsyncMock,
-    mock_get_orbit_role: AsyncMock,
-    mock_get_org_role: AsyncMock,
+    mock_get_orbit_access: AsyncMock,
 ) -> None:
     user_id = random.randint(1, 10000)
     organization_id = random.randint(1, 10000)
@@ -350,14 +273,10 @@ async def test_update_collection_not_found(
 
     data_in = CollectionUpdateIn(name="new")
 
-    class Orbit:
-        def __init__(self, organization_id: int) -> None:
-            self.organization_id = organization_id
-
     mock_update.return_value = None
-    mock_get_orbit_simple.return_value = Orbit(organization_id)
-    mock_get_org_role.return_value = OrgRole.OWNER
-    mock_get_orbit_role.return_value = OrbitRole.MEMBER
+    mock_get_orbit_access.return_value = orbit_access(
+        organization_id, orbit_id, user_id, collection_id
+    )
 
     with pytest.raises(NotFoundError, match="Collection not found"):
         await handler.update_collection(
@@ -374,15 +293,7 @@ async def test_update_collection_not_found(
 
 
 @patch(
-    "dataforce_studio.handlers.permissions.UserRepository.get_organization_member_role",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_member_role",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.collections.OrbitRepository.get_orbit_simple",
+    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_access",
     new_callable=AsyncMock,
 )
 @patch(
@@ -392,9 +303,7 @@ async def test_update_collection_not_found(
 @pytest.mark.asyncio
 async def test_update_collection_orbit_wrong_org(
     mock_update: AsyncMock,
-    mock_get_orbit_simple: AsyncMock,
-    mock_get_orbit_role: AsyncMock,
-    mock_get_org_role: AsyncMock,
+    mock_get_orbit_access: AsyncMock,
 ) -> None:
     user_id = random.randint(1, 10000)
     organization_id = random.randint(1, 10000)
@@ -403,13 +312,9 @@ async def test_update_collection_orbit_wrong_org(
 
     data_in = CollectionUpdateIn(name="new")
 
-    class Orbit:
-        def __init__(self, organization_id: int) -> None:
-            self.organization_id = organization_id
-
-    mock_get_orbit_simple.return_value = Orbit(organization_id + 1)
-    mock_get_org_role.return_value = OrgRole.OWNER
-    mock_get_orbit_role.return_value = OrbitRole.MEMBER
+    mock_get_orbit_access.return_value = orbit_access(
+        organization_id, orbit_id, user_id, collection_id, with_orbit=False
+    )
 
     with pytest.raises(NotFoundError, match="Orbit not found") as error:
         await handler.update_collection(
@@ -418,27 +323,13 @@ async def test_update_collection_orbit_wrong_org(
 
     assert error.value.status_code == 404
     mock_update.assert_not_called()
-    mock_get_orbit_simple.assert_awaited_once_with(orbit_id, organization_id)
+    mock_get_orbit_access.assert_awaited_once_with(
+        organization_id, orbit_id, user_id, collection_id
+    )
 
 
 @patch(
-    "dataforce_studio.handlers.permissions.UserRepository.get_organization_member_role",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_member_role",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.collections.OrbitRepository.get_orbit_simple",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.collections.CollectionRepository.get_collection",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.collections.MLModelRepository.get_collection_models_count",
+    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_access",
     new_callable=AsyncMock,
 )
 @patch(
@@ -448,61 +339,24 @@ async def test_update_collection_orbit_wrong_org(
 @pytest.mark.asyncio
 async def test_delete_collection_empty(
     mock_delete: AsyncMock,
-    mock_get_count: AsyncMock,
-    mock_get_collection: AsyncMock,
-    mock_get_orbit_simple: AsyncMock,
-    mock_get_orbit_role: AsyncMock,
-    mock_get_org_role: AsyncMock,
+    mock_get_orbit_access: AsyncMock,
 ) -> None:
     user_id = random.randint(1, 10000)
     organization_id = random.randint(1, 10000)
     orbit_id = random.randint(1, 10000)
     collection_id = random.randint(1, 10000)
 
-    mock_get_collection.return_value = Collection(
-        id=collection_id,
-        orbit_id=orbit_id,
-        description="d",
-        name="n",
-        collection_type=CollectionType.MODEL,
-        tags=None,
-        total_models=0,
-        created_at=datetime.utcnow(),
-        updated_at=None,
+    mock_get_orbit_access.return_value = orbit_access(
+        organization_id, orbit_id, user_id, collection_id
     )
 
-    class Orbit:
-        def __init__(self, organization_id: int) -> None:
-            self.organization_id = organization_id
-
-    mock_get_count.return_value = 0
-    mock_get_orbit_simple.return_value = Orbit(organization_id)
-    mock_get_org_role.return_value = OrgRole.OWNER
-    mock_get_orbit_role.return_value = OrbitRole.MEMBER
-
     await handler.delete_collection(user_id, organization_id, orbit_id, collection_id)
 
     mock_delete.assert_awaited_once_with(collection_id)
 
 
 @patch(
-    "dataforce_studio.handlers.permissions.UserRepository.get_organization_member_role",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_member_role",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.collections.OrbitRepository.get_orbit_simple",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.collections.CollectionRepository.get_collection",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.collections.MLModelRepository.get_collection_models_count",
+    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_access",
     new_callable=AsyncMock,
 )
 @patch(
@@ -512,48 +366,16 @@ async def test_delete_collection_empty(
 @pytest.mark.asyncio
 async def test_delete_collection_not_empty(
     mock_delete: AsyncMock,
-    mock_get_count: AsyncMock,
-    mock_get_collection: AsyncMock,
-    mock_get_orbit_simple: AsyncMock,
-    mock_get_orbit_role: AsyncMock,
-    mock_get_org_role: AsyncMock,
+    mock_get_orbit_access: AsyncMock,
 ) -> None:
     user_id = random.randint(1, 10000)
     organization_id = random.randint(1, 10000)
     orbit_id = random.randint(1, 10000)
     collection_id = random.randint(1, 10000)
 
-    mock_get_collection.return_value = Collection(
-        id=collection_id,
-        orbit_id=orbit_id,
-        description="d",
-        name="n",
-        collection_type=CollectionType.MODEL,
-        tags=None,
-        total_models=0,
-        created_at=datetime.utcnow(),
-        updated_at=None,
-    )
-
-    class Orbit:
-        def __init__(self, organization_id: int) -> None:
-            self.organization_id = organization_id
-
-    mock_get_collection.return_value = Collection(
-        id=collection_id,
-        orbit_id=orbit_id,
-        description="d",
-        name="n",
-        collection_type=CollectionType.MODEL,
-        tags=None,
-        total_models=0,
-        created_at=datetime.utcnow(),
-        updated_at=None,
+    mock_get_orbit_access.return_value = orbit_access(
+        organization_id, orbit_id, user_id, collection_id, total_models=3
     )
-    mock_get_count.return_value = 1
-    mock_get_orbit_simple.return_value = Orbit(organization_id)
-    mock_get_org_role.return_value = OrgRole.OWNER
-    mock_get_orbit_role.return_value = OrbitRole.MEMBER
 
     with pytest.raises(CollectionDeleteError, match="cant be deleted"):
         await handler.delete_collection(
@@ -564,68 +386,34 @@ async def test_delete_collection_not_empty(
 
 
 @patch(
-    "dataforce_studio.handlers.permissions.UserRepository.get_organization_member_role",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_member_role",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.collections.OrbitRepository.get_orbit_simple",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.collections.CollectionRepository.get_collection",
+    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_access",
     new_callable=AsyncMock,
 )
 @pytest.mark.asyncio
 async def test_delete_collection_not_found(
-    mock_get_collection: AsyncMock,
-    mock_get_orbit_simple: AsyncMock,
-    mock_get_orbit_role: AsyncMock,
-    mock_get_org_role: AsyncMock,
+    mock_get_orbit_access: AsyncMock,
 ) -> None:
     user_id = random.randint(1, 10000)
     organization_id = random.randint(1, 10000)
     orbit_id = random.randint(1, 10000)
     collection_id = random.randint(1, 10000)
 
-    class Orbit:
-        def __init__(self, organization_id: int) -> None:
-            self.organization_id = organization_id
-
-    mock_get_collection.return_value = None
-    mock_get_orbit_simple.return_value = Orbit(organization_id)
-    mock_get_org_role.return_value = OrgRole.OWNER
-    mock_get_orbit_role.return_value = OrbitRole.MEMBER
+    mock_get_orbit_access.return_value = orbit_access(
+        organization_id, orbit_id, user_id
+    )
 
     with pytest.raises(NotFoundError, match="Collection not found"):
         await handler.delete_collection(
             user_id, organization_id, orbit_id, collection_id
         )
 
-    mock_get_collection.assert_awaited_once_with(collection_id)
+    mock_get_orbit_access.assert_awaited_once_with(
+        organization_id, orbit_id, user_id, collection_id
+    )
 
 
 @patch(
-    "dataforce_studio.handlers.permissions.UserRepository.get_organization_member_role",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_member_role",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.collections.OrbitRepository.get_orbit_simple",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.collections.CollectionRepository.get_collection",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.collections.MLModelRepository.get_collection_models_count",
+    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_access",
     new_callable=AsyncMock,
 )
 @patch(
@@ -635,37 +423,16 @@ async def test_delete_collection_not_found(
 @pytest.mark.asyncio
 async def test_delete_collection_orbit_wrong_org(
     mock_delete: AsyncMock,
-    mock_get_count: AsyncMock,
-    mock_get_collection: AsyncMock,
-    mock_get_orbit_simple: AsyncMock,
-    mock_get_orbit_role: AsyncMock,
-    mock_get_org_role: AsyncMock,
+    mock_get_orbit_access: AsyncMock,
 ) -> None:
     user_id = random.randint(1, 10000)
     organization_id = random.randint(1, 10000)
     orbit_id = random.randint(1, 10000)
     collection_id = random.randint(1, 10000)
 
-    mock_get_collection.return_value = Collection(
-        id=collection_id,
-        orbit_id=orbit_id,
-        description="d",
-        name="n",
-        collection_type=CollectionType.MODEL,
-        tags=None,
-        total_models=0,
-        created_at=datetime.utcnow(),
-        updated_at=None,
+    mock_get_orbit_access.return_value = orbit_access(
+        organization_id, orbit_id, user_id, collection_id, with_orbit=False
     )
-    mock_get_count.return_value = 0
-
-    class Orbit:
-        def __init__(self, organization_id: int) -> None:
-            self.organization_id = organization_id
-
-    mock_get_orbit_simple.return_value = Orbit(organization_id + 1)
-    mock_get_org_role.return_value = OrgRole.OWNER
-    mock_get_orbit_role.return_value = OrbitRole.MEMBER
 
     with pytest.raises(NotFoundError, match="Orbit not found") as error:
         await handler.delete_collection(
@@ -674,4 +441,6 @@ async def test_delete_collection_orbit_wrong_org(
 
     assert error.value.status_code == 404
     mock_delete.assert_not_called()
-    mock_get_orbit_simple.assert_awaited_once_with(orbit_id, organization_id)
+    mock_get_orbit_access.assert_awaited_once_with(
+        organization_id, orbit_id, user_id, collection_id
+    )
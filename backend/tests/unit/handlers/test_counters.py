@@ -0,0 +1,25 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from dataforce_studio.handlers.counters import CounterCheckHandler
+
+handler = CounterCheckHandler()
+
+
+@patch(
+    "dataforce_studio.handlers.counters.CounterRepository.repair_counters",
+    new_callable=AsyncMock,
+    return_value={
+        "orbits.total_members": 2,
+        "orbits.total_collections": 0,
+        "collections.total_models": 1,
+    },
+)
+@pytest.mark.asyncio
+async def test_check_counters(mock_repair_counters: AsyncMock) -> None:
+    report = await handler.check_counters()
+
+    assert report.name == "counter_check"
+    assert report.rows == 3
+    mock_repair_counters.assert_awaited_once()
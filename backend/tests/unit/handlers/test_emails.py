@@ -0,0 +1,30 @@
+from unittest.mock import Mock, patch
+
+import pytest
+
+from dataforce_studio.handlers.emails import EmailHandler
+from dataforce_studio.infra.unit_of_work import AfterCommit
+
+
+@pytest.mark.asyncio
+async def test_emails_are_enqueued_after_commit() -> None:
+    callbacks: list[AfterCommit] = []
+
+    async def defer(callback: AfterCommit) -> None:
+        callbacks.append(callback)
+
+    outbox = Mock()
+    with (
+        patch("dataforce_studio.handlers.emails.after_commit", defer),
+        patch.object(EmailHandler, "_outbox", outbox),
+    ):
+        await EmailHandler("noreply@example.com").send_organization_invite_email(
+            "invited@example.com", "Owner", "Organization", "https://example.com"
+        )
+
+        outbox.enqueue.assert_not_called()
+        for callback in callbacks:
+            await callback()
+
+    outbox.enqueue.assert_called_once()
+    assert outbox.enqueue.call_args.args[0].email == "invited@example.com"
@@ -1,21 +1,41 @@
+import hashlib
 import random
 from datetime import datetime
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
+from minio.datatypes import Part
 
 from dataforce_studio.handlers.ml_models import MLModelHandler
-from dataforce_studio.infra.exceptions import NotFoundError, ServiceError
+from dataforce_studio.infra.exceptions import (
+    InvalidCursorError,
+    NotFoundError,
+    ServiceError,
+    StorageError,
+)
+from dataforce_studio.infra.pagination import decode_cursor, decode_metric_cursor
+from dataforce_studio.infra.presigner import S3Presigner
+from dataforce_studio.infra.storage import (
+    ObjectStream,
+    StorageClient,
+    invalidate_storage_client,
+)
+from dataforce_studio.schemas.bucket_secrets import BucketSecret
 from dataforce_studio.schemas.ml_models import (
     Manifest,
     MLModel,
+    MLModelDownloadSummary,
     MLModelIn,
+    MLModelListFilters,
     MLModelStatus,
+    MLModelSummary,
     MLModelUpdate,
     MLModelUpdateIn,
+    MLModelUploadUpdate,
+    UploadedPart,
 )
-from dataforce_studio.schemas.orbit import OrbitRole
-from dataforce_studio.schemas.organization import OrgRole
+from tests.conftest import orbit_access
+from utils.s3_stub import S3StubHandler, run_s3_stub
 
 handler = MLModelHandler()
 
@@ -54,19 +74,12 @@ manifest_example_obj = Manifest(
 
 
 @patch(
-    "dataforce_studio.handlers.permissions.UserRepository.get_organization_member_role",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_member_role",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.ml_models.OrbitRepository.get_orbit_simple",
+    "dataforce_studio.handlers.ml_models.MLModelRepository.get_uploaded_model_by_hash",
     new_callable=AsyncMock,
+    return_value=None,
 )
 @patch(
-    "dataforce_studio.handlers.ml_models.CollectionRepository.get_collection",
+    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_access",
     new_callable=AsyncMock,
 )
 @patch(
@@ -81,10 +94,8 @@ manifest_example_obj = Manifest(
 async def test_create_ml_model_with_tags(
     mock_get_presigned: AsyncMock,
     mock_create_model: AsyncMock,
-    mock_get_collection: AsyncMock,
-    mock_get_orbit_simple: AsyncMock,
-    mock_get_orbit_role: AsyncMock,
-    mock_get_org_role: AsyncMock,
+    mock_get_orbit_access: AsyncMock,
+    mock_get_by_hash: AsyncMock,
 ) -> None:
     user_id = random.randint(1, 10000)
     organization_id = random.randint(1, 10000)
@@ -110,15 +121,10 @@ async def test_create_ml_model_with_tags(
     )
 
     mock_create_model.return_value = model
-    mock_get_orbit_simple.return_value = type(
-        "obj",
-        (),
-        {"bucket_secret_id": 1, "organization_id": organization_id},
+    mock_get_orbit_access.return_value = orbit_access(
+        organization_id, orbit_id, user_id, collection_id
     )
-    mock_get_collection.return_value = type("obj", (), {"orbit_id": orbit_id})
     mock_get_presigned.return_value = "url"
-    mock_get_org_role.return_value = OrgRole.OWNER
-    mock_get_orbit_role.return_value = OrbitRole.MEMBER
     ml_model_in = MLModelIn(
         metrics={},
         manifest=manifest_example_obj,
@@ -144,19 +150,57 @@ async def test_create_ml_model_with_tags(
 
 
 @patch(
-    "dataforce_studio.handlers.permissions.UserRepository.get_organization_member_role",
+    "dataforce_studio.handlers.ml_models.MLModelRepository.get_uploaded_model_by_hash",
     new_callable=AsyncMock,
+    return_value=None,
 )
 @patch(
-    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_member_role",
+    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_access",
     new_callable=AsyncMock,
 )
 @patch(
-    "dataforce_studio.handlers.ml_models.OrbitRepository.get_orbit_simple",
+    "dataforce_studio.handlers.ml_models.MLModelRepository.create_ml_model",
+    new_callable=AsyncMock,
+)
+@patch(
+    "dataforce_studio.handlers.ml_models.MLModelHandler._get_presigned_url",
     new_callable=AsyncMock,
+    side_effect=StorageError("Storage request failed"),
 )
+@pytest.mark.asyncio
+async def test_create_ml_model_presigns_before_insert(
+    mock_get_presigned: AsyncMock,
+    mock_create_model: AsyncMock,
+    mock_get_orbit_access: AsyncMock,
+    mock_get_by_hash: AsyncMock,
+) -> None:
+    user_id = random.randint(1, 10000)
+    organization_id = random.randint(1, 10000)
+    orbit_id = random.randint(1, 10000)
+    collection_id = random.randint(1, 10000)
+    mock_get_orbit_access.return_value = orbit_access(
+        organization_id, orbit_id, user_id, collection_id
+    )
+    ml_model_in = MLModelIn(
+        metrics={},
+        manifest=manifest_example_obj,
+        file_hash="hash",
+        file_index={},
+        size=1,
+        file_name="file.txt",
+    )
+
+    with pytest.raises(StorageError):
+        await handler.create_ml_model(
+            user_id, organization_id, orbit_id, collection_id, ml_model_in
+        )
+
+    mock_get_presigned.assert_awaited_once()
+    mock_create_model.assert_not_awaited()
+
+
 @patch(
-    "dataforce_studio.handlers.ml_models.CollectionRepository.get_collection",
+    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_access",
     new_callable=AsyncMock,
 )
 @patch(
@@ -171,10 +215,7 @@ async def test_create_ml_model_with_tags(
 async def test_get_ml_model(
     mock_get_download_url: AsyncMock,
     mock_get_model: AsyncMock,
-    mock_get_collection: AsyncMock,
-    mock_get_orbit_simple: AsyncMock,
-    mock_get_orbit_role: AsyncMock,
-    mock_get_org_role: AsyncMock,
+    mock_get_orbit_access: AsyncMock,
 ) -> None:
     user_id = random.randint(1, 10000)
     organization_id = random.randint(1, 10000)
@@ -200,16 +241,10 @@ async def test_get_ml_model(
     )
 
     mock_get_model.return_value = model
-    mock_get_orbit_simple.return_value = type("obj", (), {"bucket_secret_id": 1})
-    mock_get_orbit_simple.return_value = type(
-        "obj",
-        (),
-        {"bucket_secret_id": 1, "organization_id": organization_id},
+    mock_get_orbit_access.return_value = orbit_access(
+        organization_id, orbit_id, user_id, collection_id
     )
-    mock_get_collection.return_value = type("obj", (), {"orbit_id": orbit_id})
     mock_get_download_url.return_value = "url"
-    mock_get_org_role.return_value = OrgRole.OWNER
-    mock_get_orbit_role.return_value = OrbitRole.MEMBER
 
     result_model, url = await handler.get_ml_model(
         user_id, organization_id, orbit_id, collection_id, model_id
@@ -218,24 +253,14 @@ async def test_get_ml_model(
     assert result_model == model
     assert url == "url"
     mock_get_model.assert_awaited_once_with(model_id, collection_id)
-    mock_get_orbit_simple.assert_awaited_once_with(orbit_id, organization_id)
+    mock_get_orbit_access.assert_awaited_once_with(
+        organization_id, orbit_id, user_id, collection_id
+    )
     mock_get_download_url.assert_awaited_once_with(1, model.bucket_location)
 
 
 @patch(
-    "dataforce_studio.handlers.permissions.UserRepository.get_organization_member_role",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_member_role",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.ml_models.CollectionRepository.get_collection",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.ml_models.OrbitRepository.get_orbit_simple",
+    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_access",
     new_callable=AsyncMock,
 )
 @patch(
@@ -250,10 +275,7 @@ async def test_get_ml_model(
 async def test_get_ml_model_not_found(
     mock_get_download_url: AsyncMock,
     mock_get_model: AsyncMock,
-    mock_get_orbit_simple: AsyncMock,
-    mock_get_collection: AsyncMock,
-    mock_get_orbit_role: AsyncMock,
-    mock_get_org_role: AsyncMock,
+    mock_get_orbit_access: AsyncMock,
 ) -> None:
     user_id = random.randint(1, 10000)
     organization_id = random.randint(1, 10000)
@@ -262,14 +284,9 @@ async def test_get_ml_model_not_found(
     collection_id = random.randint(1, 10000)
 
     mock_get_model.return_value = None
-    mock_get_org_role.return_value = OrgRole.OWNER
-    mock_get_orbit_role.return_value = OrbitRole.MEMBER
-    mock_get_orbit_simple.return_value = type(
-        "obj",
-        (),
-        {"bucket_secret_id": 1, "organization_id": organization_id},
+    mock_get_orbit_access.return_value = orbit_access(
+        organization_id, orbit_id, user_id, collection_id
     )
-    mock_get_collection.return_value = type("obj", (), {"orbit_id": orbit_id})
 
     with pytest.raises(NotFoundError, match="ML model not found") as error:
         await handler.get_ml_model(
@@ -278,24 +295,14 @@ async def test_get_ml_model_not_found(
 
     assert error.value.status_code == 404
     mock_get_model.assert_awaited_once_with(model_id, collection_id)
-    mock_get_orbit_simple.assert_awaited_once_with(orbit_id, organization_id)
+    mock_get_orbit_access.assert_awaited_once_with(
+        organization_id, orbit_id, user_id, collection_id
+    )
     mock_get_download_url.assert_not_called()
 
 
 @patch(
-    "dataforce_studio.handlers.ml_models.CollectionRepository.get_collection",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.permissions.UserRepository.get_organization_member_role",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_member_role",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.ml_models.OrbitRepository.get_orbit_simple",
+    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_access",
     new_callable=AsyncMock,
 )
 @patch(
@@ -310,10 +317,7 @@ async def test_get_ml_model_not_found(
 async def test_request_download_url(
     mock_get_download_url: AsyncMock,
     mock_get_model: AsyncMock,
-    mock_get_orbit_simple: AsyncMock,
-    mock_get_orbit_role: AsyncMock,
-    mock_get_org_role: AsyncMock,
-    mock_get_collection: AsyncMock,
+    mock_get_orbit_access: AsyncMock,
 ) -> None:
     user_id = random.randint(1, 10000)
     organization_id = random.randint(1, 10000)
@@ -339,19 +343,10 @@ async def test_request_download_url(
     )
 
     mock_get_model.return_value = model
-    mock_get_orbit_simple.return_value = type(
-        "obj",
-        (),
-        {"bucket_secret_id": 1, "organization_id": organization_id},
-    )
-    mock_get_collection.return_value = type(
-        "obj",
-        (),
-        {"id": collection_id, "orbit_id": orbit_id},
+    mock_get_orbit_access.return_value = orbit_access(
+        organization_id, orbit_id, user_id, collection_id
     )
     mock_get_download_url.return_value = "url"
-    mock_get_org_role.return_value = OrgRole.OWNER
-    mock_get_orbit_role.return_value = OrbitRole.MEMBER
 
     url = await handler.request_download_url(
         user_id, organization_id, orbit_id, collection_id, model_id
@@ -362,19 +357,7 @@ async def test_request_download_url(
 
 
 @patch(
-    "dataforce_studio.handlers.ml_models.CollectionRepository.get_collection",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.permissions.UserRepository.get_organization_member_role",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_member_role",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.ml_models.OrbitRepository.get_orbit_simple",
+    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_access",
     new_callable=AsyncMock,
 )
 @patch(
@@ -382,8 +365,9 @@ async def test_request_download_url(
     new_callable=AsyncMock,
 )
 @patch(
-    "dataforce_studio.handlers.ml_models.MLModelRepository.update_status",
+    "dataforce_studio.handlers.ml_models.MLModelRepository.mark_for_deletion",
     new_callable=AsyncMock,
+    return_value=True,
 )
 @patch(
     "dataforce_studio.handlers.ml_models.MLModelHandler._get_delete_url",
@@ -392,12 +376,9 @@ async def test_request_download_url(
 @pytest.mark.asyncio
 async def test_request_delete_url(
     mock_get_delete_url: AsyncMock,
-    mock_update_status: AsyncMock,
+    mock_mark_for_deletion: AsyncMock,
     mock_get_model: AsyncMock,
-    mock_get_orbit_simple: AsyncMock,
-    mock_get_orbit_role: AsyncMock,
-    mock_get_org_role: AsyncMock,
-    mock_get_collection: AsyncMock,
+    mock_get_orbit_access: AsyncMock,
 ) -> None:
     user_id = random.randint(1, 10000)
     organization_id = random.randint(1, 10000)
@@ -423,45 +404,22 @@ async def test_request_delete_url(
     )
 
     mock_get_model.return_value = model
-    mock_get_orbit_simple.return_value = type(
-        "obj",
-        (),
-        {"bucket_secret_id": 1, "organization_id": organization_id},
-    )
-    mock_get_collection.return_value = type(
-        "obj",
-        (),
-        {"id": collection_id, "orbit_id": orbit_id},
+    mock_get_orbit_access.return_value = orbit_access(
+        organization_id, orbit_id, user_id, collection_id
     )
     mock_get_delete_url.return_value = "url"
-    mock_get_org_role.return_value = OrgRole.OWNER
-    mock_get_orbit_role.return_value = OrbitRole.MEMBER
 
     url = await handler.request_delete_url(
         user_id, organization_id, orbit_id, collection_id, model_id
     )
 
     assert url == "url"
-    mock_update_status.assert_awaited_once_with(
-        model_id, MLModelStatus.PENDING_DELETION
-    )
+    mock_mark_for_deletion.assert_awaited_once_with(model_id, model.bucket_location)
     mock_get_delete_url.assert_awaited_once_with(1, model.bucket_location)
 
 
 @patch(
-    "dataforce_studio.handlers.ml_models.CollectionRepository.get_collection",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.ml_models.OrbitRepository.get_orbit_simple",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.permissions.UserRepository.get_organization_member_role",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_member_role",
+    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_access",
     new_callable=AsyncMock,
 )
 @patch(
@@ -476,10 +434,7 @@ async def test_request_delete_url(
 async def test_confirm_deletion_pending(
     mock_delete: AsyncMock,
     mock_get_model: AsyncMock,
-    mock_get_orbit_role: AsyncMock,
-    mock_get_org_role: AsyncMock,
-    mock_get_orbit_simple: AsyncMock,
-    mock_get_collection: AsyncMock,
+    mock_get_orbit_access: AsyncMock,
 ) -> None:
     user_id = random.randint(1, 10000)
     organization_id = random.randint(1, 10000)
@@ -505,18 +460,9 @@ async def test_confirm_deletion_pending(
     )
 
     mock_get_model.return_value = model
-    mock_get_orbit_simple.return_value = type(
-        "obj",
-        (),
-        {"bucket_secret_id": 1, "organization_id": organization_id},
-    )
-    mock_get_collection.return_value = type(
-        "obj",
-        (),
-        {"id": collection_id, "orbit_id": orbit_id},
+    mock_get_orbit_access.return_value = orbit_access(
+        organization_id, orbit_id, user_id, collection_id
     )
-    mock_get_org_role.return_value = OrgRole.OWNER
-    mock_get_orbit_role.return_value = OrbitRole.MEMBER
 
     await handler.confirm_deletion(
         user_id, organization_id, orbit_id, collection_id, model_id
@@ -527,19 +473,7 @@ async def test_confirm_deletion_pending(
 
 
 @patch(
-    "dataforce_studio.handlers.ml_models.CollectionRepository.get_collection",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.ml_models.OrbitRepository.get_orbit_simple",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.permissions.UserRepository.get_organization_member_role",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_member_role",
+    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_access",
     new_callable=AsyncMock,
 )
 @patch(
@@ -554,10 +488,7 @@ async def test_confirm_deletion_pending(
 async def test_confirm_deletion_not_pending(
     mock_delete: AsyncMock,
     mock_get_model: AsyncMock,
-    mock_get_orbit_role: AsyncMock,
-    mock_get_org_role: AsyncMock,
-    mock_get_orbit_simple: AsyncMock,
-    mock_get_collection: AsyncMock,
+    mock_get_orbit_access: AsyncMock,
 ) -> None:
     user_id = random.randint(1, 10000)
     organization_id = random.randint(1, 10000)
@@ -583,18 +514,9 @@ async def test_confirm_deletion_not_pending(
     )
 
     mock_get_model.return_value = model
-    mock_get_orbit_simple.return_value = type(
-        "obj",
-        (),
-        {"bucket_secret_id": 1, "organization_id": organization_id},
-    )
-    mock_get_collection.return_value = type(
-        "obj",
-        (),
-        {"id": collection_id, "orbit_id": orbit_id},
+    mock_get_orbit_access.return_value = orbit_access(
+        organization_id, orbit_id, user_id, collection_id
     )
-    mock_get_org_role.return_value = OrgRole.OWNER
-    mock_get_orbit_role.return_value = OrbitRole.MEMBER
 
     with pytest.raises(ServiceError):
         await handler.confirm_deletion(
@@ -610,23 +532,11 @@ async def test_confirm_deletion_not_pending(
 
 
 @patch(
-    "dataforce_studio.handlers.ml_models.MLModelRepository.get_ml_model",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.ml_models.CollectionRepository.get_collection",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.ml_models.OrbitRepository.get_orbit_simple",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.permissions.UserRepository.get_organization_member_role",
+    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_access",
     new_callable=AsyncMock,
 )
 @patch(
-    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_member_role",
+    "dataforce_studio.handlers.ml_models.MLModelRepository.get_ml_model",
     new_callable=AsyncMock,
 )
 @patch(
@@ -636,11 +546,8 @@ async def test_confirm_deletion_not_pending(
 @pytest.mark.asyncio
 async def test_update_model(
     mock_update: AsyncMock,
-    mock_get_orbit_role: AsyncMock,
-    mock_get_org_role: AsyncMock,
-    mock_get_orbit_simple: AsyncMock,
-    mock_get_collection: AsyncMock,
     mock_get_model: AsyncMock,
+    mock_get_orbit_access: AsyncMock,
 ) -> None:
     user_id = random.randint(1, 10000)
     organization_id = random.randint(1, 10000)
@@ -686,18 +593,9 @@ async def test_update_model(
     )
 
     mock_update.return_value = expected
-    mock_get_orbit_simple.return_value = type(
-        "obj",
-        (),
-        {"bucket_secret_id": 1, "organization_id": organization_id},
-    )
-    mock_get_collection.return_value = type(
-        "obj",
-        (),
-        {"id": collection_id, "orbit_id": orbit_id},
+    mock_get_orbit_access.return_value = orbit_access(
+        organization_id, orbit_id, user_id, collection_id
     )
-    mock_get_org_role.return_value = OrgRole.OWNER
-    mock_get_orbit_role.return_value = OrbitRole.MEMBER
 
     update_in = MLModelUpdateIn(tags=tags)
     result = await handler.update_model(
@@ -714,23 +612,11 @@ async def test_update_model(
 
 
 @patch(
-    "dataforce_studio.handlers.ml_models.MLModelRepository.get_ml_model",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.ml_models.CollectionRepository.get_collection",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.ml_models.OrbitRepository.get_orbit_simple",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.permissions.UserRepository.get_organization_member_role",
+    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_access",
     new_callable=AsyncMock,
 )
 @patch(
-    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_member_role",
+    "dataforce_studio.handlers.ml_models.MLModelRepository.get_ml_model",
     new_callable=AsyncMock,
 )
 @patch(
@@ -740,11 +626,8 @@ async def test_update_model(
 @pytest.mark.asyncio
 async def test_update_model_not_found(
     mock_update: AsyncMock,
-    mock_get_orbit_role: AsyncMock,
-    mock_get_org_role: AsyncMock,
-    mock_get_orbit_simple: AsyncMock,
-    mock_get_collection: AsyncMock,
     mock_get_ml_model: AsyncMock,
+    mock_get_orbit_access: AsyncMock,
 ) -> None:
     user_id = random.randint(1, 10000)
     organization_id = random.randint(1, 10000)
@@ -753,19 +636,10 @@ async def test_update_model_not_found(
     collection_id = random.randint(1, 10000)
 
     mock_update.return_value = None
-    mock_get_orbit_simple.return_value = type(
-        "obj",
-        (),
-        {"bucket_secret_id": 1, "organization_id": organization_id},
-    )
-    mock_get_collection.return_value = type(
-        "obj",
-        (),
-        {"id": collection_id, "orbit_id": orbit_id},
+    mock_get_orbit_access.return_value = orbit_access(
+        organization_id, orbit_id, user_id, collection_id
     )
     mock_get_ml_model.return_value = None
-    mock_get_org_role.return_value = OrgRole.OWNER
-    mock_get_orbit_role.return_value = OrbitRole.MEMBER
 
     update_in = MLModelUpdateIn(tags=["t1"])
     with pytest.raises(NotFoundError, match="ML model not found"):
@@ -774,3 +648,859 @@ async def test_update_model_not_found(
         )
 
     mock_update.assert_not_awaited()
+
+
+@patch(
+    "dataforce_studio.handlers.ml_models.BucketSecretRepository.get_bucket_secret",
+    new_callable=AsyncMock,
+)
+@pytest.mark.asyncio
+async def test_get_download_url_reuses_storage_client(
+    mock_get_bucket_secret: AsyncMock,
+) -> None:
+    secret_id = random.randint(1, 10000)
+    mock_get_bucket_secret.return_value = BucketSecret(
+        id=secret_id,
+        organization_id=1,
+        endpoint="s3.example.com",
+        bucket_name="models",
+        access_key="access",
+        secret_key="secret",
+        region="us-east-1",
+        created_at=datetime.now(),
+    )
+
+    first = await handler._get_download_url(secret_id, "orbit-1/model.dfs")
+    second = await handler._get_download_url(secret_id, "orbit-1/other.dfs")
+
+    assert first.startswith("https://s3.example.com/models/orbit-1/model.dfs?")
+    assert second.startswith("https://s3.example.com/models/orbit-1/other.dfs?")
+    mock_get_bucket_secret.assert_awaited_once_with(secret_id)
+
+    await invalidate_storage_client(secret_id)
+    await handler._get_delete_url(secret_id, "orbit-1/model.dfs")
+
+    assert mock_get_bucket_secret.await_count == 2
+
+
+@patch(
+    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_access",
+    new_callable=AsyncMock,
+)
+@patch(
+    "dataforce_studio.handlers.ml_models.MLModelRepository.get_collection_model_downloads_page",
+    new_callable=AsyncMock,
+)
+@patch(
+    "dataforce_studio.handlers.ml_models.BucketSecretRepository.get_bucket_secret",
+    new_callable=AsyncMock,
+)
+@pytest.mark.asyncio
+async def test_get_collection_models_with_urls(
+    mock_get_bucket_secret: AsyncMock,
+    mock_get_downloads_page: AsyncMock,
+    mock_get_orbit_access: AsyncMock,
+) -> None:
+    user_id = random.randint(1, 10000)
+    organization_id = random.randint(1, 10000)
+    orbit_id = random.randint(1, 10000)
+    collection_id = random.randint(1, 10000)
+    secret_id = random.randint(10001, 20000)
+
+    access = orbit_access(organization_id, orbit_id, user_id, collection_id)
+    assert access.orbit
+    access.orbit.bucket_secret_id = secret_id
+    mock_get_orbit_access.return_value = access
+    mock_get_bucket_secret.return_value = BucketSecret(
+        id=secret_id,
+        organization_id=organization_id,
+        endpoint="s3.example.com",
+        bucket_name="models",
+        access_key="access",
+        secret_key="secret",
+        region="us-east-1",
+        created_at=datetime.now(),
+    )
+    models = [
+        MLModelDownloadSummary(
+            id=model_id,
+            collection_id=collection_id,
+            file_name="model",
+            metrics={},
+            bucket_location=f"orbit-{orbit_id}/model-{model_id}.dfs",
+            size=1,
+            status=MLModelStatus.UPLOADED,
+            created_at=datetime.now(),
+        )
+        for model_id in range(1, 52)
+    ]
+    mock_get_downloads_page.return_value = models
+    model_ids = [m.id for m in models]
+
+    result = await handler.get_collection_models_with_urls(
+        user_id, organization_id, orbit_id, collection_id, model_ids, limit=50
+    )
+
+    assert [item.model for item in result.items] == models[:50]
+    assert all(
+        item.url.startswith(f"https://s3.example.com/models/orbit-{orbit_id}/model-")
+        for item in result.items
+    )
+    assert "bucket_location" not in result.model_dump()["items"][0]["model"]
+    assert result.cursor
+    assert decode_cursor(result.cursor) == (models[49].created_at, models[49].id)
+    mock_get_orbit_access.assert_awaited_once()
+    mock_get_downloads_page.assert_awaited_once_with(
+        collection_id,
+        51,
+        None,
+        MLModelListFilters(ids=model_ids, status=[MLModelStatus.UPLOADED]),
+    )
+    mock_get_bucket_secret.assert_awaited_once_with(secret_id)
+
+
+@patch(
+    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_access",
+    new_callable=AsyncMock,
+)
+@patch(
+    "dataforce_studio.handlers.ml_models.MLModelRepository.get_collection_models_page",
+    new_callable=AsyncMock,
+)
+@pytest.mark.asyncio
+async def test_get_collection_models_page(
+    mock_get_collection_models_page: AsyncMock,
+    mock_get_orbit_access: AsyncMock,
+) -> None:
+    user_id = random.randint(1, 10000)
+    organization_id = random.randint(1, 10000)
+    orbit_id = random.randint(1, 10000)
+    collection_id = random.randint(1, 10000)
+
+    mock_get_orbit_access.return_value = orbit_access(
+        organization_id, orbit_id, user_id, collection_id
+    )
+    models = [
+        MLModel(
+            id=model_id,
+            collection_id=collection_id,
+            file_name="model",
+            metrics={},
+            manifest=manifest_example_obj,
+            file_hash="hash",
+            file_index={},
+            bucket_location=f"orbit-{orbit_id}/model-{model_id}.dfs",
+            size=1,
+            unique_identifier="uid",
+            status=MLModelStatus.UPLOADED,
+            created_at=datetime(2025, 7, 18, 12, model_id),
+        )
+        for model_id in range(5, 0, -1)
+    ]
+    mock_get_collection_models_page.side_effect = [models, models[:3], models[2:]]
+
+    everything = await handler.get_collection_models(
+        user_id, organization_id, orbit_id, collection_id
+    )
+
+    assert everything.items == models
+    assert everything.cursor is None
+
+    first = await handler.get_collection_models(
+        user_id, organization_id, orbit_id, collection_id, limit=2
+    )
+
+    assert first.items == models[:2]
+    assert first.cursor
+    assert decode_cursor(first.cursor) == (models[1].created_at, models[1].id)
+
+    last = await handler.get_collection_models(
+        user_id, organization_id, orbit_id, collection_id, first.cursor, limit=3
+    )
+
+    assert last.items == models[2:]
+    assert last.cursor is None
+    assert [c.args for c in mock_get_collection_models_page.await_args_list] == [
+        (collection_id, None, None, MLModelListFilters()),
+        (collection_id, 3, None, MLModelListFilters()),
+        (
+            collection_id,
+            4,
+            (models[1].created_at, models[1].id),
+            MLModelListFilters(),
+        ),
+    ]
+
+    with pytest.raises(InvalidCursorError):
+        await handler.get_collection_models(
+            user_id, organization_id, orbit_id, collection_id, "broken"
+        )
+
+
+@patch(
+    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_access",
+    new_callable=AsyncMock,
+)
+@patch(
+    "dataforce_studio.handlers.ml_models.MLModelRepository.get_collection_model_summaries_page",
+    new_callable=AsyncMock,
+)
+@pytest.mark.asyncio
+async def test_get_collection_model_summaries(
+    mock_get_summaries_page: AsyncMock,
+    mock_get_orbit_access: AsyncMock,
+) -> None:
+    user_id = random.randint(1, 10000)
+    organization_id = random.randint(1, 10000)
+    orbit_id = random.randint(1, 10000)
+    collection_id = random.randint(1, 10000)
+
+    mock_get_orbit_access.return_value = orbit_access(
+        organization_id, orbit_id, user_id, collection_id
+    )
+    summaries = [
+        MLModelSummary(
+            id=model_id,
+            collection_id=collection_id,
+            file_name="model.dfs",
+            metrics={"accuracy": 0.9},
+            size=1,
+            status=MLModelStatus.UPLOADED,
+            created_at=datetime(2025, 7, 18, 12, model_id),
+        )
+        for model_id in range(3, 0, -1)
+    ]
+    mock_get_summaries_page.return_value = summaries
+
+    filters = MLModelListFilters(sort_metric="accuracy")
+
+    page = await handler.get_collection_model_summaries(
+        user_id, organization_id, orbit_id, collection_id, None, 2, ["accuracy"]
+    )
+    sorted_page = await handler.get_collection_model_summaries(
+        user_id, organization_id, orbit_id, collection_id, None, 2, None, filters
+    )
+
+    assert page.items == summaries[:2]
+    assert page.cursor
+    assert decode_cursor(page.cursor) == (summaries[1].created_at, summaries[1].id)
+    assert sorted_page.cursor
+    assert decode_metric_cursor(sorted_page.cursor) == (0.9, summaries[1].id)
+    assert mock_get_summaries_page.await_args_list[0].args == (
+        collection_id,
+        3,
+        None,
+        ["accuracy"],
+        MLModelListFilters(),
+    )
+
+    await handler.get_collection_model_summaries(
+        user_id,
+        organization_id,
+        orbit_id,
+        collection_id,
+        sorted_page.cursor,
+        2,
+        None,
+        filters,
+    )
+
+    assert mock_get_summaries_page.await_args.args[2] == (0.9, summaries[1].id)
+    with pytest.raises(InvalidCursorError):
+        await handler.get_collection_model_summaries(
+            user_id,
+            organization_id,
+            orbit_id,
+            collection_id,
+            page.cursor,
+            2,
+            None,
+            filters,
+        )
+
+
+def _multipart_model(model_id: int, collection_id: int, size: int) -> MLModel:
+    return MLModel(
+        id=model_id,
+        collection_id=collection_id,
+        file_name="model.dfs",
+        metrics={},
+        manifest=manifest_example_obj,
+        file_hash="hash",
+        file_index={},
+        bucket_location="orbit-1/collection-1/uid-model.dfs",
+        size=size,
+        unique_identifier="uid",
+        status=MLModelStatus.PENDING_UPLOAD,
+        upload_id="upload-id",
+        upload_part_size=64 * 1024**2,
+        upload_parts_count=2,
+        created_at=datetime.now(),
+    )
+
+
+@patch(
+    "dataforce_studio.handlers.ml_models.MLModelRepository.get_uploaded_model_by_hash",
+    new_callable=AsyncMock,
+    return_value=None,
+)
+@patch(
+    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_access",
+    new_callable=AsyncMock,
+)
+@patch(
+    "dataforce_studio.handlers.ml_models.MLModelRepository.create_ml_model",
+    new_callable=AsyncMock,
+)
+@patch(
+    "dataforce_studio.handlers.ml_models.create_multipart_upload",
+    new_callable=AsyncMock,
+)
+@patch(
+    "dataforce_studio.handlers.ml_models.MLModelHandler._get_storage_client",
+    new_callable=AsyncMock,
+)
+@pytest.mark.asyncio
+async def test_create_ml_model_multipart(
+    mock_get_storage_client: AsyncMock,
+    mock_create_multipart_upload: AsyncMock,
+    mock_create_model: AsyncMock,
+    mock_get_orbit_access: AsyncMock,
+    mock_get_by_hash: AsyncMock,
+) -> None:
+    user_id = random.randint(1, 10000)
+    organization_id = random.randint(1, 10000)
+    orbit_id = random.randint(1, 10000)
+    collection_id = random.randint(1, 10000)
+    size = 100 * 1024**2
+
+    mock_get_orbit_access.return_value = orbit_access(
+        organization_id, orbit_id, user_id, collection_id
+    )
+    mock_get_storage_client.return_value = StorageClient(
+        secret := BucketSecret(
+            id=1,
+            organization_id=organization_id,
+            endpoint="s3.example.com",
+            bucket_name="models",
+            access_key="access",
+            secret_key="secret",
+            region="us-east-1",
+            created_at=datetime.now(),
+        ),
+        Mock(),
+        S3Presigner.from_bucket_secret(secret),
+    )
+    mock_create_multipart_upload.return_value = "upload-id"
+    mock_create_model.side_effect = lambda model: _multipart_model(
+        1, collection_id, size
+    )
+
+    result = await handler.create_ml_model_multipart(
+        user_id,
+        organization_id,
+        orbit_id,
+        collection_id,
+        MLModelIn(
+            metrics={},
+            manifest=manifest_example_obj,
+            file_hash="hash",
+            file_index={},
+            size=size,
+            file_name="model.dfs",
+        ),
+    )
+
+    created = mock_create_model.await_args.args[0]
+    assert created.upload_id == "upload-id"
+    assert created.upload_part_size == 64 * 1024**2
+    assert created.upload_parts_count == 2
+    assert result.parts_count == 2
+    assert [part.part_number for part in result.parts] == [1, 2]
+    assert all(
+        "partNumber=" in part.url and "uploadId=upload-id" in part.url
+        for part in result.parts
+    )
+
+
+@patch(
+    "dataforce_studio.handlers.ml_models.MLModelHandler._schedule_verification",
+)
+@patch(
+    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_access",
+    new_callable=AsyncMock,
+)
+@patch(
+    "dataforce_studio.handlers.ml_models.MLModelRepository.get_ml_model",
+    new_callable=AsyncMock,
+)
+@patch(
+    "dataforce_studio.handlers.ml_models.MLModelRepository.update_upload",
+    new_callable=AsyncMock,
+)
+@patch(
+    "dataforce_studio.handlers.ml_models.MLModelHandler._get_storage_client",
+    new_callable=AsyncMock,
+)
+@patch(
+    "dataforce_studio.handlers.ml_models.list_uploaded_parts",
+    new_callable=AsyncMock,
+)
+@patch(
+    "dataforce_studio.handlers.ml_models.complete_multipart_upload",
+    new_callable=AsyncMock,
+)
+@pytest.mark.asyncio
+async def test_complete_multipart_upload(
+    mock_complete: AsyncMock,
+    mock_list_parts: AsyncMock,
+    mock_get_storage_client: AsyncMock,
+    mock_update_upload: AsyncMock,
+    mock_get_model: AsyncMock,
+    mock_get_orbit_access: AsyncMock,
+    mock_schedule_verification: Mock,
+) -> None:
+    user_id = random.randint(1, 10000)
+    organization_id = random.randint(1, 10000)
+    orbit_id = random.randint(1, 10000)
+    collection_id = random.randint(1, 10000)
+    model_id = random.randint(1, 10000)
+    part_size = 64 * 1024**2
+    model = _multipart_model(model_id, collection_id, part_size + 10)
+
+    mock_get_orbit_access.return_value = orbit_access(
+        organization_id, orbit_id, user_id, collection_id
+    )
+    mock_get_model.return_value = model
+    uploaded = [Part(1, "etag-1", size=part_size), Part(2, "etag-2", size=10)]
+    mock_list_parts.return_value = uploaded
+    mock_update_upload.return_value = model.model_copy(
+        update={"status": MLModelStatus.VERIFYING, "upload_id": None}
+    )
+
+    with pytest.raises(ServiceError, match="Part 2 does not match uploaded data"):
+        await handler.complete_multipart_upload(
+            user_id,
+            organization_id,
+            orbit_id,
+            collection_id,
+            model_id,
+            [
+                UploadedPart(part_number=1, etag='"etag-1"'),
+                UploadedPart(part_number=2, etag='"other"'),
+            ],
+        )
+    mock_complete.assert_not_awaited()
+
+    result = await handler.complete_multipart_upload(
+        user_id,
+        organization_id,
+        orbit_id,
+        collection_id,
+        model_id,
+        [
+            UploadedPart(part_number=2, etag='"etag-2"'),
+            UploadedPart(part_number=1, etag='"etag-1"'),
+        ],
+    )
+
+    assert result.status == MLModelStatus.VERIFYING
+    mock_complete.assert_awaited_once_with(
+        mock_get_storage_client.return_value,
+        model.bucket_location,
+        "upload-id",
+        uploaded,
+    )
+    mock_update_upload.assert_awaited_once_with(
+        model_id,
+        "upload-id",
+        MLModelUploadUpdate(
+            id=model_id,
+            status=MLModelStatus.VERIFYING,
+            upload_id=None,
+            uploaded_parts_count=2,
+            uploaded_bytes=part_size + 10,
+        ),
+    )
+    mock_schedule_verification.assert_called_once_with(
+        result, mock_get_storage_client.return_value.secret.id
+    )
+
+
+@patch(
+    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_access",
+    new_callable=AsyncMock,
+)
+@patch(
+    "dataforce_studio.handlers.ml_models.MLModelRepository.get_ml_model",
+    new_callable=AsyncMock,
+)
+@patch(
+    "dataforce_studio.handlers.ml_models.MLModelRepository.update_ml_model",
+    new_callable=AsyncMock,
+)
+@pytest.mark.asyncio
+async def test_update_model_multipart_requires_completion(
+    mock_update: AsyncMock,
+    mock_get_model: AsyncMock,
+    mock_get_orbit_access: AsyncMock,
+) -> None:
+    user_id = random.randint(1, 10000)
+    organization_id = random.randint(1, 10000)
+    orbit_id = random.randint(1, 10000)
+    collection_id = random.randint(1, 10000)
+    model_id = random.randint(1, 10000)
+
+    mock_get_orbit_access.return_value = orbit_access(
+        organization_id, orbit_id, user_id, collection_id
+    )
+    mock_get_model.return_value = _multipart_model(model_id, collection_id, 1)
+
+    with pytest.raises(ServiceError, match="Complete the multipart upload"):
+        await handler.update_model(
+            user_id,
+            organization_id,
+            orbit_id,
+            collection_id,
+            model_id,
+            MLModelUpdateIn(status=MLModelStatus.UPLOADED),
+        )
+
+    mock_update.assert_not_awaited()
+
+
+def _uploaded_model(model_id: int, collection_id: int) -> MLModel:
+    return MLModel(
+        id=model_id,
+        collection_id=collection_id,
+        file_name="model.dfs",
+        metrics={},
+        manifest=manifest_example_obj,
+        file_hash="hash",
+        file_index={"model.json": (512, 100), "empty.txt": (1536, 0)},
+        bucket_location="orbit-1/collection-1/uid-model.dfs",
+        size=2048,
+        unique_identifier="uid",
+        status=MLModelStatus.UPLOADED,
+        created_at=datetime.now(),
+    )
+
+
+@patch(
+    "dataforce_studio.handlers.ml_models.MLModelHandler._get_storage_client",
+    new_callable=AsyncMock,
+)
+@patch(
+    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_access",
+    new_callable=AsyncMock,
+)
+@patch(
+    "dataforce_studio.handlers.ml_models.MLModelRepository.get_ml_model",
+    new_callable=AsyncMock,
+)
+@pytest.mark.asyncio
+async def test_get_model_file_url(
+    mock_get_ml_model: AsyncMock,
+    mock_get_orbit_access: AsyncMock,
+    mock_get_storage_client: AsyncMock,
+) -> None:
+    user_id = random.randint(1, 10000)
+    organization_id = random.randint(1, 10000)
+    orbit_id = random.randint(1, 10000)
+    collection_id = random.randint(1, 10000)
+    model_id = random.randint(1, 10000)
+
+    presigner = Mock()
+    presigner.presign.return_value = "https://s3.example.com/models/range"
+    mock_get_storage_client.return_value = StorageClient(Mock(), Mock(), presigner)
+    mock_get_orbit_access.return_value = orbit_access(
+        organization_id, orbit_id, user_id, collection_id
+    )
+    model = _uploaded_model(model_id, collection_id)
+    mock_get_ml_model.return_value = model
+
+    result = await handler.get_model_file_url(
+        user_id, organization_id, orbit_id, collection_id, model_id, "model.json"
+    )
+
+    assert result.url == "https://s3.example.com/models/range"
+    assert result.headers == {"Range": "bytes=512-611"}
+    assert (result.offset, result.size) == (512, 100)
+    assert presigner.presign.call_args.kwargs["headers"] == result.headers
+
+    presigner.presign.reset_mock()
+    empty = await handler.get_model_file_url(
+        user_id, organization_id, orbit_id, collection_id, model_id, "empty.txt"
+    )
+
+    assert empty.url is None
+    assert empty.headers == {}
+    assert (empty.offset, empty.size) == (1536, 0)
+    presigner.presign.assert_not_called()
+
+    with pytest.raises(NotFoundError, match="File not found in ML model"):
+        await handler.get_model_file_url(
+            user_id, organization_id, orbit_id, collection_id, model_id, "missing"
+        )
+
+    model.status = MLModelStatus.PENDING_UPLOAD
+    with pytest.raises(ServiceError, match="Unable to read files"):
+        await handler.get_model_file_url(
+            user_id, organization_id, orbit_id, collection_id, model_id, "model.json"
+        )
+
+
+@patch(
+    "dataforce_studio.handlers.ml_models.open_object_range",
+    new_callable=AsyncMock,
+)
+@patch(
+    "dataforce_studio.handlers.ml_models.MLModelHandler._get_storage_client",
+    new_callable=AsyncMock,
+)
+@patch(
+    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_access",
+    new_callable=AsyncMock,
+)
+@patch(
+    "dataforce_studio.handlers.ml_models.MLModelRepository.get_ml_model",
+    new_callable=AsyncMock,
+)
+@pytest.mark.asyncio
+async def test_open_model_file(
+    mock_get_ml_model: AsyncMock,
+    mock_get_orbit_access: AsyncMock,
+    mock_get_storage_client: AsyncMock,
+    mock_open_object_range: AsyncMock,
+) -> None:
+    user_id = random.randint(1, 10000)
+    organization_id = random.randint(1, 10000)
+    orbit_id = random.randint(1, 10000)
+    collection_id = random.randint(1, 10000)
+    model_id = random.randint(1, 10000)
+
+    presigner = Mock()
+    presigner.presign.return_value = "https://s3.example.com/models/range"
+    mock_get_storage_client.return_value = StorageClient(Mock(), Mock(), presigner)
+    mock_get_orbit_access.return_value = orbit_access(
+        organization_id, orbit_id, user_id, collection_id
+    )
+    mock_get_ml_model.return_value = _uploaded_model(model_id, collection_id)
+    stream = ObjectStream(Mock(), 100, AsyncMock())
+    mock_open_object_range.return_value = stream
+
+    result = await handler.open_model_file(
+        user_id, organization_id, orbit_id, collection_id, model_id, "model.json"
+    )
+
+    assert result == stream
+    mock_open_object_range.assert_awaited_once_with(
+        "https://s3.example.com/models/range", 512, 100
+    )
+
+    empty = await handler.open_model_file(
+        user_id, organization_id, orbit_id, collection_id, model_id, "empty.txt"
+    )
+
+    assert empty.size == 0
+    assert [chunk async for chunk in empty.chunks] == []
+    mock_open_object_range.assert_awaited_once()
+
+
+@patch(
+    "dataforce_studio.handlers.ml_models.MLModelRepository.update_status",
+    new_callable=AsyncMock,
+)
+@patch(
+    "dataforce_studio.handlers.ml_models.MLModelHandler._get_storage_client",
+    new_callable=AsyncMock,
+)
+@patch(
+    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_access",
+    new_callable=AsyncMock,
+)
+@patch(
+    "dataforce_studio.handlers.ml_models.MLModelRepository.get_ml_model",
+    new_callable=AsyncMock,
+)
+@patch(
+    "dataforce_studio.handlers.ml_models.MLModelRepository.update_ml_model",
+    new_callable=AsyncMock,
+)
+@pytest.mark.asyncio
+async def test_update_model_uploaded_is_verified(
+    mock_update: AsyncMock,
+    mock_get_model: AsyncMock,
+    mock_get_orbit_access: AsyncMock,
+    mock_get_storage_client: AsyncMock,
+    mock_update_status: AsyncMock,
+) -> None:
+    user_id = random.randint(1, 10000)
+    organization_id = random.randint(1, 10000)
+    orbit_id = random.randint(1, 10000)
+    collection_id = random.randint(1, 10000)
+    data = b"model" * 1000
+
+    mock_get_orbit_access.return_value = orbit_access(
+        organization_id, orbit_id, user_id, collection_id
+    )
+    models = {
+        model_id: _multipart_model(model_id, collection_id, len(data)).model_copy(
+            update={
+                "upload_id": None,
+                "bucket_location": f"model-{model_id}.dfs",
+                "file_hash": file_hash,
+            }
+        )
+        for model_id, file_hash in [
+            (1, hashlib.sha256(data).hexdigest()),
+            (2, hashlib.sha256(b"other").hexdigest()),
+        ]
+    }
+    S3StubHandler.objects = {
+        "/models/model-1.dfs": data,
+        "/models/model-2.dfs": data,
+    }
+
+    with run_s3_stub() as endpoint:
+        presigner = S3Presigner(
+            endpoint, "access", "secret", secure=False, region="us-east-1"
+        )
+        mock_get_storage_client.return_value = StorageClient(
+            Mock(bucket_name="models"), Mock(), presigner
+        )
+        for model_id, model in models.items():
+            mock_get_model.return_value = model
+            mock_update.return_value = model.model_copy(
+                update={"status": MLModelStatus.VERIFYING}
+            )
+
+            result = await handler.update_model(
+                user_id,
+                organization_id,
+                orbit_id,
+                collection_id,
+                model_id,
+                MLModelUpdateIn(status=MLModelStatus.UPLOADED),
+            )
+
+            assert result.status == MLModelStatus.VERIFYING
+            assert mock_update.await_args
+            assert mock_update.await_args.args[2].status == MLModelStatus.VERIFYING
+
+        await handler.wait_for_verifications()
+    S3StubHandler.objects = {}
+
+    assert sorted(c.args for c in mock_update_status.await_args_list) == [
+        (1, MLModelStatus.UPLOADED),
+        (2, MLModelStatus.UPLOAD_FAILED),
+    ]
+    assert all(
+        c.kwargs == {"current_status": MLModelStatus.VERIFYING}
+        for c in mock_update_status.await_args_list
+    )
+
+
+@patch(
+    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_access",
+    new_callable=AsyncMock,
+)
+@patch(
+    "dataforce_studio.handlers.ml_models.MLModelRepository.get_uploaded_model_by_hash",
+    new_callable=AsyncMock,
+)
+@patch(
+    "dataforce_studio.handlers.ml_models.MLModelRepository.create_ml_model_copy",
+    new_callable=AsyncMock,
+)
+@patch(
+    "dataforce_studio.handlers.ml_models.MLModelHandler._get_presigned_url",
+    new_callable=AsyncMock,
+)
+@pytest.mark.asyncio
+async def test_create_ml_model_deduplicated(
+    mock_get_presigned: AsyncMock,
+    mock_create_model: AsyncMock,
+    mock_get_by_hash: AsyncMock,
+    mock_get_orbit_access: AsyncMock,
+) -> None:
+    user_id = random.randint(1, 10000)
+    organization_id = random.randint(1, 10000)
+    orbit_id = random.randint(1, 10000)
+    collection_id = random.randint(1, 10000)
+
+    access = orbit_access(organization_id, orbit_id, user_id, collection_id)
+    assert access.orbit
+    mock_get_orbit_access.return_value = access
+    existing = _uploaded_model(1, collection_id + 1)
+    mock_get_by_hash.return_value = existing
+    mock_create_model.side_effect = lambda model: MLModel(
+        id=2, created_at=datetime.now(), **model.model_dump()
+    )
+    ml_model_in = MLModelIn(
+        metrics={},
+        manifest=manifest_example_obj,
+        file_hash=existing.file_hash,
+        file_index=existing.file_index,
+        size=existing.size,
+        file_name="copy.dfs",
+    )
+
+    result_model, url = await handler.create_ml_model(
+        user_id, organization_id, orbit_id, collection_id, ml_model_in
+    )
+
+    assert url is None
+    assert result_model.bucket_location == existing.bucket_location
+    assert result_model.status == MLModelStatus.UPLOADED
+    assert result_model.collection_id == collection_id
+    assert result_model.unique_identifier != existing.unique_identifier
+    mock_get_by_hash.assert_awaited_once_with(
+        orbit_id, existing.file_hash, existing.size
+    )
+    mock_get_presigned.assert_not_awaited()
+
+
+@patch(
+    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_access",
+    new_callable=AsyncMock,
+)
+@patch(
+    "dataforce_studio.handlers.ml_models.MLModelRepository.get_ml_model",
+    new_callable=AsyncMock,
+)
+@patch(
+    "dataforce_studio.handlers.ml_models.MLModelRepository.mark_for_deletion",
+    new_callable=AsyncMock,
+    return_value=False,
+)
+@patch(
+    "dataforce_studio.handlers.ml_models.MLModelHandler._get_delete_url",
+    new_callable=AsyncMock,
+)
+@pytest.mark.asyncio
+async def test_request_delete_url_shared_object(
+    mock_get_delete_url: AsyncMock,
+    mock_mark_for_deletion: AsyncMock,
+    mock_get_model: AsyncMock,
+    mock_get_orbit_access: AsyncMock,
+) -> None:
+    user_id = random.randint(1, 10000)
+    organization_id = random.randint(1, 10000)
+    orbit_id = random.randint(1, 10000)
+    collection_id = random.randint(1, 10000)
+    model_id = random.randint(1, 10000)
+
+    mock_get_orbit_access.return_value = orbit_access(
+        organization_id, orbit_id, user_id, collection_id
+    )
+    model = _uploaded_model(model_id, collection_id)
+    mock_get_model.return_value = model
+
+    url = await handler.request_delete_url(
+        user_id, organization_id, orbit_id, collection_id, model_id
+    )
+
+    assert url is None
+    mock_mark_for_deletion.assert_awaited_once_with(model_id, model.bucket_location)
+    mock_get_delete_url.assert_not_awaited()
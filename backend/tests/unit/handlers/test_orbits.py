@@ -1,5 +1,5 @@
 import random
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -20,6 +20,7 @@ from dataforce_studio.schemas.orbit import (
     UpdateOrbitMember,
 )
 from dataforce_studio.schemas.organization import OrgRole
+from tests.conftest import orbit_access
 
 handler = OrbitHandler()
 
@@ -235,11 +236,7 @@ async def test_get_organization_orbits(
 
 
 @patch(
-    "dataforce_studio.handlers.permissions.UserRepository.get_organization_member_role",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.orbits.OrbitRepository.get_orbit_member_role",
+    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_access",
     new_callable=AsyncMock,
 )
 @patch(
@@ -249,15 +246,15 @@ async def test_get_organization_orbits(
 @pytest.mark.asyncio
 async def test_get_orbit(
     mock_get_orbit: AsyncMock,
-    mock_get_orbit_member_role: AsyncMock,
-    mock_get_organization_member_role: AsyncMock,
+    mock_get_orbit_access: AsyncMock,
 ) -> None:
     user_id = random.randint(1, 10000)
     expected = OrbitDetails(**test_orbit_details)
 
     mock_get_orbit.return_value = expected
-    mock_get_organization_member_role.return_value = OrgRole.OWNER
-    mock_get_orbit_member_role.return_value = OrgRole.ADMIN
+    mock_get_orbit_access.return_value = orbit_access(
+        expected.organization_id, expected.id, user_id, orbit_role=OrbitRole.ADMIN
+    )
 
     result = await handler.get_orbit(user_id, expected.organization_id, expected.id)
 
@@ -266,11 +263,7 @@ async def test_get_orbit(
 
 
 @patch(
-    "dataforce_studio.handlers.permissions.UserRepository.get_organization_member_role",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.orbits.OrbitRepository.get_orbit_member_role",
+    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_access",
     new_callable=AsyncMock,
 )
 @patch(
@@ -280,16 +273,16 @@ async def test_get_orbit(
 @pytest.mark.asyncio
 async def test_get_orbit_not_found(
     mock_get_orbit: AsyncMock,
-    mock_get_orbit_member_role: AsyncMock,
-    mock_get_organization_member_role: AsyncMock,
+    mock_get_orbit_access: AsyncMock,
 ) -> None:
     user_id = random.randint(1, 10000)
     organization_id = random.randint(1, 10000)
     orbit_id = random.randint(1, 10000)
 
     mock_get_orbit.return_value = None
-    mock_get_organization_member_role.return_value = OrgRole.OWNER
-    mock_get_orbit_member_role.return_value = OrgRole.ADMIN
+    mock_get_orbit_access.return_value = orbit_access(
+        organization_id, orbit_id, user_id, orbit_role=OrbitRole.ADMIN
+    )
 
     with pytest.raises(NotFoundError, match="Orbit not found") as error:
         await handler.get_orbit(user_id, organization_id, orbit_id)
@@ -299,11 +292,7 @@ async def test_get_orbit_not_found(
 
 
 @patch(
-    "dataforce_studio.handlers.permissions.UserRepository.get_organization_member_role",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.orbits.OrbitRepository.get_orbit_member_role",
+    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_access",
     new_callable=AsyncMock,
 )
 @patch(
@@ -313,15 +302,15 @@ async def test_get_orbit_not_found(
 @pytest.mark.asyncio
 async def test_update_orbit(
     mock_update_orbit: AsyncMock,
-    mock_get_orbit_member_role: AsyncMock,
-    mock_get_organization_member_role: AsyncMock,
+    mock_get_orbit_access: AsyncMock,
 ) -> None:
     user_id = random.randint(1, 10000)
     expected = OrbitDetails(**test_orbit_details)
 
     mock_update_orbit.return_value = expected
-    mock_get_organization_member_role.return_value = OrgRole.OWNER
-    mock_get_orbit_member_role.return_value = OrgRole.ADMIN
+    mock_get_orbit_access.return_value = orbit_access(
+        expected.organization_id, expected.id, user_id, orbit_role=OrbitRole.ADMIN
+    )
 
     update_orbit = OrbitUpdate(name="new_name")
     result = await handler.update_orbit(
@@ -333,11 +322,7 @@ async def test_update_orbit(
 
 
 @patch(
-    "dataforce_studio.handlers.permissions.UserRepository.get_organization_member_role",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.orbits.OrbitRepository.get_orbit_member_role",
+    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_access",
     new_callable=AsyncMock,
 )
 @patch(
@@ -347,8 +332,7 @@ async def test_update_orbit(
 @pytest.mark.asyncio
 async def test_update_orbit_not_found(
     mock_update_orbit: AsyncMock,
-    mock_get_orbit_member_role: AsyncMock,
-    mock_get_organization_member_role: AsyncMock,
+    mock_get_orbit_access: AsyncMock,
 ) -> None:
     user_id = random.randint(1, 10000)
     organization_id = random.randint(1, 10000)
@@ -356,8 +340,9 @@ async def test_update_orbit_not_found(
     update_orbit = OrbitUpdate(name="new_name")
 
     mock_update_orbit.return_value = None
-    mock_get_organization_member_role.return_value = OrgRole.OWNER
-    mock_get_orbit_member_role.return_value = OrgRole.ADMIN
+    mock_get_orbit_access.return_value = orbit_access(
+        organization_id, orbit_id, user_id, orbit_role=OrbitRole.ADMIN
+    )
 
     with pytest.raises(NotFoundError, match="Orbit not found") as error:
         await handler.update_orbit(user_id, organization_id, orbit_id, update_orbit)
@@ -367,11 +352,7 @@ async def test_update_orbit_not_found(
 
 
 @patch(
-    "dataforce_studio.handlers.permissions.UserRepository.get_organization_member_role",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.orbits.OrbitRepository.get_orbit_member_role",
+    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_access",
     new_callable=AsyncMock,
 )
 @patch(
@@ -381,16 +362,16 @@ async def test_update_orbit_not_found(
 @pytest.mark.asyncio
 async def test_delete_orbit(
     mock_delete_orbit: AsyncMock,
-    mock_get_orbit_member_role: AsyncMock,
-    mock_get_organization_member_role: AsyncMock,
+    mock_get_orbit_access: AsyncMock,
 ) -> None:
     user_id = random.randint(1, 10000)
     organization_id = random.randint(1, 10000)
     orbit_id = random.randint(1, 10000)
 
     mock_delete_orbit.return_value = None
-    mock_get_organization_member_role.return_value = OrgRole.OWNER
-    mock_get_orbit_member_role.return_value = OrgRole.ADMIN
+    mock_get_orbit_access.return_value = orbit_access(
+        organization_id, orbit_id, user_id, orbit_role=OrbitRole.ADMIN
+    )
 
     deleted = await handler.delete_orbit(user_id, organization_id, orbit_id)
 
@@ -399,11 +380,7 @@ async def test_delete_orbit(
 
 
 @patch(
-    "dataforce_studio.handlers.permissions.UserRepository.get_organization_member_role",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.orbits.OrbitRepository.get_orbit_member_role",
+    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_access",
     new_callable=AsyncMock,
 )
 @patch(
@@ -413,15 +390,15 @@ async def test_delete_orbit(
 @pytest.mark.asyncio
 async def test_get_orbit_members(
     mock_get_orbit_members: AsyncMock,
-    mock_get_orbit_member_role: AsyncMock,
-    mock_get_organization_member_role: AsyncMock,
+    mock_get_orbit_access: AsyncMock,
 ) -> None:
     organization_id = random.randint(1, 10000)
     expected = OrbitMember(**test_orbit_member)
 
     mock_get_orbit_members.return_value = expected
-    mock_get_organization_member_role.return_value = OrgRole.OWNER
-    mock_get_orbit_member_role.return_value = OrgRole.ADMIN
+    mock_get_orbit_access.return_value = orbit_access(
+        organization_id, expected.id, expected.user.id, orbit_role=OrbitRole.ADMIN
+    )
 
     result = await handler.get_orbit_members(
         expected.user.id, organization_id, expected.id
@@ -431,20 +408,12 @@ async def test_get_orbit_members(
     mock_get_orbit_members.assert_awaited_once_with(expected.id)
 
 
-@patch(
-    "dataforce_studio.handlers.orbits.OrbitRepository.get_orbit_simple",
-    new_callable=AsyncMock,
-)
 @patch(
     "dataforce_studio.handlers.emails.EmailHandler.send_added_to_orbit_email",
-    new_callable=MagicMock,
-)
-@patch(
-    "dataforce_studio.handlers.permissions.UserRepository.get_organization_member_role",
     new_callable=AsyncMock,
 )
 @patch(
-    "dataforce_studio.handlers.orbits.OrbitRepository.get_orbit_member_role",
+    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_access",
     new_callable=AsyncMock,
 )
 @patch(
@@ -464,10 +433,8 @@ async def test_create_orbit_member(
     mock_get_organization_member: AsyncMock,
     mock_create_orbit_member: AsyncMock,
     mock_get_orbit_members_count: AsyncMock,
-    mock_get_orbit_member_role: AsyncMock,
-    mock_get_organization_member_role: AsyncMock,
-    mock_send_added_to_orbit_email: MagicMock,
-    mock_get_orbit_simple: AsyncMock,
+    mock_get_orbit_access: AsyncMock,
+    mock_send_added_to_orbit_email: AsyncMock,
 ) -> None:
     user_id = random.randint(1, 10000)
     organization_id = random.randint(1, 10000)
@@ -487,12 +454,11 @@ async def test_create_orbit_member(
     )
     mock_create_orbit_member.return_value = expected
     mock_get_orbit_members_count.return_value = 0
-    mock_get_organization_member_role.return_value = OrgRole.OWNER
-    mock_get_orbit_member_role.return_value = OrgRole.ADMIN
-    mock_get_orbit_simple.return_value = type(
-        "obj",
-        (),
-        {"bucket_secret_id": 1, "organization_id": organization_id, "name": "name"},
+    mock_get_orbit_access.return_value = orbit_access(
+        organization_id,
+        test_orbit_member["orbit_id"],
+        test_orbit_member["user"]["id"],
+        orbit_role=OrbitRole.ADMIN,
     )
 
     result = await handler.create_orbit_member(
@@ -504,11 +470,7 @@ async def test_create_orbit_member(
 
 
 @patch(
-    "dataforce_studio.handlers.permissions.UserRepository.get_organization_member_role",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.orbits.OrbitRepository.get_orbit_member_role",
+    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_access",
     new_callable=AsyncMock,
 )
 @patch(
@@ -523,8 +485,7 @@ async def test_create_orbit_member(
 async def test_update_orbit_member(
     mock_get_orbit_member: AsyncMock,
     mock_update_orbit_member: AsyncMock,
-    mock_get_orbit_member_role: AsyncMock,
-    mock_get_organization_member_role: AsyncMock,
+    mock_get_orbit_access: AsyncMock,
 ) -> None:
     user_id = random.randint(1, 10000)
     organization_id = random.randint(1, 10000)
@@ -535,8 +496,9 @@ async def test_update_orbit_member(
 
     mock_get_orbit_member.return_value = initial_member
     mock_update_orbit_member.return_value = expected
-    mock_get_organization_member_role.return_value = OrgRole.OWNER
-    mock_get_orbit_member_role.return_value = OrgRole.ADMIN
+    mock_get_orbit_access.return_value = orbit_access(
+        organization_id, expected.orbit_id, user_id, orbit_role=OrbitRole.ADMIN
+    )
 
     result = await handler.update_orbit_member(
         user_id, organization_id, expected.orbit_id, update_member
@@ -547,11 +509,7 @@ async def test_update_orbit_member(
 
 
 @patch(
-    "dataforce_studio.handlers.permissions.UserRepository.get_organization_member_role",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.orbits.OrbitRepository.get_orbit_member_role",
+    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_access",
     new_callable=AsyncMock,
 )
 @patch(
@@ -566,8 +524,7 @@ async def test_update_orbit_member(
 async def test_update_orbit_member_not_found(
     mock_get_orbit_member: AsyncMock,
     mock_update_orbit_member: AsyncMock,
-    mock_get_orbit_member_role: AsyncMock,
-    mock_get_organization_member_role: AsyncMock,
+    mock_get_orbit_access: AsyncMock,
 ) -> None:
     user_id = random.randint(1, 10000)
     organization_id = random.randint(1, 10000)
@@ -577,8 +534,9 @@ async def test_update_orbit_member_not_found(
 
     mock_get_orbit_member.return_value = None
     mock_update_orbit_member.return_value = None
-    mock_get_organization_member_role.return_value = OrgRole.OWNER
-    mock_get_orbit_member_role.return_value = OrgRole.ADMIN
+    mock_get_orbit_access.return_value = orbit_access(
+        organization_id, orbit_id, user_id, orbit_role=OrbitRole.ADMIN
+    )
 
     with pytest.raises(NotFoundError, match="Orbit Member not found") as error:
         await handler.update_orbit_member(
@@ -589,11 +547,7 @@ async def test_update_orbit_member_not_found(
 
 
 @patch(
-    "dataforce_studio.handlers.permissions.UserRepository.get_organization_member_role",
-    new_callable=AsyncMock,
-)
-@patch(
-    "dataforce_studio.handlers.orbits.OrbitRepository.get_orbit_member_role",
+    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_access",
     new_callable=AsyncMock,
 )
 @patch(
@@ -608,8 +562,7 @@ async def test_update_orbit_member_not_found(
 async def test_delete_orbit_member(
     mock_get_orbit_member: AsyncMock,
     mock_delete_orbit_member: AsyncMock,
-    mock_get_orbit_member_role: AsyncMock,
-    mock_get_organization_member_role: AsyncMock,
+    mock_get_orbit_access: AsyncMock,
 ) -> None:
     user_id = random.randint(1, 10000)
     organization_id = random.randint(1, 10000)
@@ -618,8 +571,9 @@ async def test_delete_orbit_member(
 
     mock_get_orbit_member.return_value = member
     mock_delete_orbit_member.return_value = None
-    mock_get_organization_member_role.return_value = OrgRole.OWNER
-    mock_get_orbit_member_role.return_value = OrgRole.ADMIN
+    mock_get_orbit_access.return_value = orbit_access(
+        organization_id, member.orbit_id, user_id, orbit_role=OrbitRole.ADMIN
+    )
 
     deleted = await handler.delete_orbit_member(
         user_id, organization_id, member.orbit_id, member.id
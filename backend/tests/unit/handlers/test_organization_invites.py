@@ -1,6 +1,6 @@
 import random
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -47,7 +47,7 @@ handler = OrganizationHandler()
 )
 @patch(
     "dataforce_studio.handlers.organizations.EmailHandler.send_organization_invite_email",
-    new_callable=MagicMock,
+    new_callable=AsyncMock,
 )
 @patch(
     "dataforce_studio.handlers.organizations.UserRepository.get_organization_members_count",
@@ -61,7 +61,7 @@ handler = OrganizationHandler()
 async def test_send_invite(
     mock_create_organization_invite: AsyncMock,
     mock_get_organization_members_count: AsyncMock,
-    mock_send_organization_invite_email: MagicMock,
+    mock_send_organization_invite_email: AsyncMock,
     mock_get_organization_member_role: AsyncMock,
     mock_get_invite: AsyncMock,
     mock_get_public_user_by_id: AsyncMock,
@@ -89,7 +89,7 @@ async def test_send_invite(
 
     assert result == mocked_invite
 
-    mock_send_organization_invite_email.assert_called_once()
+    mock_send_organization_invite_email.assert_awaited_once()
     mock_create_organization_invite.assert_awaited_once()
 
 
@@ -0,0 +1,122 @@
+import random
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from dataforce_studio.handlers.permissions import PermissionsHandler
+from dataforce_studio.infra.cache import TTLCache
+from dataforce_studio.infra.exceptions import NotFoundError
+from dataforce_studio.schemas.orbit import OrbitRole
+from dataforce_studio.schemas.organization import OrgRole
+from dataforce_studio.schemas.permissions import Action, Resource
+from tests.conftest import orbit_access
+
+handler = PermissionsHandler()
+
+
+def _cache_stats(name: str) -> tuple[int, int]:
+    stats = next(s for s in handler.get_roles_cache_stats() if s.name == name)
+    return stats.hits, stats.misses
+
+
+@patch(
+    "dataforce_studio.handlers.permissions.UserRepository.get_organization_member_role",
+    new_callable=AsyncMock,
+)
+@pytest.mark.asyncio
+async def test_check_organization_permission_cached(
+    mock_get_organization_member_role: AsyncMock,
+) -> None:
+    user_id = random.randint(1, 10000)
+    organization_id = random.randint(1, 10000)
+    hits, misses = _cache_stats("organization_roles")
+
+    mock_get_organization_member_role.return_value = OrgRole.OWNER
+
+    for _ in range(3):
+        role = await handler.check_organization_permission(
+            organization_id, user_id, Resource.ORGANIZATION, Action.READ
+        )
+        assert role == OrgRole.OWNER
+
+    mock_get_organization_member_role.assert_awaited_once_with(organization_id, user_id)
+    assert _cache_stats("organization_roles") == (hits + 2, misses + 1)
+
+
+@patch(
+    "dataforce_studio.handlers.permissions.UserRepository.get_organization_member_role",
+    new_callable=AsyncMock,
+)
+@pytest.mark.asyncio
+async def test_check_organization_permission_invalidated(
+    mock_get_organization_member_role: AsyncMock,
+) -> None:
+    user_id = random.randint(1, 10000)
+    organization_id = random.randint(1, 10000)
+
+    mock_get_organization_member_role.return_value = OrgRole.OWNER
+    await handler.check_organization_permission(
+        organization_id, user_id, Resource.ORGANIZATION, Action.READ
+    )
+
+    await handler.invalidate_organization_member_role(organization_id, user_id)
+    mock_get_organization_member_role.return_value = None
+
+    with pytest.raises(NotFoundError, match="User is not member of the organization"):
+        await handler.check_organization_permission(
+            organization_id, user_id, Resource.ORGANIZATION, Action.READ
+        )
+
+    assert mock_get_organization_member_role.await_count == 2
+
+
+@patch(
+    "dataforce_studio.handlers.permissions.UserRepository.get_organization_member_role",
+    new_callable=AsyncMock,
+)
+@patch(
+    "dataforce_studio.handlers.permissions.OrbitRepository.get_orbit_access",
+    new_callable=AsyncMock,
+)
+@pytest.mark.asyncio
+async def test_orbit_access_primes_organization_role(
+    mock_get_orbit_access: AsyncMock,
+    mock_get_organization_member_role: AsyncMock,
+) -> None:
+    user_id = random.randint(1, 10000)
+    organization_id = random.randint(1, 10000)
+    orbit_id = random.randint(1, 10000)
+    hits, misses = _cache_stats("organization_roles")
+
+    mock_get_orbit_access.return_value = orbit_access(
+        organization_id, orbit_id, user_id, orbit_role=OrbitRole.MEMBER
+    )
+    await handler.check_orbit_action_access(
+        organization_id, orbit_id, user_id, Resource.ORBIT, Action.READ
+    )
+    role = await handler.check_organization_permission(
+        organization_id, user_id, Resource.ORGANIZATION, Action.READ
+    )
+
+    assert role == OrgRole.OWNER
+    mock_get_organization_member_role.assert_not_awaited()
+    assert _cache_stats("organization_roles") == (hits + 1, misses)
+
+
+def test_ttl_cache_expiry_and_bound() -> None:
+    cache: TTLCache[int, str] = TTLCache("test", maxsize=2, ttl=60)
+
+    cache.set(1, "a")
+    cache.set(2, "b")
+    assert cache.get(1) == "a"
+    cache.set(3, "c")
+
+    assert cache.get(2) is None
+    assert cache.get(1) == "a"
+    assert cache.get(3) == "c"
+
+    cache.ttl = 0
+    cache.set(4, "d")
+
+    assert cache.get(4) is None
+    assert cache.stats().size == 1
@@ -0,0 +1,235 @@
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from minio.datatypes import Object
+
+from dataforce_studio.handlers.storage_gc import StorageGCHandler
+from dataforce_studio.schemas.bucket_secrets import BucketSecret
+from dataforce_studio.schemas.ml_models import (
+    Manifest,
+    MLModel,
+    MLModelStatus,
+    MLModelWithSecret,
+)
+
+handler = StorageGCHandler()
+
+secret = BucketSecret(
+    id=7,
+    organization_id=1,
+    endpoint="s3.example.com",
+    bucket_name="models",
+    access_key="access",
+    secret_key="secret",
+    region="us-east-1",
+    created_at=datetime.now(),
+)
+old = datetime.now(UTC) - timedelta(days=7)
+live_key = f"orbit-1/collection-1/{'a' * 32}-live.dfs"
+orphan_key = f"orbit-1/collection-2/{'b' * 32}-orphan.dfs"
+recent_key = f"orbit-1/collection-2/{'c' * 32}-recent.dfs"
+objects = [
+    Object("models", live_key, last_modified=old),
+    Object("models", orphan_key, last_modified=old),
+    Object("models", recent_key, last_modified=datetime.now(UTC)),
+    Object("models", "orbit-backups/dump.sql", last_modified=old),
+]
+
+
+def _stale_model(model_id: int, status: MLModelStatus) -> MLModelWithSecret:
+    return MLModelWithSecret(
+        model=MLModel(
+            id=model_id,
+            collection_id=1,
+            file_name="model.dfs",
+            metrics={},
+            manifest=Manifest(
+                variant="pipeline",
+                producer_name="test",
+                producer_version="1",
+                producer_tags=[],
+                inputs=[],
+                outputs=[],
+                dynamic_attributes=[],
+                env_vars=[],
+            ),
+            file_hash="hash",
+            file_index={},
+            bucket_location=f"orbit-1/collection-1/{model_id:032x}-model.dfs",
+            size=1,
+            unique_identifier="uid",
+            status=status,
+            created_at=old,
+        ),
+        bucket_secret_id=secret.id,
+    )
+
+
+def _stale_models(
+    status: MLModelStatus, updated_before: datetime, after_id: int, limit: int
+) -> list[MLModelWithSecret]:
+    if after_id:
+        return []
+    if status == MLModelStatus.PENDING_DELETION:
+        return [_stale_model(1, status)]
+    return [_stale_model(2, status)]
+
+
+@patch(
+    "dataforce_studio.handlers.storage_gc.MLModelRepository.update_status",
+    new_callable=AsyncMock,
+)
+@patch(
+    "dataforce_studio.handlers.storage_gc.MLModelRepository.delete_ml_model",
+    new_callable=AsyncMock,
+)
+@patch(
+    "dataforce_studio.handlers.storage_gc.MLModelRepository.get_object_references_count",
+    new_callable=AsyncMock,
+    return_value=0,
+)
+@patch(
+    "dataforce_studio.handlers.storage_gc.MLModelRepository.get_existing_locations",
+    new_callable=AsyncMock,
+    return_value={live_key},
+)
+@patch(
+    "dataforce_studio.handlers.storage_gc.MLModelRepository.get_stale_models",
+    new_callable=AsyncMock,
+    side_effect=_stale_models,
+)
+@patch(
+    "dataforce_studio.handlers.storage_gc.BucketSecretRepository.get_bucket_secrets",
+    new_callable=AsyncMock,
+    return_value=[secret],
+)
+@patch(
+    "dataforce_studio.handlers.storage_gc.StorageGCHandler._get_storage_client",
+    new_callable=AsyncMock,
+)
+@patch(
+    "dataforce_studio.handlers.storage_gc.list_objects_page",
+    new_callable=AsyncMock,
+    return_value=objects,
+)
+@patch(
+    "dataforce_studio.handlers.storage_gc.remove_objects",
+    new_callable=AsyncMock,
+    return_value=[],
+)
+@pytest.mark.asyncio
+async def test_collect_garbage_dry_run(
+    mock_remove_objects: AsyncMock,
+    mock_list_objects_page: AsyncMock,
+    mock_get_storage_client: AsyncMock,
+    mock_get_bucket_secrets: AsyncMock,
+    mock_get_stale_models: AsyncMock,
+    mock_get_existing_locations: AsyncMock,
+    mock_references_count: AsyncMock,
+    mock_delete_ml_model: AsyncMock,
+    mock_update_status: AsyncMock,
+) -> None:
+    mock_get_storage_client.return_value = Mock(secret=secret)
+
+    report = await handler.collect_garbage(dry_run=True)
+
+    assert report.dry_run
+    assert len(report.secrets) == 1
+    secret_report = report.secrets[0]
+    assert secret_report.bucket_secret_id == secret.id
+    assert secret_report.scanned_objects == 4
+    assert secret_report.orphaned_objects == 1
+    assert secret_report.orphans_sample == [orphan_key]
+    assert secret_report.deleted_objects == 0
+    assert secret_report.expired_pending_deletions == 1
+    assert secret_report.expired_pending_uploads == 1
+    mock_get_existing_locations.assert_awaited_once_with([live_key, orphan_key])
+    mock_remove_objects.assert_not_awaited()
+    mock_delete_ml_model.assert_not_awaited()
+    mock_update_status.assert_not_awaited()
+
+
+@patch(
+    "dataforce_studio.handlers.storage_gc.MLModelRepository.update_status",
+    new_callable=AsyncMock,
+)
+@patch(
+    "dataforce_studio.handlers.storage_gc.MLModelRepository.delete_ml_model",
+    new_callable=AsyncMock,
+)
+@patch(
+    "dataforce_studio.handlers.storage_gc.MLModelRepository.get_object_references_count",
+    new_callable=AsyncMock,
+    return_value=0,
+)
+@patch(
+    "dataforce_studio.handlers.storage_gc.MLModelRepository.get_existing_locations",
+    new_callable=AsyncMock,
+    return_value={live_key},
+)
+@patch(
+    "dataforce_studio.handlers.storage_gc.MLModelRepository.get_stale_models",
+    new_callable=AsyncMock,
+    side_effect=_stale_models,
+)
+@patch(
+    "dataforce_studio.handlers.storage_gc.BucketSecretRepository.get_bucket_secrets",
+    new_callable=AsyncMock,
+    return_value=[secret],
+)
+@patch(
+    "dataforce_studio.handlers.storage_gc.StorageGCHandler._get_storage_client",
+    new_callable=AsyncMock,
+)
+@patch(
+    "dataforce_studio.handlers.storage_gc.list_objects_page",
+    new_callable=AsyncMock,
+)
+@patch(
+    "dataforce_studio.handlers.storage_gc.remove_objects",
+    new_callable=AsyncMock,
+    return_value=[],
+)
+@patch("dataforce_studio.handlers.storage_gc.config.STORAGE_GC_BATCH_SIZE", 4)
+@pytest.mark.asyncio
+async def test_collect_garbage(
+    mock_remove_objects: AsyncMock,
+    mock_list_objects_page: AsyncMock,
+    mock_get_storage_client: AsyncMock,
+    mock_get_bucket_secrets: AsyncMock,
+    mock_get_stale_models: AsyncMock,
+    mock_get_existing_locations: AsyncMock,
+    mock_references_count: AsyncMock,
+    mock_delete_ml_model: AsyncMock,
+    mock_update_status: AsyncMock,
+) -> None:
+    storage = Mock(secret=secret)
+    mock_get_storage_client.return_value = storage
+    mock_list_objects_page.side_effect = [objects, []]
+
+    report = await handler.collect_garbage(dry_run=False)
+
+    secret_report = report.secrets[0]
+    assert secret_report.orphaned_objects == 1
+    assert secret_report.deleted_objects == 3
+    assert secret_report.errors == []
+    assert [c.args[2] for c in mock_list_objects_page.await_args_list] == [
+        None,
+        objects[-1].object_name,
+    ]
+    assert [c.args for c in mock_remove_objects.await_args_list] == [
+        (
+            storage,
+            [_stale_model(1, MLModelStatus.PENDING_DELETION).model.bucket_location],
+        ),
+        (
+            storage,
+            [_stale_model(2, MLModelStatus.PENDING_UPLOAD).model.bucket_location],
+        ),
+        (storage, [orphan_key]),
+    ]
+    mock_delete_ml_model.assert_awaited_once_with(1)
+    mock_update_status.assert_awaited_once_with(
+        2, MLModelStatus.UPLOAD_FAILED, current_status=MLModelStatus.PENDING_UPLOAD
+    )
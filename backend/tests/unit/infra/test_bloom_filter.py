@@ -0,0 +1,33 @@
+import time
+from unittest.mock import patch
+
+from dataforce_studio.infra.bloom_filter import BloomFilter, ExpiringBloomFilter
+
+
+def test_bloom_filter() -> None:
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    items = [f"token-{i}".encode() for i in range(1000)]
+    for item in items:
+        bloom.add(item)
+
+    false_positives = sum(f"other-{i}".encode() in bloom for i in range(10000))
+
+    assert all(item in bloom for item in items)
+    assert false_positives < 300
+
+
+def test_expiring_bloom_filter_evicts_expired_buckets() -> None:
+    bloom = ExpiringBloomFilter(capacity=100, error_rate=0.01, bucket_seconds=60)
+    now = int(time.time())
+
+    bloom.add(b"expired", now - 1)
+    bloom.add(b"short", now + 60)
+    bloom.add(b"long", now + 3600)
+
+    assert not bloom.might_contain(b"expired")
+    assert bloom.might_contain(b"short")
+    assert bloom.might_contain(b"long")
+
+    with patch("dataforce_studio.infra.bloom_filter.time.time", return_value=now + 200):
+        assert not bloom.might_contain(b"short")
+        assert bloom.might_contain(b"long")
@@ -0,0 +1,238 @@
+import asyncio
+import fnmatch
+from collections.abc import AsyncIterator
+
+import pytest
+import pytest_asyncio
+
+from dataforce_studio.infra.cache import (
+    INVALIDATION_CHANNEL,
+    CacheInvalidation,
+    InMemoryCache,
+    RedisCache,
+    TTLCache,
+    get_cache,
+    invalidate,
+    listen_for_invalidations,
+    register_local_cache,
+    set_cache,
+)
+
+
+class FakeRedisServer:
+    def __init__(self) -> None:
+        self.data: dict[bytes, bytes] = {}
+        self.subscribers: dict[bytes, list[asyncio.StreamWriter]] = {}
+        self.commands: list[list[bytes]] = []
+
+    @staticmethod
+    def _bulk(value: bytes | None) -> bytes:
+        if value is None:
+            return b"$-1\r\n"
+        return b"$%d\r\n%s\r\n" % (len(value), value)
+
+    def _array(self, values: list[bytes]) -> bytes:
+        return b"*%d\r\n" % len(values) + b"".join(self._bulk(v) for v in values)
+
+    async def _read_command(self, reader: asyncio.StreamReader) -> list[bytes]:
+        header = await reader.readline()
+        args = []
+        for _ in range(int(header[1:-2])):
+            length = int((await reader.readline())[1:-2])
+            args.append((await reader.readexactly(length + 2))[:-2])
+        return args
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        while not reader.at_eof():
+            try:
+                args = await self._read_command(reader)
+            except (asyncio.IncompleteReadError, ValueError):
+                break
+            self.commands.append(args)
+            name = args[0].upper()
+            if name == b"GET":
+                writer.write(self._bulk(self.data.get(args[1])))
+            elif name == b"SET":
+                self.data[args[1]] = args[2]
+                writer.write(b"+OK\r\n")
+            elif name == b"DEL":
+                removed = [key for key in args[1:] if self.data.pop(key, None)]
+                writer.write(b":%d\r\n" % len(removed))
+            elif name == b"SCAN":
+                pattern = args[3].decode().replace("\\", "")
+                keys = [k for k in self.data if fnmatch.fnmatch(k.decode(), pattern)]
+                writer.write(b"*2\r\n" + self._bulk(b"0") + self._array(keys))
+            elif name == b"PUBLISH":
+                receivers = self.subscribers.get(args[1], [])
+                for subscriber in receivers:
+                    subscriber.write(self._array([b"message", args[1], args[2]]))
+                writer.write(b":%d\r\n" % len(receivers))
+            elif name == b"SUBSCRIBE":
+                self.subscribers.setdefault(args[1], []).append(writer)
+                writer.write(b"*3\r\n" + self._bulk(b"subscribe"))
+                writer.write(self._bulk(args[1]) + b":1\r\n")
+            await writer.drain()
+
+
+@pytest_asyncio.fixture
+async def redis_cache() -> AsyncIterator[tuple[RedisCache, FakeRedisServer]]:
+    fake = FakeRedisServer()
+    server = await asyncio.start_server(fake.handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    cache = RedisCache(f"redis://127.0.0.1:{port}/0")
+
+    yield cache, fake
+
+    await cache.close()
+    server.close()
+
+
+@pytest.mark.asyncio
+async def test_in_memory_cache() -> None:
+    cache = InMemoryCache(maxsize=10)
+
+    await cache.set("orbit:1:a", "a")
+    await cache.set("orbit:1:b", "b")
+    await cache.set("orbit:2:a", "c")
+    await cache.set("expired", "d", ttl=0)
+
+    assert await cache.get("orbit:1:a") == "a"
+    assert await cache.get("expired") is None
+
+    await cache.invalidate_prefix("orbit:1:")
+    await cache.delete("orbit:2:a")
+
+    assert await cache.get("orbit:1:a") is None
+    assert await cache.get("orbit:1:b") is None
+    assert await cache.get("orbit:2:a") is None
+
+
+@pytest.mark.asyncio
+async def test_redis_cache(redis_cache: tuple[RedisCache, FakeRedisServer]) -> None:
+    cache, fake = redis_cache
+
+    await cache.set("orbit:1:a", "a", ttl=5)
+    await cache.set("orbit:1:b", "b")
+    await cache.set("orbit:2:a", "c")
+
+    assert await cache.get("orbit:1:a") == "a"
+    assert await cache.get("missing") is None
+    assert fake.commands[0] == [b"SET", b"orbit:1:a", b"a", b"PX", b"5000"]
+
+    await cache.invalidate_prefix("orbit:1:")
+
+    assert await cache.get("orbit:1:b") is None
+    assert await cache.get("orbit:2:a") == "c"
+
+
+@pytest.mark.asyncio
+async def test_redis_cache_pubsub(
+    redis_cache: tuple[RedisCache, FakeRedisServer],
+) -> None:
+    cache, fake = redis_cache
+    states: list[bool] = []
+
+    async def on_subscription(subscribed: bool) -> None:
+        states.append(subscribed)
+
+    subscription = cache.subscribe("channel", on_subscription)
+    received = asyncio.create_task(anext(subscription))
+
+    while not fake.subscribers:
+        await asyncio.sleep(0.01)
+    await cache.publish("channel", "hello")
+
+    assert await asyncio.wait_for(received, 1) == "hello"
+    assert states == [True]
+    await subscription.aclose()
+
+
+@pytest.mark.asyncio
+async def test_redis_cache_subscription_survives_callback_error(
+    redis_cache: tuple[RedisCache, FakeRedisServer],
+) -> None:
+    cache, fake = redis_cache
+    states: list[bool] = []
+
+    async def on_subscription(subscribed: bool) -> None:
+        states.append(subscribed)
+        if states == [True]:
+            raise RuntimeError("failed to load")
+
+    subscription = cache.subscribe("channel", on_subscription)
+    received = asyncio.create_task(anext(subscription))
+
+    while len(states) < 3:
+        await asyncio.sleep(0.01)
+    await cache.publish("channel", "hello")
+
+    assert await asyncio.wait_for(received, 1) == "hello"
+    assert states == [True, False, True]
+    await subscription.aclose()
+
+
+@pytest.mark.asyncio
+async def test_invalidation_listener_survives_bad_message() -> None:
+    local_cache: TTLCache[str, str] = TTLCache("test_bad_message", maxsize=10, ttl=60)
+    register_local_cache(local_cache)
+
+    previous_cache = get_cache()
+    shared_cache = InMemoryCache()
+    set_cache(shared_cache)
+    listener = asyncio.create_task(listen_for_invalidations())
+    await asyncio.sleep(0)
+
+    try:
+        local_cache.set("1", "owner")
+        await shared_cache.publish(INVALIDATION_CHANNEL, "not json")
+        await asyncio.sleep(0)
+
+        assert not listener.done()
+        assert local_cache.get("1") is None
+
+        local_cache.set("2", "owner")
+        await shared_cache.publish(
+            INVALIDATION_CHANNEL,
+            CacheInvalidation(cache="test_bad_message", key="2").model_dump_json(),
+        )
+        await asyncio.sleep(0)
+
+        assert local_cache.get("2") is None
+    finally:
+        listener.cancel()
+        set_cache(previous_cache)
+
+
+@pytest.mark.asyncio
+async def test_invalidation_from_other_worker() -> None:
+    local_cache: TTLCache[str, str] = TTLCache("test_roles", maxsize=10, ttl=60)
+    register_local_cache(local_cache)
+    local_cache.set("1:1", "owner")
+    local_cache.set("1:2", "member")
+    local_cache.set("2:1", "owner")
+
+    previous_cache = get_cache()
+    shared_cache = InMemoryCache()
+    set_cache(shared_cache)
+    listener = asyncio.create_task(listen_for_invalidations())
+    await asyncio.sleep(0)
+
+    try:
+        await shared_cache.publish(
+            INVALIDATION_CHANNEL,
+            CacheInvalidation(cache="test_roles", prefix="1:").model_dump_json(),
+        )
+        await asyncio.sleep(0)
+
+        assert local_cache.get("1:1") is None
+        assert local_cache.get("1:2") is None
+        assert local_cache.get("2:1") == "owner"
+
+        await invalidate("test_roles", key="2:1")
+
+        assert local_cache.get("2:1") is None
+    finally:
+        listener.cancel()
+        set_cache(previous_cache)
@@ -0,0 +1,26 @@
+from dataforce_studio.infra.db import InstrumentedPool, engine_options
+from dataforce_studio.settings import config
+
+
+def test_engine_options() -> None:
+    options = engine_options(
+        config.model_copy(update={"DB_POOL_SIZE": 20, "DB_STATEMENT_CACHE_SIZE": 500})
+    )
+
+    assert options["poolclass"] is InstrumentedPool
+    assert options["pool_size"] == 20
+    assert options["pool_pre_ping"] is True
+    assert options["connect_args"] == {"prepared_statement_cache_size": 500}
+
+
+def test_engine_options_pgbouncer_mode() -> None:
+    connect_args = engine_options(
+        config.model_copy(update={"DB_PGBOUNCER_MODE": True})
+    )["connect_args"]
+    name_func = connect_args.pop("prepared_statement_name_func")
+
+    assert connect_args == {
+        "statement_cache_size": 0,
+        "prepared_statement_cache_size": 0,
+    }
+    assert name_func() != name_func()
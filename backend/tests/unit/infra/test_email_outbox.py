@@ -0,0 +1,143 @@
+import pytest
+
+from dataforce_studio.infra.email_outbox import (
+    EmailOutbox,
+    EmailRejectedError,
+    FakeEmailTransport,
+    SendGridTransport,
+    is_transient_error,
+)
+from dataforce_studio.schemas.emails import EmailMessage
+
+
+def _message(email: str, template_id: str = "template") -> EmailMessage:
+    return EmailMessage(
+        email=email,
+        from_email="noreply@example.com",
+        template_id=template_id,
+        data={"name": email},
+        description="test",
+    )
+
+
+@pytest.mark.asyncio
+async def test_email_outbox_batches_by_template() -> None:
+    transport = FakeEmailTransport()
+    delivered: list[tuple[list[EmailMessage], Exception | None]] = []
+
+    async def on_delivery(
+        messages: list[EmailMessage], error: Exception | None
+    ) -> None:
+        delivered.append((messages, error))
+
+    outbox = EmailOutbox(
+        transport, workers=1, batch_size=10, rate_limit=0, on_delivery=on_delivery
+    )
+    for i in range(3):
+        outbox.enqueue(_message(f"user{i}@example.com"))
+    outbox.enqueue(_message("other@example.com", template_id="other"))
+
+    await outbox.flush()
+
+    assert [len(batch) for batch in transport.sent] == [3, 1]
+    assert outbox.sent == 4
+    assert all(error is None for _, error in delivered)
+    await outbox.close()
+
+
+@pytest.mark.asyncio
+async def test_email_outbox_retries_and_reports_failure() -> None:
+    transport = FakeEmailTransport(failures=3)
+    delivered: list[Exception | None] = []
+
+    async def on_delivery(
+        messages: list[EmailMessage], error: Exception | None
+    ) -> None:
+        delivered.append(error)
+
+    outbox = EmailOutbox(
+        transport,
+        workers=1,
+        rate_limit=0,
+        max_attempts=2,
+        retry_delay=0,
+        on_delivery=on_delivery,
+    )
+    outbox.enqueue(_message("failed@example.com"))
+    await outbox.flush()
+    outbox.enqueue(_message("retried@example.com"))
+    await outbox.flush()
+
+    assert outbox.failed == 1
+    assert outbox.sent == 1
+    assert isinstance(delivered[0], ConnectionError)
+    assert delivered[1] is None
+    assert transport.sent[0][0].email == "retried@example.com"
+    await outbox.close()
+
+
+@pytest.mark.asyncio
+async def test_email_outbox_isolates_rejected_recipients() -> None:
+    transport = FakeEmailTransport(rejected={"bad@example.com"})
+    delivered: list[tuple[list[str], Exception | None]] = []
+
+    async def on_delivery(
+        messages: list[EmailMessage], error: Exception | None
+    ) -> None:
+        delivered.append(([str(m.email) for m in messages], error))
+
+    outbox = EmailOutbox(
+        transport,
+        workers=1,
+        batch_size=10,
+        rate_limit=0,
+        max_attempts=5,
+        retry_delay=0,
+        on_delivery=on_delivery,
+    )
+    for email in ("first@example.com", "bad@example.com", "last@example.com"):
+        outbox.enqueue(_message(email))
+    await outbox.flush()
+
+    assert transport.attempts == 4
+    assert [[str(m.email) for m in batch] for batch in transport.sent] == [
+        ["first@example.com"],
+        ["last@example.com"],
+    ]
+    assert outbox.sent == 2
+    assert outbox.failed == 1
+    assert [emails for emails, error in delivered if error] == [["bad@example.com"]]
+    assert isinstance(delivered[1][1], EmailRejectedError)
+    await outbox.close()
+
+
+def test_is_transient_error() -> None:
+    assert is_transient_error(ConnectionError())
+    assert is_transient_error(TimeoutError())
+    assert is_transient_error(EmailRejectedError("throttled", 429))
+    assert is_transient_error(EmailRejectedError("unavailable", 503))
+    assert not is_transient_error(EmailRejectedError("bad address", 400))
+    assert not is_transient_error(ValueError("bad template"))
+
+
+@pytest.mark.asyncio
+async def test_email_outbox_drops_when_full() -> None:
+    outbox = EmailOutbox(FakeEmailTransport(), workers=1, queue_size=1)
+
+    outbox.enqueue(_message("first@example.com"))
+    outbox.enqueue(_message("second@example.com"))
+
+    assert outbox.dropped == 1
+    await outbox.close()
+
+
+def test_sendgrid_transport_build_mail() -> None:
+    mail = SendGridTransport.build_mail(
+        [_message("a@example.com"), _message("b@example.com")]
+    ).get()
+
+    assert mail["template_id"] == "template"
+    assert sorted(p["to"][0]["email"] for p in mail["personalizations"]) == [
+        "a@example.com",
+        "b@example.com",
+    ]
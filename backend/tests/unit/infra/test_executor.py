@@ -0,0 +1,47 @@
+import asyncio
+import threading
+
+import pytest
+
+from dataforce_studio.infra.exceptions import ServiceBusyError
+from dataforce_studio.infra.executor import BoundedExecutor
+
+
+@pytest.mark.asyncio
+async def test_bounded_executor_run() -> None:
+    executor = BoundedExecutor("test_run", max_workers=2, max_queue=2)
+
+    results = await asyncio.gather(*(executor.run(pow, i, 2) for i in range(4)))
+    stats = executor.stats()
+
+    assert results == [0, 1, 4, 9]
+    assert stats.completed == 4
+    assert stats.pending == 0
+    assert stats.rejected == 0
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_bounded_executor_rejects_when_queue_is_full() -> None:
+    executor = BoundedExecutor("test_busy", max_workers=1, max_queue=1)
+    release = threading.Event()
+
+    running = [
+        asyncio.create_task(executor.run(release.wait, 5)),
+        asyncio.create_task(executor.run(release.wait, 5)),
+    ]
+    await asyncio.sleep(0)
+
+    with pytest.raises(ServiceBusyError) as error:
+        await executor.run(release.wait, 5)
+
+    release.set()
+    await asyncio.gather(*running)
+    stats = executor.stats()
+
+    assert error.value.status_code == 503
+    assert stats.rejected == 1
+    assert stats.completed == 2
+    assert stats.queue_wait_seconds >= 0
+    assert stats.run_seconds > 0
+    executor.shutdown()
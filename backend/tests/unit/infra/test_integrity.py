@@ -0,0 +1,71 @@
+import asyncio
+import hashlib
+from collections.abc import AsyncIterator
+
+import pytest
+
+from dataforce_studio.infra.exceptions import NotFoundError
+from dataforce_studio.infra.integrity import (
+    IntegrityVerifier,
+    ObjectDigest,
+    digest_chunks,
+    verify_object,
+)
+from dataforce_studio.infra.storage import open_object, open_object_range
+from utils.s3_stub import S3StubHandler, run_s3_stub
+
+data = bytes(range(256)) * 10_000
+sha256 = hashlib.sha256(data).hexdigest()
+
+
+@pytest.mark.asyncio
+async def test_digest_chunks() -> None:
+    async def chunks() -> AsyncIterator[bytes]:
+        for start in range(0, len(data), 4096):
+            yield data[start : start + 4096]
+
+    assert await digest_chunks(chunks()) == ObjectDigest(len(data), sha256)
+
+
+@pytest.mark.asyncio
+async def test_verify_object_against_storage() -> None:
+    S3StubHandler.objects = {"/models/model.dfs": data}
+    with run_s3_stub() as endpoint:
+        url = f"http://{endpoint}/models/model.dfs"
+
+        assert await verify_object(await open_object(url), len(data), sha256.upper())
+        assert not await verify_object(await open_object(url), len(data), "0" * 64)
+        assert not await verify_object(await open_object(url), len(data) + 1, sha256)
+
+        stream = await open_object_range(url, 256, 512)
+        assert b"".join([chunk async for chunk in stream.chunks]) == data[256:768]
+        await stream.close()
+
+        with pytest.raises(NotFoundError, match="Object not found"):
+            await open_object(f"http://{endpoint}/models/missing.dfs")
+    S3StubHandler.objects = {}
+
+
+@pytest.mark.asyncio
+async def test_integrity_verifier_concurrency() -> None:
+    verifier = IntegrityVerifier(concurrency=2)
+    running = 0
+    max_running = 0
+
+    async def job() -> None:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    scheduled = [verifier.schedule(key, job) for key in [1, 2, 3, 4, 1]]
+
+    assert scheduled == [True, True, True, True, False]
+    assert verifier.pending == 4
+
+    await verifier.wait()
+
+    assert max_running == 2
+    assert verifier.pending == 0
+    await verifier.close()
@@ -0,0 +1,37 @@
+from datetime import UTC, datetime
+
+import pytest
+
+from dataforce_studio.infra.exceptions import InvalidCursorError
+from dataforce_studio.infra.pagination import (
+    decode_cursor,
+    decode_metric_cursor,
+    encode_cursor,
+)
+
+
+def test_cursor_roundtrip() -> None:
+    created_at = datetime(2025, 7, 18, 12, 30, 15, 123456, tzinfo=UTC)
+
+    cursor = encode_cursor(created_at, 42)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (created_at, 42)
+
+
+@pytest.mark.parametrize("cursor", ["", "not a cursor", "bm90fGE", "MjAyNXwx"])
+def test_invalid_cursor(cursor: str) -> None:
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor)
+
+
+def test_metric_cursor_roundtrip() -> None:
+    cursor = encode_cursor(0.1 + 0.2, 7)
+
+    assert decode_metric_cursor(cursor) == (0.1 + 0.2, 7)
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor)
+    with pytest.raises(InvalidCursorError):
+        decode_metric_cursor(encode_cursor(datetime.now(UTC), 7))
+    with pytest.raises(InvalidCursorError):
+        decode_metric_cursor(encode_cursor(float("nan"), 7))
@@ -0,0 +1,105 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from minio import Minio
+
+from dataforce_studio.infra.presigner import S3Presigner
+from utils import benchmark_presign
+from utils.benchmark_presign import build_presigner
+
+request_date = datetime(2025, 3, 1, 12, 30, tzinfo=UTC)
+
+
+@pytest.mark.parametrize(
+    ("endpoint", "secure", "region", "session_token", "bucket_name", "object_name"),
+    [
+        ("localhost:9000", False, "us-east-1", None, "models", "orbit-1/a b+c~.dfs"),
+        ("s3.amazonaws.com", True, "eu-west-1", "token/=+", "models", "a/b.dfs"),
+        ("s3.eu-central-1.amazonaws.com", True, None, None, "my.models", "model"),
+        ("minio.example.com", True, "us-east-1", "token", "models", "ü/ø.dfs"),
+    ],
+)
+@pytest.mark.parametrize("method", ["GET", "PUT", "DELETE"])
+def test_presign_matches_minio(
+    endpoint: str,
+    secure: bool,
+    region: str | None,
+    session_token: str | None,
+    bucket_name: str,
+    object_name: str,
+    method: str,
+) -> None:
+    credentials = {
+        "access_key": "access",
+        "secret_key": "secret",
+        "session_token": session_token,
+        "secure": secure,
+        "region": region,
+    }
+    client = Minio(endpoint, **credentials)  # type: ignore[arg-type]
+    presigner = S3Presigner(endpoint, **credentials)  # type: ignore[arg-type]
+
+    expected = client.get_presigned_url(
+        method, bucket_name, object_name, timedelta(hours=1), request_date=request_date
+    )
+    actual = presigner.presign(
+        method, bucket_name, object_name, timedelta(hours=1), request_date
+    )
+
+    assert actual == expected
+
+
+def test_presign_requires_region() -> None:
+    with pytest.raises(ValueError, match="Bucket region is required"):
+        S3Presigner("localhost:9000", access_key="access", secret_key="secret")
+
+
+def test_presign_anonymous_and_invalid_expiry() -> None:
+    presigner = S3Presigner("localhost:9000", secure=False, region="us-east-1")
+
+    assert presigner.presign("GET", "models", "model.dfs") == (
+        "http://localhost:9000/models/model.dfs"
+    )
+    with pytest.raises(ValueError, match="expires must be between"):
+        presigner.presign("GET", "models", "model.dfs", timedelta(days=8))
+
+
+def test_presign_signs_extra_headers() -> None:
+    presigner = S3Presigner(
+        "localhost:9000",
+        access_key="access",
+        secret_key="secret",
+        secure=False,
+        region="us-east-1",
+    )
+
+    first = presigner.presign(
+        "GET",
+        "models",
+        "model.dfs",
+        request_date=request_date,
+        headers={"Range": "bytes=0-99"},
+    )
+    second = presigner.presign(
+        "GET",
+        "models",
+        "model.dfs",
+        request_date=request_date,
+        headers={"Range": "bytes=100-199"},
+    )
+    unsigned = presigner.presign(
+        "GET", "models", "model.dfs", request_date=request_date
+    )
+
+    assert "X-Amz-SignedHeaders=host%3Brange" in first
+    assert "X-Amz-SignedHeaders=host&" in unsigned
+    assert len({first, second, unsigned}) == 3
+
+
+def test_benchmark_presigner_smoke(capsys: pytest.CaptureFixture[str]) -> None:
+    presigner = build_presigner("localhost:9000", "us-east-1", access_key="access")
+
+    benchmark_presign.main(["--iterations", "5"])
+
+    assert presigner.region == "us-east-1"
+    assert "mismatched urls: 0" in capsys.readouterr().out
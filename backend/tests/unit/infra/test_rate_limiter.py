@@ -0,0 +1,16 @@
+from time import monotonic
+
+import pytest
+
+from dataforce_studio.infra.rate_limiter import RateLimiter
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter() -> None:
+    limiter = RateLimiter(rate=100, burst=2)
+
+    started_at = monotonic()
+    for _ in range(6):
+        await limiter.acquire()
+
+    assert monotonic() - started_at >= 0.035
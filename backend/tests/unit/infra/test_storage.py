@@ -0,0 +1,110 @@
+import inspect
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from minio import Minio
+from minio.datatypes import ListPartsResult
+
+from dataforce_studio.infra.exceptions import ServiceError
+from dataforce_studio.infra.storage import (
+    MAX_PARTS,
+    choose_part_size,
+    get_storage_client,
+    set_storage_client,
+)
+from dataforce_studio.schemas.bucket_secrets import BucketSecret
+from utils.s3_stub import S3StubHandler, run_s3_stub
+
+MiB = 1024**2
+
+
+@pytest.mark.parametrize(
+    ("size", "part_size", "parts_count"),
+    [
+        (0, 64 * MiB, 1),
+        (1, 64 * MiB, 1),
+        (64 * MiB, 64 * MiB, 1),
+        (64 * MiB + 1, 64 * MiB, 2),
+        (10 * 1024 * MiB, 64 * MiB, 160),
+        (1024**4, 105 * MiB, 9987),
+    ],
+)
+def test_choose_part_size(size: int, part_size: int, parts_count: int) -> None:
+    assert choose_part_size(size) == (part_size, parts_count)
+    assert parts_count <= MAX_PARTS
+
+
+@pytest.mark.parametrize(
+    ("method", "parameters"),
+    [
+        ("_get_region", ["self", "bucket_name"]),
+        ("_create_multipart_upload", ["self", "bucket_name", "object_name", "headers"]),
+        (
+            "_list_parts",
+            [
+                "self",
+                "bucket_name",
+                "object_name",
+                "upload_id",
+                "max_parts",
+                "part_number_marker",
+                "extra_headers",
+                "extra_query_params",
+            ],
+        ),
+        (
+            "_complete_multipart_upload",
+            ["self", "bucket_name", "object_name", "upload_id", "parts"],
+        ),
+        (
+            "_abort_multipart_upload",
+            ["self", "bucket_name", "object_name", "upload_id"],
+        ),
+    ],
+)
+def test_minio_private_api_signatures(method: str, parameters: list[str]) -> None:
+    assert list(inspect.signature(getattr(Minio, method)).parameters) == parameters
+
+
+def test_minio_list_parts_result_fields() -> None:
+    for field in ("parts", "is_truncated", "next_part_number_marker"):
+        assert isinstance(getattr(ListPartsResult, field), property)
+
+
+def test_choose_part_size_too_large() -> None:
+    with pytest.raises(ServiceError, match="Model file is too large"):
+        choose_part_size(MAX_PARTS * 5 * 1024**3 + 1)
+
+
+@pytest.mark.asyncio
+async def test_set_storage_client_looks_up_region() -> None:
+    with run_s3_stub() as endpoint:
+        secret = BucketSecret(
+            id=9000,
+            organization_id=1,
+            endpoint=endpoint,
+            bucket_name="models",
+            access_key="access",
+            secret_key="secret",
+            secure=False,
+            created_at=datetime.now(),
+        )
+        S3StubHandler.requests = 0
+        S3StubHandler.location = b"eu-central-1"
+        try:
+            with patch(
+                "dataforce_studio.infra.storage.release_unit_of_work",
+                new_callable=AsyncMock,
+            ) as mock_release:
+                storage = await set_storage_client(secret)
+        finally:
+            S3StubHandler.location = b""
+
+        url = storage.presigner.presign("GET", "models", "model.dfs")
+
+        assert storage.presigner.region == "eu-central-1"
+        assert "%2Feu-central-1%2Fs3%2F" in url
+        assert get_storage_client(secret.id) is storage
+        assert S3StubHandler.requests == 1
+        mock_release.assert_not_awaited()
@@ -0,0 +1,27 @@
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from dataforce_studio.service import AppService
+
+
+def _paths(app: AppService) -> set[str]:
+    return {getattr(route, "path", "") for route in app.routes}
+
+
+@pytest.mark.asyncio
+async def test_stats_endpoints_are_internal() -> None:
+    assert "/stats/cache" not in _paths(AppService())
+
+    with patch("dataforce_studio.service.config.STATS_ENDPOINTS_ENABLED", True):
+        app = AppService()
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        responses = [
+            await client.get(path)
+            for path in ("/stats/cache", "/stats/executors", "/stats/db-pool")
+        ]
+
+    assert [response.status_code for response in responses] == [401, 401, 401]
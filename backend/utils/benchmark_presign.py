@@ -0,0 +1,74 @@
+import argparse
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from time import perf_counter
+
+from minio import Minio
+
+from dataforce_studio.infra.presigner import S3Presigner
+from utils.s3_stub import S3StubHandler, run_s3_stub
+
+BUCKET = "models"
+EXPIRES = timedelta(hours=1)
+
+
+def _object_name(i: int) -> str:
+    return f"orbit-1/collection-1/{i:032x}-model.dfs"
+
+
+def _measure(name: str, iterations: int, presign: Callable[[int], str]) -> None:
+    S3StubHandler.requests = 0
+    started_at = perf_counter()
+    for i in range(iterations):
+        presign(i)
+    elapsed = perf_counter() - started_at
+    print(  # noqa: T201
+        f"{name:<32} {elapsed * 1e6 / iterations:10.1f} us/url "
+        f"{S3StubHandler.requests:6d} requests"
+    )
+
+
+def build_presigner(endpoint: str, region: str, **credentials: str) -> S3Presigner:
+    return S3Presigner(endpoint, secure=False, region=region, **credentials)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark presigned URL paths")
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--region", default="us-east-1")
+    args = parser.parse_args(argv)
+    request_date = datetime.now(UTC)
+
+    with run_s3_stub() as endpoint:
+        credentials = {"access_key": "access", "secret_key": "secret"}
+
+        def minio_per_call(i: int) -> str:
+            client = Minio(endpoint, secure=False, region=args.region, **credentials)
+            return client.presigned_get_object(BUCKET, _object_name(i), EXPIRES)
+
+        pooled_client = Minio(endpoint, secure=False, region=args.region, **credentials)
+
+        def minio_pooled(i: int) -> str:
+            return pooled_client.get_presigned_url(
+                "GET", BUCKET, _object_name(i), EXPIRES, request_date=request_date
+            )
+
+        presigner = build_presigner(endpoint, args.region, **credentials)
+
+        def local_presigner(i: int) -> str:
+            return presigner.presign(
+                "GET", BUCKET, _object_name(i), EXPIRES, request_date=request_date
+            )
+
+        _measure("minio client per call", args.iterations, minio_per_call)
+        _measure("pooled minio client", args.iterations, minio_pooled)
+        _measure("S3Presigner", args.iterations, local_presigner)
+
+        mismatches = sum(
+            minio_pooled(i) != local_presigner(i) for i in range(args.iterations)
+        )
+        print(f"mismatched urls: {mismatches}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
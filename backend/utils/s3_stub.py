@@ -0,0 +1,60 @@
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+LOCATION_RESPONSE = (
+    b'<?xml version="1.0" encoding="UTF-8"?>'
+    b'<LocationConstraint xmlns="http://s3.amazonaws.com/doc/2006-03-01/">'
+    b"%s</LocationConstraint>"
+)
+
+
+class S3StubHandler(BaseHTTPRequestHandler):
+    requests = 0
+    location = b""
+    objects: dict[str, bytes] = {}
+
+    def _respond(self, status: int, body: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:  # noqa: N802
+        type(self).requests += 1
+        url = urlsplit(self.path)
+        if "location" in url.query:
+            self._respond(200, LOCATION_RESPONSE % self.location, "application/xml")
+            return
+
+        data = self.objects.get(url.path)
+        if data is None:
+            self._respond(404, b"", "application/xml")
+            return
+
+        byte_range = self.headers.get("Range")
+        if byte_range:
+            start, end = byte_range.removeprefix("bytes=").split("-")
+            self._respond(
+                206, data[int(start) : int(end) + 1], "application/octet-stream"
+            )
+            return
+        self._respond(200, data, "application/octet-stream")
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        return None
+
+
+@contextmanager
+def run_s3_stub() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), S3StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
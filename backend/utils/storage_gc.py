@@ -0,0 +1,27 @@
+import argparse
+import asyncio
+
+from dataforce_studio.handlers.storage_gc import StorageGCHandler
+
+
+async def run(dry_run: bool) -> None:
+    report = await StorageGCHandler().run_garbage_collection(dry_run)
+    if report is None:
+        print("Storage garbage collection is already running")  # noqa: T201
+        return
+    print(report.model_dump_json(indent=2))  # noqa: T201
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Collect unreferenced storage")
+    parser.add_argument(
+        "--delete",
+        action="store_true",
+        help="delete orphaned objects and stale models instead of only reporting them",
+    )
+    args = parser.parse_args()
+    asyncio.run(run(not args.delete))
+
+
+if __name__ == "__main__":
+    main()
@@ -42,6 +42,10 @@ export const useModelUpload = () => {
       tags,
     }
     const response = await modelsStore.initiateCreateModel(payload, requestInfo)
+    if (!response.url) {
+      modelsStore.modelsList.push(response.model)
+      return
+    }
 
     await uploadToBucket(response, modelBuffer, file.name, name, description, tags, requestInfo)
 
@@ -1,5 +1,5 @@
 import type { AxiosInstance } from 'axios'
-import type { CreateModelResponse, MlModel, MlModelCreator, UpdateMlModelPayload } from './interfaces'
+import type { CreateModelResponse, MlModel, MlModelCreator, MlModelsPage, UpdateMlModelPayload } from './interfaces'
 
 export class MlModelsApi {
   private api: AxiosInstance
@@ -13,8 +13,8 @@ export class MlModelsApi {
     return responseData
   }
 
-  async getModelsList(organizationId: number, orbitId: number, collectionId: number) {
-    const { data: responseData } = await this.api.get<MlModel[]>(`/organizations/${organizationId}/orbits/${orbitId}/collections/${collectionId}/ml-models`)
+  async getModelsPage(organizationId: number, orbitId: number, collectionId: number, cursor: string | null = null) {
+    const { data: responseData } = await this.api.get<MlModelsPage>(`/organizations/${organizationId}/orbits/${orbitId}/collections/${collectionId}/ml-models/summaries`, { params: { cursor } })
     return responseData
   }
 
@@ -29,7 +29,7 @@ export class MlModelsApi {
   }
 
   async getModelDeleteUrl(organizationId: number, orbitId: number, collectionId: number, modelId: number) {
-    const { data: responseData } = await this.api.get<{ url: string }>(`/organizations/${organizationId}/orbits/${orbitId}/collections/${collectionId}/ml-models/${modelId}/delete-url`)
+    const { data: responseData } = await this.api.get<{ url: string | null }>(`/organizations/${organizationId}/orbits/${orbitId}/collections/${collectionId}/ml-models/${modelId}/delete-url`)
     return responseData
   }
 
@@ -3,6 +3,7 @@ import type { Manifest } from "@fnnx/common/dist/interfaces"
 export enum MlModelStatusEnum {
   pending_upload = 'pending_upload',
   uploaded = 'uploaded',
+  verifying = 'verifying',
   pending_deletion = 'pending_deletion',
   upload_failed = 'upload_failed',
   deletion_failed = 'deletion_failed',
@@ -39,6 +40,20 @@ export interface MlModel {
   updated_at: Date
 }
 
+export interface MlModelSummary {
+  id: number
+  collection_id: number
+  file_name: string
+  model_name: string
+  description: string
+  metrics: Record<string, object>
+  size: number
+  tags: string[]
+  status: MlModelStatusEnum
+  created_at: Date
+  updated_at: Date
+}
+
 export interface UpdateMlModelPayload {
   id: number
   file_name: string
@@ -48,7 +63,12 @@ export interface UpdateMlModelPayload {
   status: MlModelStatusEnum
 }
 
+export interface MlModelsPage {
+  items: MlModelSummary[]
+  cursor: string | null
+}
+
 export interface CreateModelResponse {
   model: MlModel
-  url: string
+  url: string | null
 }
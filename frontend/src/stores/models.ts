@@ -1,6 +1,6 @@
 import type {
-  MlModel,
   MlModelCreator,
+  MlModelSummary,
   UpdateMlModelPayload,
 } from '@/lib/api/orbit-ml-models/interfaces'
 import { defineStore } from 'pinia'
@@ -13,7 +13,12 @@ import { downloadFileFromBlob } from '@/helpers/helpers'
 export const useModelsStore = defineStore('models', () => {
   const route = useRoute()
 
-  const modelsList = ref<MlModel[]>([])
+  const modelsList = ref<MlModelSummary[]>([])
+  const modelsCursor = ref<string | null>(null)
+  const modelsListInfo = ref<{ organizationId: number, orbitId: number, collectionId: number } | null>(null)
+  const loadingMoreModels = ref(false)
+
+  const hasMoreModels = computed(() => !!modelsCursor.value)
 
   const requestInfo = computed(() => {
     if (typeof route.params.organizationId !== 'string') throw new Error('Current organization not found')
@@ -28,11 +33,34 @@ export const useModelsStore = defineStore('models', () => {
   })
 
   async function loadModelsList(organizationId?: number, orbitId?: number, collectionId?: number) {
-    modelsList.value = await dataforceApi.mlModels.getModelsList(
-      organizationId ?? requestInfo.value.organizationId,
-      orbitId ?? requestInfo.value.orbitId,
-      collectionId ?? requestInfo.value.collectionId,
-    )
+    const info = {
+      organizationId: organizationId ?? requestInfo.value.organizationId,
+      orbitId: orbitId ?? requestInfo.value.orbitId,
+      collectionId: collectionId ?? requestInfo.value.collectionId,
+    }
+    const page = await dataforceApi.mlModels.getModelsPage(info.organizationId, info.orbitId, info.collectionId)
+    modelsListInfo.value = info
+    modelsList.value = page.items
+    modelsCursor.value = page.cursor
+  }
+
+  async function loadMoreModels() {
+    const info = modelsListInfo.value
+    if (!info || !modelsCursor.value || loadingMoreModels.value) return
+    loadingMoreModels.value = true
+    try {
+      const page = await dataforceApi.mlModels.getModelsPage(
+        info.organizationId,
+        info.orbitId,
+        info.collectionId,
+        modelsCursor.value,
+      )
+      const loadedIds = new Set(modelsList.value.map((model) => model.id))
+      modelsList.value.push(...page.items.filter((model) => !loadedIds.has(model.id)))
+      modelsCursor.value = page.cursor
+    } finally {
+      loadingMoreModels.value = false
+    }
   }
 
   function initiateCreateModel(data: MlModelCreator, requestData?: typeof requestInfo.value) {
@@ -70,6 +98,8 @@ export const useModelsStore = defineStore('models', () => {
 
   function resetList() {
     modelsList.value = []
+    modelsCursor.value = null
+    modelsListInfo.value = null
   }
 
   async function deleteModels(modelsIds: number[]) {
@@ -96,7 +126,7 @@ export const useModelsStore = defineStore('models', () => {
       requestInfo.value.collectionId,
       modelId,
     )
-    await axios.delete(url)
+    if (url) await axios.delete(url)
     await dataforceApi.mlModels.confirmModelDelete(
       requestInfo.value.organizationId,
       requestInfo.value.orbitId,
@@ -119,9 +149,12 @@ export const useModelsStore = defineStore('models', () => {
 
   return {
     modelsList,
+    hasMoreModels,
+    loadingMoreModels,
     initiateCreateModel,
     confirmModelUpload,
     loadModelsList,
+    loadMoreModels,
     cancelModelUpload,
     resetList,
     deleteModels,